@@ -29,7 +29,9 @@ API_BASE = "http://localhost:8000"
 
 
 @app.command()
-def hello() -> None:
+def hello(
+    slow: bool = typer.Option(False, "--slow", help="Pause between sections"),
+) -> None:
     """
     🌟 First-time magical onboarding experience.
     
@@ -37,10 +39,11 @@ def hello() -> None:
     
     Example:
         neura hello
+        neura hello --slow
     """
     from neura.setup.wizard import run_onboarding
     
-    asyncio.run(run_onboarding())
+    asyncio.run(run_onboarding(pace=1.0 if slow else 0.0))
 
 
 # ============================================================================
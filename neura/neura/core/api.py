@@ -11,12 +11,13 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from neura import __version__
 from neura.core.config import get_settings
 from neura.core.events import get_event_bus
 from neura.core.exceptions import NeuraError
+from neura.core.why_journal import start_journal_writer, stop_journal_writer
 
 # Configure logging
 logging.basicConfig(
@@ -42,11 +43,30 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     event_bus = get_event_bus()
     await event_bus.start()
 
+    # Start WHY Journal background writer
+    await start_journal_writer()
+
+    # Start the OPA server off the request path
+    from neura.policy.engine import get_policy_engine
+
+    await get_policy_engine().start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down NeuraCore...")
     await event_bus.stop()
+    await stop_journal_writer()
+
+    # Stop the OPA server, if the policy engine started one
+    from neura.policy.engine import close_policy_engine
+
+    await close_policy_engine()
+
+    # Close the NLP parser's keep-alive client, if one was opened
+    from neura.voice.nlp import close_nlp_parser
+
+    await close_nlp_parser()
 
 
 # Create FastAPI app
@@ -55,6 +75,7 @@ app = FastAPI(
     description="Local-first Cognitive Operating System",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware (for local development)
@@ -192,7 +213,7 @@ from neura.cortex import router as cortex_router
 from neura.memory import router as memory_router
 from neura.motor.router import router as motor_router
 from neura.policy.router import router as policy_router
-from neura.vault import router as vault_router
+from neura.vault.router import router as vault_router
 from neura.voice.router import router as voice_router
 
 app.include_router(cortex_router, prefix="/api/cortex", tags=["cortex"])
@@ -20,7 +20,7 @@ class ResultStatus(str, Enum):
     FAILURE = "failure"
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(Generic[T]):
     """
     Result type for operations that can succeed or fail.
@@ -73,6 +73,11 @@ class Result(Generic[T]):
         return self.data  # type: ignore
 
 
+# Shared Result.success(True) for hot paths that only report success.
+# Callers must treat it as read-only.
+RESULT_TRUE: Result[bool] = Result.success(True)
+
+
 @dataclass
 class Event:
     """
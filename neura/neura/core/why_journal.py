@@ -4,11 +4,20 @@ WHY Journal - Audit trail query and analysis.
 Provides utilities to query and analyze the WHY Journal for audit purposes.
 """
 
+import asyncio
+import atexit
+import itertools
 import json
 import logging
-from datetime import datetime, timedelta
+import os
+import secrets
+import threading
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
 
+import orjson
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -312,6 +321,148 @@ def get_why_journal(journal_path: str = "data/why_journal.jsonl") -> WHYJournalQ
     return _why_journal
 
 
+# Background writer state (set while the API is running)
+_JOURNAL_PATH = Path("data/why_journal.jsonl")
+_JOURNAL_BATCH_SIZE = 64
+_JOURNAL_FSYNC_INTERVAL = 1.0  # seconds between fsyncs from the writer
+# None in the queue tells the writer to finish its batch and exit
+_journal_queue: asyncio.Queue[dict | None] | None = None
+_journal_writer_task: asyncio.Task | None = None
+
+# Journal file kept open for the process lifetime (reopened if the path changes)
+_journal_file: BinaryIO | None = None
+_journal_file_path: Path | None = None
+_journal_file_lock = threading.Lock()
+
+
+# Trace ids only need to be unique within the journal: a per-process
+# random prefix plus a counter avoids an urandom read per entry.
+_TRACE_PREFIX = secrets.token_hex(8)
+_TRACE_SEQ = itertools.count()
+
+
+def new_trace_id() -> str:
+    """
+    Create a process-unique trace id.
+
+    Returns:
+        str: "<process prefix>-<hex counter>"
+    """
+    return f"{_TRACE_PREFIX}-{next(_TRACE_SEQ):x}"
+
+
+def _format_entry(entry: dict) -> bytes:
+    """Serialize an entry as a JSON line, with its epoch timestamp as naive-UTC ISO."""
+    timestamp = datetime.fromtimestamp(entry["timestamp"], UTC).replace(tzinfo=None)
+    return orjson.dumps({**entry, "timestamp": timestamp}, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _get_journal_file() -> BinaryIO:
+    """Return the open journal file, opening it on first use."""
+    global _journal_file, _journal_file_path
+    if _journal_file is None or _journal_file_path != _JOURNAL_PATH:
+        _close_journal_file()
+        _JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _journal_file = open(_JOURNAL_PATH, "ab")
+        _journal_file_path = _JOURNAL_PATH
+    return _journal_file
+
+
+def _close_journal_file() -> None:
+    """Close the journal file if it is open."""
+    global _journal_file, _journal_file_path
+    if _journal_file is not None:
+        _journal_file.close()
+        _journal_file = None
+        _journal_file_path = None
+
+
+atexit.register(_close_journal_file)
+
+
+def _write_entries(entries: list[dict], sync: bool = False) -> None:
+    """Append a batch of entries to the journal with a single write."""
+    try:
+        with _journal_file_lock:
+            f = _get_journal_file()
+            f.write(b"".join(_format_entry(entry) for entry in entries))
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+    except Exception as e:
+        logger.error(f"Failed to write WHY Journal: {e}")
+
+
+async def _journal_writer(queue: asyncio.Queue[dict | None]) -> None:
+    """
+    Drain queued entries and write them in batches, off the event loop.
+
+    Returns after writing (and fsyncing) everything queued before a None.
+    """
+    last_sync = time.monotonic()
+    while True:
+        batch = []
+        entry = await queue.get()
+        while entry is not None:
+            batch.append(entry)
+            if len(batch) >= _JOURNAL_BATCH_SIZE:
+                break
+            try:
+                entry = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        stopping = entry is None
+
+        # fsync at most once per interval instead of on every batch
+        now = time.monotonic()
+        sync = stopping or now - last_sync >= _JOURNAL_FSYNC_INTERVAL
+        if sync:
+            last_sync = now
+        if batch:
+            await asyncio.to_thread(_write_entries, batch, sync)
+        if stopping:
+            return
+
+
+async def start_journal_writer() -> None:
+    """Start the background WHY Journal writer (log_action then only enqueues)."""
+    global _journal_queue, _journal_writer_task
+    if _journal_writer_task is not None:
+        return
+
+    _journal_queue = asyncio.Queue()
+    _journal_writer_task = asyncio.create_task(_journal_writer(_journal_queue))
+    logger.info("WHY Journal writer started")
+
+
+async def stop_journal_writer() -> None:
+    """
+    Stop the background writer and synchronously flush pending entries.
+
+    The writer is asked to stop rather than cancelled, so a batch already
+    handed to a worker thread is written before anything queued after it.
+    """
+    global _journal_queue, _journal_writer_task
+    if _journal_writer_task is None:
+        return
+
+    _journal_queue.put_nowait(None)
+    await _journal_writer_task
+
+    # Entries logged while the writer was finishing
+    pending = []
+    while not _journal_queue.empty():
+        pending.append(_journal_queue.get_nowait())
+    if pending:
+        _write_entries(pending, sync=True)
+    with _journal_file_lock:
+        _close_journal_file()
+
+    _journal_queue = None
+    _journal_writer_task = None
+    logger.info("WHY Journal writer stopped")
+
+
 def log_action(
     actor: str,
     action: str,
@@ -324,6 +475,9 @@ def log_action(
     """
     Log an action to the WHY Journal.
 
+    Entries are queued for the background writer when it is running,
+    and written synchronously otherwise.
+
     Args:
         actor: Who performed the action (e.g., "motor", "vault")
         action: What action was performed
@@ -333,18 +487,12 @@ def log_action(
         result: Result of action ("SUCCESS", "FAILURE", "PENDING", etc.)
         trace_id: Trace ID for correlation
     """
-    import uuid
-
     if not trace_id:
-        trace_id = str(uuid.uuid4())
-
-    # Ensure data directory exists
-    journal_path = Path("data/why_journal.jsonl")
-    journal_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_id = new_trace_id()
 
-    # Create entry
+    # Create entry (timestamp is formatted when the entry is written)
     entry = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": time.time(),
         "actor": actor,
         "action": action,
         "input_summary": input_summary[:200],  # Limit to 200 chars
@@ -354,11 +502,9 @@ def log_action(
         "trace_id": trace_id,
     }
 
-    # Append to journal
-    try:
-        with open(journal_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+    if _journal_queue is not None:
+        _journal_queue.put_nowait(entry)
+    else:
+        _write_entries([entry])
 
-        logger.debug(f"WHY: {actor}.{action} -> {result}")
-    except Exception as e:
-        logger.error(f"Failed to write WHY Journal: {e}")
+    logger.debug(f"WHY: {actor}.{action} -> {result}")
@@ -321,7 +321,7 @@ class FlowREPL:
                 # Record audio chunk
                 self.ui.console.print("[dim]🎧 Listening...[/dim]", end="\r")
 
-                audio_result = recorder.record(duration=5.0)
+                audio_result = await recorder.record_async(duration=5.0)
 
                 if audio_result.is_failure():
                     logger.error(f"Recording failed: {audio_result.error}")
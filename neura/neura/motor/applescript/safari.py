@@ -4,10 +4,27 @@ Safari.app AppleScript templates.
 Web browsing automation for macOS Safari.
 """
 
+from functools import lru_cache
+
+# Generated scripts are memoized per distinct argument tuple
+_SCRIPT_CACHE_SIZE = 512
+
+# Frozen (prefix, mid, suffix) around the escaped URL for the current-tab fast path
+_OPEN_URL_CURRENT_TAB_TEMPLATE = (
+    '\ntell application "Safari"\n    activate\n    set URL of front document to "',
+    '"\n    return "✅ Opened: ',
+    '"\nend tell\n',
+)
+
+# One-pass escape for inline JavaScript: quote-escape and flatten line breaks
+_JS_ESCAPE = str.maketrans({'"': '\\"', "\n": " ", "\r": " "})
+
 
 class SafariScripts:
     """AppleScript templates for Safari.app operations."""
 
+    __slots__ = ()
+
     @staticmethod
     def open_url(url: str, new_tab: bool = False) -> str:
         """
@@ -17,13 +34,44 @@ class SafariScripts:
             url: URL to open
             new_tab: Open in new tab (default: False, uses current tab)
 
+        Returns:
+            str: AppleScript code
+        """
+        return (
+            SafariScripts.open_url_new_tab if new_tab else SafariScripts.open_url_current_tab
+        )(url)
+
+    @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
+    def open_url_current_tab(url: str) -> str:
+        """
+        Open a URL in Safari's current tab.
+
+        Args:
+            url: URL to open
+
         Returns:
             str: AppleScript code
         """
         url_escaped = url.replace('"', '\\"')
+        prefix, mid, suffix = _OPEN_URL_CURRENT_TAB_TEMPLATE
+        return "".join((prefix, url_escaped, mid, url_escaped, suffix))
 
-        if new_tab:
-            return f"""
+    @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
+    def open_url_new_tab(url: str) -> str:
+        """
+        Open a URL in a new Safari tab.
+
+        Args:
+            url: URL to open
+
+        Returns:
+            str: AppleScript code
+        """
+        url_escaped = url.replace('"', '\\"')
+
+        return f"""
 tell application "Safari"
     activate
     tell window 1
@@ -31,14 +79,6 @@ tell application "Safari"
     end tell
     return "✅ Opened in new tab: {url_escaped}"
 end tell
-"""
-        else:
-            return f"""
-tell application "Safari"
-    activate
-    set URL of front document to "{url_escaped}"
-    return "✅ Opened: {url_escaped}"
-end tell
 """
 
     @staticmethod
@@ -70,6 +110,7 @@ end tell
 """
 
     @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
     def search_google(query: str) -> str:
         """
         Search on Google.
@@ -102,8 +143,8 @@ end tell
         Returns:
             str: AppleScript code
         """
-        # Escape quotes in JavaScript
-        js_escaped = js_code.replace('"', '\\"').replace("\\n", " ")
+        # Escape quotes and flatten newlines in JavaScript
+        js_escaped = js_code.translate(_JS_ESCAPE)
 
         return f"""
 tell application "Safari"
@@ -213,6 +254,7 @@ end tell
 """
 
     @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
     def search_wikipedia(query: str) -> str:
         """
         Search Wikipedia.
@@ -234,6 +276,7 @@ end tell
 """
 
     @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
     def open_youtube_search(query: str) -> str:
         """
         Search YouTube.
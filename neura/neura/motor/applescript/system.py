@@ -4,10 +4,17 @@ System-level AppleScript templates.
 System control and information for macOS.
 """
 
+from functools import lru_cache
+
+# Generated scripts are memoized per distinct argument tuple
+_SCRIPT_CACHE_SIZE = 512
+
 
 class SystemScripts:
     """AppleScript templates for system-level operations."""
 
+    __slots__ = ()
+
     @staticmethod
     def get_volume() -> str:
         """
@@ -79,8 +86,11 @@ return "🔊 Audio unmuted"
 try
     set batteryInfo to do shell script "pmset -g batt"
 
-    -- Extract percentage
-    set batteryLevel to do shell script "pmset -g batt | grep -Eo '[0-9]+%' | head -1"
+    -- Extract percentage from the cached output (last word before the first "%")
+    set savedDelimiters to AppleScript's text item delimiters
+    set AppleScript's text item delimiters to "%"
+    set batteryLevel to (last word of text item 1 of batteryInfo) & "%"
+    set AppleScript's text item delimiters to savedDelimiters
 
     -- Check if charging
     if batteryInfo contains "AC Power" then
@@ -152,23 +162,17 @@ return "📅 " & (now as string)
         return """
 set output to "💻 SYSTEM INFO:\\n\\n"
 
--- macOS version
-set osVersion to do shell script "sw_vers -productVersion"
-set output to output & "macOS: " & osVersion & "\\n"
+-- One shell: version, computer name, uptime, memory (one line each)
+set infoLines to paragraphs of (do shell script "sw_vers -productVersion; scutil --get ComputerName; uptime | awk '{print $3,$4}' | sed 's/,//'; top -l 1 | grep PhysMem | awk '{print $2}'")
 
--- Computer name
-set compName to do shell script "scutil --get ComputerName"
-set output to output & "Computer: " & compName & "\\n"
-
--- Uptime
-set uptime to do shell script "uptime | awk '{print $3,$4}' | sed 's/,//'"
-set output to output & "Uptime: " & uptime & "\\n"
+set output to output & "macOS: " & (item 1 of infoLines) & "\\n"
+set output to output & "Computer: " & (item 2 of infoLines) & "\\n"
+set output to output & "Uptime: " & (item 3 of infoLines) & "\\n"
 
 -- Memory
-try
-    set memInfo to do shell script "top -l 1 | grep PhysMem | awk '{print $2}'"
-    set output to output & "Memory Used: " & memInfo & "\\n"
-end try
+if (count of infoLines) > 3 and (item 4 of infoLines) is not "" then
+    set output to output & "Memory Used: " & (item 4 of infoLines) & "\\n"
+end if
 
 return output
 """
@@ -218,7 +222,10 @@ try
     if wifiStatus contains "You are not associated" then
         return "📶 WiFi: Not connected"
     else
-        set networkName to do shell script "networksetup -getairportnetwork en0 | cut -d ':' -f 2"
+        set savedDelimiters to AppleScript's text item delimiters
+        set AppleScript's text item delimiters to ":"
+        set networkName to text item 2 of wifiStatus
+        set AppleScript's text item delimiters to savedDelimiters
         return "📶 WiFi: Connected to" & networkName
     end if
 on error
@@ -263,6 +270,7 @@ return "📋 Clipboard: " & clipboardContent
 """
 
     @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
     def set_clipboard(text: str) -> str:
         """
         Set clipboard content.
@@ -316,6 +324,7 @@ return "🔄 Computer restarting..."
 """
 
     @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
     def show_notification(title: str, message: str, sound: bool = True) -> str:
         """
         Show macOS notification.
@@ -339,6 +348,7 @@ return "🔔 Notification shown: {title_escaped}"
 """
 
     @staticmethod
+    @lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
     def speak_text(text: str, voice: str = "Samantha") -> str:
         """
         Make macOS speak text.
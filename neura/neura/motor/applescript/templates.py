@@ -4,10 +4,37 @@ Generic AppleScript templates and utilities.
 Reusable script patterns and helpers.
 """
 
+from functools import lru_cache
+from itertools import combinations
+
+# Precomputed `buttons` clauses for the common display_dialog cases
+_DIALOG_NO_BUTTONS = ""
+_DIALOG_OK = 'buttons {"OK"}'
+
+
+@lru_cache(maxsize=128)
+def _dialog_buttons_param(buttons: tuple[str, ...]) -> str:
+    """Build (and memoize) the `buttons {...}` clause for a button tuple."""
+    buttons_str = ", ".join(['"' + b.replace('"', '\\"') + '"' for b in buttons])
+    return f"buttons {{{buttons_str}}}"
+
+
+# All 16 `using {...}` clauses for the standard modifier keys, keyed by frozenset
+_MODIFIER_KEYS = ("command", "control", "option", "shift")
+_MODIFIER_CLAUSES = {
+    frozenset(subset): (
+        "using {" + ", ".join(f"{mod} down" for mod in subset) + "}" if subset else ""
+    )
+    for size in range(len(_MODIFIER_KEYS) + 1)
+    for subset in combinations(_MODIFIER_KEYS, size)
+}
+
 
 class AppleScriptTemplates:
     """Generic AppleScript templates."""
 
+    __slots__ = ()
+
     @staticmethod
     def tell_app(app_name: str, commands: str) -> str:
         """
@@ -153,14 +180,14 @@ return shellOutput
 """
 
     @staticmethod
-    def display_dialog(message: str, title: str = "Neura", buttons: list = None) -> str:
+    def display_dialog(message: str, title: str = "Neura", buttons: list[str] | None = None) -> str:
         """
         Display dialog box.
 
         Args:
             message: Dialog message
             title: Dialog title (default: "Neura")
-            buttons: Button labels (default: ["OK"])
+            buttons: Button labels (default: AppleScript's own buttons)
 
         Returns:
             str: AppleScript code
@@ -168,16 +195,26 @@ return shellOutput
         message_escaped = message.replace('"', '\\"')
         title_escaped = title.replace('"', '\\"')
 
-        if buttons:
-            buttons_str = ", ".join([f'\\"{b}\\"' for b in buttons])
-            buttons_param = f"buttons {{{buttons_str}}}"
+        if not buttons:
+            buttons_param = _DIALOG_NO_BUTTONS
         else:
-            buttons_param = ""
-
-        return f"""
-display dialog "{message_escaped}" with title "{title_escaped}" {buttons_param}
-return "Dialog shown"
-"""
+            buttons_key = tuple(buttons)
+            if buttons_key == ("OK",):
+                buttons_param = _DIALOG_OK
+            else:
+                buttons_param = _dialog_buttons_param(buttons_key)
+
+        return "".join(
+            (
+                '\ndisplay dialog "',
+                message_escaped,
+                '" with title "',
+                title_escaped,
+                '" ',
+                buttons_param,
+                '\nreturn "Dialog shown"\n',
+            )
+        )
 
     @staticmethod
     def choose_from_list(prompt: str, items: list, title: str = "Neura") -> str:
@@ -248,7 +285,7 @@ end tell
 """
 
     @staticmethod
-    def keystroke(keys: str, modifiers: list = None) -> str:
+    def keystroke(keys: str, modifiers: list[str] | None = None) -> str:
         """
         Simulate keystroke.
 
@@ -261,11 +298,11 @@ end tell
         """
         keys_escaped = keys.replace('"', '\\"')
 
-        if modifiers:
+        using_clause = _MODIFIER_CLAUSES.get(frozenset(modifiers or ()))
+        if using_clause is None:
+            # Non-standard modifier names: build the clause as given
             modifiers_str = ", ".join([f"{mod} down" for mod in modifiers])
             using_clause = f"using {{{modifiers_str}}}"
-        else:
-            using_clause = ""
 
         return f"""
 tell application "System Events"
@@ -5,12 +5,17 @@ Supports macOS (AppleScript + PyAutoGUI) and Linux (xdotool + PyAutoGUI).
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import logging
 import os
 import platform
-import subprocess
+import secrets
+import shutil
+import threading
 import time
-import uuid
+from collections.abc import Awaitable, Callable, ItemsView, Iterator, KeysView, ValuesView
+from typing import Any
 
 import pyautogui
 
@@ -22,7 +27,125 @@ logger = logging.getLogger(__name__)
 
 # PyAutoGUI safety settings
 pyautogui.FAILSAFE = True  # Move mouse to corner (0,0) to abort
-pyautogui.PAUSE = 0.1  # 100ms pause between actions
+
+# Unconfirmed critical actions expire after this many seconds
+PENDING_CONFIRMATION_TTL = 300.0
+PENDING_CONFIRMATION_MAXSIZE = 1024
+
+# wmctrl path, looked up once; without it Linux windows can't be polled
+_WMCTRL = shutil.which("wmctrl")
+
+
+class _PendingConfirmations(dict[str, MotorAction]):
+    """
+    Dict of pending confirmations with a TTL and a size bound.
+
+    Entries are kept in insertion order, so expired or overflowing
+    entries are always at the front and are evicted on every access.
+    Every dict method that reads or writes entries is overridden, so
+    none of them sees an expired entry or leaves the expiries stale.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = PENDING_CONFIRMATION_MAXSIZE,
+        ttl: float = PENDING_CONFIRMATION_TTL,
+    ) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._expires: dict[str, float] = {}
+
+    def _expire(self) -> None:
+        # Only the front can be stale, so stop at the first live entry
+        now = time.monotonic()
+        expires = self._expires
+        while expires:
+            key, expires_at = next(iter(expires.items()))
+            if expires_at > now and len(expires) <= self.maxsize:
+                break
+            del expires[key]
+            super().pop(key, None)
+
+    def __setitem__(self, key: str, value: MotorAction) -> None:
+        self._expires.pop(key, None)
+        self._expires[key] = time.monotonic() + self.ttl
+        super().__setitem__(key, value)
+        self._expire()
+
+    def __delitem__(self, key: str) -> None:
+        self._expire()
+        super().__delitem__(key)
+        del self._expires[key]
+
+    def __contains__(self, key: object) -> bool:
+        self._expire()
+        return super().__contains__(key)
+
+    def __len__(self) -> int:
+        self._expire()
+        return super().__len__()
+
+    def __getitem__(self, key: str) -> MotorAction:
+        self._expire()
+        return super().__getitem__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        self._expire()
+        return super().__iter__()
+
+    def get(self, key: str, default: MotorAction | None = None) -> MotorAction | None:
+        self._expire()
+        return super().get(key, default)
+
+    def keys(self) -> KeysView[str]:
+        self._expire()
+        return super().keys()
+
+    def values(self) -> ValuesView[MotorAction]:
+        self._expire()
+        return super().values()
+
+    def items(self) -> ItemsView[str, MotorAction]:
+        self._expire()
+        return super().items()
+
+    def pop(self, key: str, *default: MotorAction | None) -> MotorAction | None:
+        self._expire()
+        self._expires.pop(key, None)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, MotorAction]:
+        self._expire()
+        key, value = super().popitem()
+        del self._expires[key]
+        return key, value
+
+    def setdefault(self, key: str, default: MotorAction) -> MotorAction:
+        if key in self:
+            return super().__getitem__(key)
+        self[key] = default
+        return default
+
+    def update(self, *args: Any, **kwargs: MotorAction) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> "_PendingConfirmations":
+        self.update(other)
+        return self
+
+    def __or__(self, other: Any) -> dict[str, MotorAction]:
+        return self.copy() | other
+
+    def clear(self) -> None:
+        super().clear()
+        self._expires.clear()
+
+    def copy(self) -> dict[str, MotorAction]:
+        """Plain dict of the live entries."""
+        self._expire()
+        return dict(super().items())
 
 
 class MotorExecutor:
@@ -36,21 +159,37 @@ class MotorExecutor:
     - WHY Journal logging
     """
 
-    def __init__(self, dry_run: bool = False) -> None:
+    def __init__(
+        self, dry_run: bool = False, type_interval: float = 0.0, action_pause: float = 0.0
+    ) -> None:
         """
         Initialize executor.
 
         Args:
             dry_run: If True, log actions without executing
+            type_interval: Seconds between typed characters (0 = type at once)
+            action_pause: Seconds PyAutoGUI pauses after each call
         """
         self.dry_run = dry_run or os.getenv("MOTOR_DRY_RUN", "").lower() == "true"
-        self.pending_confirmations: dict[str, MotorAction] = {}
+        self.type_interval = type_interval
+        self.action_pause = action_pause
+        pyautogui.PAUSE = action_pause
+        self.pending_confirmations = _PendingConfirmations()
+        # Single worker so input events are never interleaved across threads
+        self._input_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="motor-input"
+        )
+        self._handlers: dict[ActionType, Callable[[MotorAction], Awaitable[None]]] = {
+            ActionType.OPEN_APP: self._execute_open_app,
+            ActionType.TYPE_TEXT: self._execute_type_text,
+            ActionType.CLICK: self._execute_click,
+        }
 
         if self.dry_run:
             logger.info("Motor running in DRY-RUN mode")
 
     async def execute(
-        self, action: MotorAction, user_approved: bool = False
+        self, action: MotorAction, user_approved: bool = False, trace_id: str | None = None
     ) -> Result[MotorResult]:
         """
         Execute motor action.
@@ -58,12 +197,13 @@ class MotorExecutor:
         Args:
             action: Action to execute
             user_approved: Whether user has approved (for critical actions)
+            trace_id: Trace ID to use (generated if None)
 
         Returns:
             Result containing MotorResult
         """
-        trace_id = str(uuid.uuid4())
-        start_time = time.time()
+        trace_id = trace_id or secrets.token_urlsafe(12)
+        start_ns = time.monotonic_ns()
 
         try:
             # Log request
@@ -131,16 +271,12 @@ class MotorExecutor:
                 action.os = self._detect_os()
 
             # Execute action based on type
-            if action.action == ActionType.OPEN_APP:
-                await self._execute_open_app(action)
-            elif action.action == ActionType.TYPE_TEXT:
-                await self._execute_type_text(action)
-            elif action.action == ActionType.CLICK:
-                await self._execute_click(action)
-            else:
+            handler = self._handlers.get(action.action)
+            if handler is None:
                 raise ValueError(f"Unknown action type: {action.action}")
+            await handler(action)
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1e6
 
             # Log success
             log_action(
@@ -181,12 +317,44 @@ class MotorExecutor:
                 MotorResult(
                     status=MotorStatus.FAILURE,
                     reason=f"Execution error: {str(e)}",
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=(time.monotonic_ns() - start_ns) / 1e6,
                     trace_id=trace_id,
                     action=action,
                 )
             )
 
+    async def execute_batch(
+        self, actions: list[MotorAction], user_approved: bool = False
+    ) -> Result[list[MotorResult]]:
+        """
+        Execute actions in order under one batch trace.
+
+        Stops at the first action that is not executed successfully
+        (blocked for confirmation or failed).
+
+        Args:
+            actions: Actions to execute, in order
+            user_approved: Whether user has approved (for critical actions)
+
+        Returns:
+            Result containing one MotorResult per attempted action
+        """
+        batch_trace_id = secrets.token_urlsafe(12)
+        results: list[MotorResult] = []
+
+        for index, action in enumerate(actions):
+            result = await self.execute(
+                action, user_approved=user_approved, trace_id=f"{batch_trace_id}-{index}"
+            )
+            if not result.is_success():
+                return Result.failure(result.error)
+
+            results.append(result.data)
+            if result.data.status != MotorStatus.SUCCESS:
+                break
+
+        return Result.success(results)
+
     async def confirm(self, trace_id: str) -> Result[MotorResult]:
         """
         Confirm and execute a pending critical action.
@@ -225,35 +393,76 @@ class MotorExecutor:
         if action.os == OSType.MAC:
             # macOS: Use AppleScript
             script = f'tell application "{action.app}" to activate'
-            result = subprocess.run(["osascript", "-e", script], capture_output=True, timeout=10)
+            returncode, _, stderr = await _run_command("osascript", "-e", script)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to open {action.app}: {result.stderr.decode()}")
+            if returncode != 0:
+                raise RuntimeError(f"Failed to open {action.app}: {stderr.decode()}")
 
         else:
             # Linux: Try xdg-open first, then wmctrl
             try:
-                subprocess.run(
-                    ["xdg-open", action.app], capture_output=True, timeout=10, check=True
-                )
-            except (FileNotFoundError, subprocess.CalledProcessError):
-                # Try wmctrl as fallback
-                subprocess.run(
-                    ["wmctrl", "-a", action.app], capture_output=True, timeout=10, check=True
-                )
+                returncode, _, _ = await _run_command("xdg-open", action.app)
+            except FileNotFoundError:
+                returncode = None
 
-        # Wait for app to open
-        await asyncio.sleep(0.5)
+            if returncode != 0:
+                # Try wmctrl as fallback
+                returncode, _, stderr = await _run_command("wmctrl", "-a", action.app)
+                if returncode != 0:
+                    raise RuntimeError(f"Failed to open {action.app}: {stderr.decode()}")
+
+        # Wait for app to open (poll instead of a fixed sleep, capped at 500ms)
+        if action.os == OSType.MAC or _WMCTRL is not None:
+            deadline = time.monotonic() + 0.5
+            while time.monotonic() < deadline:
+                if await self._app_is_frontmost(action):
+                    break
+                await asyncio.sleep(0.02)
 
         logger.info(f"Opened app: {action.app}")
 
+    async def _app_is_frontmost(self, action: MotorAction) -> bool:
+        """Check whether the app has a window up (frontmost on macOS)."""
+        try:
+            if action.os == OSType.MAC:
+                returncode, stdout, _ = await _run_command(
+                    "osascript",
+                    "-e",
+                    'tell application "System Events" to get name of first application '
+                    "process whose frontmost is true",
+                    timeout=0.5,
+                )
+                return returncode == 0 and stdout.decode().strip() == action.app
+
+            if _WMCTRL is None:
+                return False
+
+            # Columns: window id, desktop, WM_CLASS (instance.class), host, title
+            returncode, stdout, _ = await _run_command(_WMCTRL, "-lx", timeout=0.5)
+            if returncode != 0:
+                return False
+            app = action.app.lower()
+            for line in stdout.decode().splitlines():
+                columns = line.split(None, 3)
+                if len(columns) < 3:
+                    continue
+                instance, _, window_class = columns[2].lower().partition(".")
+                if app in (instance, window_class):
+                    return True
+            return False
+        except (OSError, asyncio.TimeoutError):
+            return False
+
     async def _execute_type_text(self, action: MotorAction) -> None:
         """Execute type_text action."""
         if not action.text:
             raise ValueError("text is required for type_text action")
 
-        # Use pyautogui to type
-        pyautogui.write(action.text, interval=0.05)
+        # Use pyautogui to type (off the event loop)
+        await asyncio.get_running_loop().run_in_executor(
+            self._input_executor,
+            functools.partial(pyautogui.write, action.text, interval=self.type_interval),
+        )
 
         logger.info(f"Typed {len(action.text)} characters")
 
@@ -262,19 +471,52 @@ class MotorExecutor:
         if action.x is None or action.y is None:
             raise ValueError("x and y coordinates required for click action")
 
-        # Use pyautogui to click
-        pyautogui.click(action.x, action.y)
+        # Use pyautogui to click (off the event loop)
+        await asyncio.get_running_loop().run_in_executor(
+            self._input_executor, pyautogui.click, action.x, action.y
+        )
 
         logger.info(f"Clicked at ({action.x}, {action.y})")
 
 
+async def _run_command(*argv: str, timeout: float = 10) -> tuple[int, bytes, bytes]:
+    """
+    Run a helper command without blocking the event loop.
+
+    Args:
+        argv: Program and arguments
+        timeout: Seconds before the process is killed
+
+    Returns:
+        Tuple of (return code, stdout bytes, stderr bytes)
+
+    Raises:
+        FileNotFoundError: If the program is not installed
+        asyncio.TimeoutError: If the process exceeds the timeout
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout, stderr
+
+
 # Singleton
 _motor_executor: MotorExecutor | None = None
+_motor_lock = threading.Lock()
 
 
 def get_motor_executor() -> MotorExecutor:
-    """Get or create MotorExecutor singleton."""
+    """Get or create MotorExecutor singleton (thread-safe, lock-free once created)."""
     global _motor_executor
-    if _motor_executor is None:
-        _motor_executor = MotorExecutor()
+    if _motor_executor is not None:
+        return _motor_executor
+    with _motor_lock:
+        if _motor_executor is None:
+            _motor_executor = MotorExecutor()
     return _motor_executor
@@ -16,7 +16,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/execute", response_model=MotorResult)
+@router.post(
+    "/execute",
+    response_model=MotorResult,
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
 async def execute_action(action: MotorAction) -> dict:
     """
     Execute a motor action.
@@ -95,7 +100,86 @@ async def execute_action(action: MotorAction) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/confirm/{trace_id}", response_model=MotorResult)
+@router.post(
+    "/execute_batch",
+    response_model=list[MotorResult],
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
+async def execute_batch(actions: list[MotorAction]) -> list[MotorResult]:
+    """
+    Execute a sequence of motor actions.
+
+    Runs one policy evaluation for the whole batch, then executes the
+    actions in order, stopping at the first one that does not succeed.
+
+    Args:
+        actions: Motor actions to execute, in order
+
+    Returns:
+        One MotorResult per attempted action
+
+    Raises:
+        HTTPException: 400 if empty, 403 if blocked by policy, 500 if execution fails
+
+    Example:
+        ```bash
+        curl -X POST http://localhost:8000/api/motor/execute_batch \
+          -H "Content-Type: application/json" \
+          -d '[
+            {"app": "Notes", "action": "open_app"},
+            {"app": "Notes", "action": "type_text", "text": "Hello from Neura"}
+          ]'
+        ```
+    """
+    if not actions:
+        raise HTTPException(status_code=400, detail="No actions provided")
+
+    try:
+        # 1. Validate the whole batch with one policy query
+        policy = get_policy_engine()
+        policy_result = await policy.validate_batch(actions)
+
+        if not policy_result.is_success():
+            logger.error(f"Policy validation failed: {policy_result.error}")
+            raise HTTPException(status_code=500, detail=f"Policy error: {policy_result.error}")
+
+        decision = policy_result.data
+
+        if not decision.allowed:
+            logger.warning(f"Batch blocked by policy: {decision.reason}")
+            raise HTTPException(
+                status_code=403,
+                detail={
+                    "error": "Action blocked by policy",
+                    "reason": decision.reason,
+                    "violations": decision.violations,
+                },
+            )
+
+        # 2. Execute in order
+        executor = get_motor_executor()
+        exec_result = await executor.execute_batch(actions, user_approved=False)
+
+        if not exec_result.is_success():
+            logger.error(f"Batch execution failed: {exec_result.error}")
+            raise HTTPException(status_code=500, detail=exec_result.error)
+
+        return exec_result.data
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/confirm/{trace_id}",
+    response_model=MotorResult,
+    response_model_exclude_unset=True,
+    response_model_exclude_none=True,
+)
 async def confirm_action(trace_id: str) -> dict:
     """
     Confirm and execute a critical action.
@@ -4,10 +4,30 @@ Motor types - Pydantic models for local automation.
 Defines actions, results, and validation rules.
 """
 
+import re
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Text patterns blocked in every motor action (kept in sync with motor_safe_actions.rego)
+BLOCKED_PATTERNS = ("rm -rf", "curl | bash", "sudo ", "DROP TABLE", "/etc/", "/System/")
+
+# Single-pass matcher over all blocked patterns
+_BLOCKED_RE = re.compile("|".join(re.escape(pattern) for pattern in BLOCKED_PATTERNS))
+
+
+def find_blocked_patterns(text: str) -> list[str]:
+    """
+    Find blocked patterns in text with one scan.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        Blocked patterns found, in order of first occurrence
+    """
+    return list(dict.fromkeys(_BLOCKED_RE.findall(text)))
 
 
 class ActionType(str, Enum):
@@ -58,10 +78,9 @@ class MotorAction(BaseModel):
             return v
 
         # Check for blocked patterns
-        blocked = ["rm -rf", "curl | bash", "sudo ", "DROP TABLE", "/etc/", "/System/"]
-        for pattern in blocked:
-            if pattern in v:
-                raise ValueError(f"Text contains blocked pattern: {pattern}")
+        match = _BLOCKED_RE.search(v)
+        if match:
+            raise ValueError(f"Text contains blocked pattern: {match.group()}")
 
         return v
 
@@ -106,11 +125,10 @@ class MotorResult(BaseModel):
         action: Original action that was executed
     """
 
+    model_config = ConfigDict(use_enum_values=True)
+
     status: MotorStatus = Field(..., description="Execution status")
     reason: str = Field(..., description="Status reason")
     duration_ms: float = Field(..., description="Duration in ms")
     trace_id: str = Field(..., description="Trace ID")
     action: MotorAction | None = Field(None, description="Original action")
-
-    class Config:
-        use_enum_values = True
@@ -1,22 +1,36 @@
 """
 Policy Engine - OPA-based rule evaluation.
 
-Uses subprocess to call `opa eval` for policy decisions.
+Runs a long-lived `opa run --server` on a free loopback port and queries it
+over HTTP for policy decisions, using `opa eval` per call if the server
+cannot be started.
 Falls back to simple Python rules if OPA not available.
 """
 
-import json
+import asyncio
+import atexit
 import logging
+import secrets
+import socket
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any
 
+import httpx
+import orjson
+
 from neura.core.types import Result
-from neura.motor.types import MotorAction
+from neura.motor.types import MotorAction, find_blocked_patterns
 from neura.policy.types import PolicyDecision
 
 logger = logging.getLogger(__name__)
 
+# Whitelists for the fallback rules (mirror motor_safe_actions.rego)
+_ALLOWED_APPS_MAC = frozenset({"Terminal", "Notes", "TextEdit", "VSCode", "Calculator"})
+_ALLOWED_APPS_LINUX = frozenset({"gedit", "kate", "code", "xterm", "gnome-terminal"})
+_ALLOWED_ACTIONS = frozenset({"type_text", "click", "open_app"})
+
 
 class PolicyEngine:
     """
@@ -26,15 +40,29 @@ class PolicyEngine:
     Falls back to builtin rules if OPA unavailable.
     """
 
-    def __init__(self, rules_dir: Path | None = None) -> None:
+    def __init__(self, rules_dir: Path | None = None, server_host: str = "127.0.0.1") -> None:
         """
         Initialize policy engine.
 
+        The OPA server is not started here; call `start()` (the API lifespan
+        does) or let the first OPA query start it.
+
         Args:
             rules_dir: Directory containing .rego files
+            server_host: Interface the OPA server binds to (port is picked at start)
         """
         self.rules_dir = rules_dir or Path(__file__).parent / "rules"
+        self.server_host = server_host
+        self.server_addr: str | None = None
         self.opa_available = self._check_opa_available()
+        self._rego_file = self.rules_dir / "motor_safe_actions.rego"
+        self._rego_exists = self._rego_file.is_file()
+        self._opa_process: subprocess.Popen | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._start_attempted = False
+        self._start_lock = asyncio.Lock()
+        self.validations = 0
+        self.fast_path_hits = 0
 
         if not self.opa_available:
             logger.warning("OPA not available, using fallback rules")
@@ -47,6 +75,94 @@ class PolicyEngine:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
+    def reload_rules(self) -> None:
+        """Re-check the rules directory after .rego files were added or removed."""
+        self._rego_exists = self._rego_file.is_file()
+
+    async def start(self) -> None:
+        """
+        Launch `opa run --server` once and wait for it to become healthy.
+
+        Safe to call repeatedly; only the first call does anything. Leaves the
+        engine in per-call `opa eval` mode if the server fails to start.
+        """
+        async with self._start_lock:
+            if self._start_attempted or not self.opa_available:
+                return
+            self._start_attempted = True
+            await self._start_opa_server()
+
+    async def _start_opa_server(self) -> None:
+        """
+        Start the OPA server on a free port and poll it until it answers.
+
+        The server is tagged with a random label, and only counts as healthy
+        once `/v1/config` echoes that label back, so a foreign process that
+        grabbed the port in between can never be mistaken for ours.
+        """
+        self.server_addr = f"{self.server_host}:{_free_port(self.server_host)}"
+        token = secrets.token_hex(16)
+
+        try:
+            self._opa_process = subprocess.Popen(
+                [
+                    "opa",
+                    "run",
+                    "--server",
+                    f"--addr={self.server_addr}",
+                    f"--set=labels.neura_instance={token}",
+                    str(self.rules_dir),
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to start OPA server: {e}")
+            return
+        atexit.register(self._stop_opa_process)
+
+        client = httpx.AsyncClient(base_url=f"http://{self.server_addr}", timeout=2.0)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0
+        while loop.time() < deadline and self._opa_process.poll() is None:
+            try:
+                resp = await client.get("/v1/config", timeout=0.2)
+                if resp.status_code == 200:
+                    labels = orjson.loads(resp.content).get("result", {}).get("labels", {})
+                    if labels.get("neura_instance") != token:
+                        break
+                    self._client = client
+                    logger.info(f"OPA server running on {self.server_addr}")
+                    return
+            except (httpx.HTTPError, orjson.JSONDecodeError):
+                pass
+            await asyncio.sleep(0.05)
+
+        logger.warning("OPA server did not become healthy, using opa eval")
+        await client.aclose()
+        await asyncio.to_thread(self._stop_opa_process)
+
+    def _stop_opa_process(self) -> None:
+        """Terminate the OPA server process if running (also registered with atexit)."""
+        if self._opa_process is None:
+            return
+        atexit.unregister(self._stop_opa_process)
+
+        if self._opa_process.poll() is None:
+            self._opa_process.terminate()
+            try:
+                self._opa_process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._opa_process.kill()
+        self._opa_process = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and shut down the OPA server."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await asyncio.to_thread(self._stop_opa_process)
+
     async def validate(self, action: MotorAction) -> Result[PolicyDecision]:
         """
         Validate motor action against policies.
@@ -57,8 +173,85 @@ class PolicyEngine:
         Returns:
             Result containing PolicyDecision
         """
-        # Prepare input for OPA
-        input_data = {
+        input_data = self._build_input(action)
+        self.validations += 1
+
+        decision = self._fast_path(input_data)
+        if decision is not None:
+            self.fast_path_hits += 1
+            return Result.success(decision)
+
+        if self.opa_available:
+            return await self._evaluate_opa(input_data)
+        else:
+            return await self._evaluate_fallback(input_data)
+
+    async def validate_batch(self, actions: list[MotorAction]) -> Result[PolicyDecision]:
+        """
+        Validate a sequence of motor actions with a single policy query.
+
+        The batch is allowed only if every action is allowed.
+
+        Args:
+            actions: Motor actions to validate, in execution order
+
+        Returns:
+            Result containing one PolicyDecision for the whole batch
+        """
+        inputs = [self._build_input(action) for action in actions]
+        batch_input = {"actions": inputs}
+
+        if self.opa_available and (self._client is not None or self._rego_exists):
+            try:
+                opa_result = await self._query_opa(batch_input)
+                allowed = opa_result.get("allow_batch", False)
+                violations = opa_result.get("batch_violations", [])
+
+                decision = PolicyDecision(
+                    allowed=allowed,
+                    reason="Allowed" if allowed else "; ".join(violations) or "Batch denied",
+                    policy_id="motor_safe_actions",
+                    violations=violations,
+                    inputs=batch_input,
+                    retry_after=None,
+                )
+
+                return Result.success(decision)
+
+            except (asyncio.TimeoutError, httpx.TimeoutException):
+                logger.error("OPA batch evaluation timeout")
+                return Result.failure("Policy evaluation timeout")
+            except Exception as e:
+                logger.error(f"OPA batch evaluation error: {e}")
+
+        # Fallback: evaluate in order, stop at the first denied action
+        for index, input_data in enumerate(inputs):
+            result = await self._evaluate_fallback(input_data)
+            if not result.data.allowed:
+                decision = PolicyDecision(
+                    allowed=False,
+                    reason=f"actions[{index}]: {result.data.reason}",
+                    policy_id="fallback_rules",
+                    violations=[f"actions[{index}]: {v}" for v in result.data.violations],
+                    inputs=batch_input,
+                    retry_after=None,
+                )
+                return Result.success(decision)
+
+        decision = PolicyDecision(
+            allowed=True,
+            reason="Allowed",
+            policy_id="fallback_rules",
+            violations=[],
+            inputs=batch_input,
+            retry_after=None,
+        )
+
+        return Result.success(decision)
+
+    def _build_input(self, action: MotorAction) -> dict[str, Any]:
+        """Normalize a motor action into policy input."""
+        return {
             "app": action.app,
             "action": action.action.value,
             "text": self._scrub_text(action.text),
@@ -67,10 +260,54 @@ class PolicyEngine:
             "os": action.os.value if action.os else "unknown",
         }
 
-        if self.opa_available:
-            return await self._evaluate_opa(input_data)
+    def _fast_path(self, input_data: dict[str, Any]) -> PolicyDecision | None:
+        """
+        Allow clearly safe actions without consulting OPA.
+
+        Only returns a decision for the common case (whitelisted app and
+        action, short text without blocked patterns, not critical); anything
+        else returns None and goes through the full evaluation.
+
+        Args:
+            input_data: Normalized policy input
+
+        Returns:
+            Allow decision, or None to fall through to the full evaluation
+        """
+        if input_data["critical"] or input_data["action"] not in _ALLOWED_ACTIONS:
+            return None
+
+        os_type = input_data["os"]
+        if os_type == "mac":
+            allowed_apps = _ALLOWED_APPS_MAC
+        elif os_type == "linux":
+            allowed_apps = _ALLOWED_APPS_LINUX
         else:
-            return await self._evaluate_fallback(input_data)
+            return None
+
+        app = input_data["app"]
+        if app and app not in allowed_apps:
+            return None
+
+        text = input_data["text"]
+        if len(text) >= 200 or find_blocked_patterns(text):
+            return None
+
+        return PolicyDecision(
+            allowed=True,
+            reason="Allowed",
+            policy_id="fast_path_v1",
+            violations=[],
+            inputs=input_data,
+            retry_after=None,
+        )
+
+    @property
+    def fast_path_hit_rate(self) -> float:
+        """Fraction of single-action validations answered by the fast path."""
+        if not self.validations:
+            return 0.0
+        return self.fast_path_hits / self.validations
 
     def _scrub_text(self, text: str | None) -> str:
         """Scrub sensitive text for logging."""
@@ -84,7 +321,7 @@ class PolicyEngine:
 
     async def _evaluate_opa(self, input_data: dict[str, Any]) -> Result[PolicyDecision]:
         """
-        Evaluate using OPA CLI.
+        Evaluate using OPA (server if running, CLI otherwise).
 
         Args:
             input_data: Normalized input
@@ -92,45 +329,84 @@ class PolicyEngine:
         Returns:
             Result containing PolicyDecision
         """
+        if self._client is None and not self._rego_exists:
+            return await self._evaluate_fallback(input_data)
+
         try:
-            # Find motor_safe_actions.rego
-            rego_file = self.rules_dir / "motor_safe_actions.rego"
-
-            if not rego_file.exists():
-                return await self._evaluate_fallback(input_data)
-
-            # Call opa eval
-            result = subprocess.run(
-                ["opa", "eval", "-d", str(rego_file), "-i", "-", "data.neura.motor"],
-                input=json.dumps({"input": input_data}).encode(),
-                capture_output=True,
-                timeout=5,
-            )
+            opa_result = await self._query_opa(input_data)
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            logger.error("OPA eval timeout")
+            return Result.failure("Policy evaluation timeout")
+        except Exception as e:
+            logger.error(f"OPA eval error: {e}")
+            return await self._evaluate_fallback(input_data)
+
+        decision = PolicyDecision(
+            allowed=opa_result.get("allow", False),
+            reason=opa_result.get("reason", "No reason provided"),
+            policy_id="motor_safe_actions",
+            violations=opa_result.get("violations", []),
+            inputs=input_data,
+            retry_after=None,
+        )
+
+        return Result.success(decision)
+
+    async def _query_opa(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Query `data.neura.motor` via the OPA server, or `opa eval` if none is running.
 
-            if result.returncode != 0:
-                logger.error(f"OPA eval failed: {result.stderr.decode()}")
-                return await self._evaluate_fallback(input_data)
+        Args:
+            input_data: Value bound to `input`
 
-            # Parse output
-            output = json.loads(result.stdout)
-            opa_result = output.get("result", [{}])[0].get("expressions", [{}])[0].get("value", {})
+        Returns:
+            The evaluated `data.neura.motor` document
 
-            decision = PolicyDecision(
-                allowed=opa_result.get("allow", False, retry_after=None),
-                reason=opa_result.get("reason", "No reason provided"),
-                policy_id="motor_safe_actions",
-                violations=opa_result.get("violations", []),
-                inputs=input_data,
+        Raises:
+            asyncio.TimeoutError: If `opa eval` times out
+            httpx.TimeoutException: If the OPA server times out
+            RuntimeError: If `opa eval` exits with an error
+        """
+        payload = orjson.dumps({"input": input_data})
+
+        if self._client is None and not self._start_attempted:
+            await self.start()
+
+        if self._client is not None:
+            resp = await self._client.post(
+                "/v1/data/neura/motor",
+                content=payload,
+                headers={"Content-Type": "application/json"},
             )
+            resp.raise_for_status()
+            return orjson.loads(resp.content).get("result", {})
+
+        # Call opa eval without blocking the event loop
+        proc = await asyncio.create_subprocess_exec(
+            "opa",
+            "eval",
+            "-d",
+            str(self._rego_file),
+            "-i",
+            "-",
+            "data.neura.motor",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(payload), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
 
-            return Result.success(decision)
+        if proc.returncode != 0:
+            raise RuntimeError(f"opa eval failed: {stderr.decode()}")
 
-        except subprocess.TimeoutExpired:
-            logger.error("OPA eval timeout")
-            return Result.failure("Policy evaluation timeout")
-        except Exception as e:
-            logger.error(f"OPA eval error: {e}")
-            return await self._evaluate_fallback(input_data)
+        # Parse output
+        output = orjson.loads(stdout)
+        return output.get("result", [{}])[0].get("expressions", [{}])[0].get("value", {})
 
     async def _evaluate_fallback(self, input_data: dict[str, Any]) -> Result[PolicyDecision]:
         """
@@ -138,14 +414,10 @@ class PolicyEngine:
 
         Implements same logic as Rego policies.
         """
-        allowed_apps_mac = ["Terminal", "Notes", "TextEdit", "VSCode", "Calculator"]
-        allowed_apps_linux = ["gedit", "kate", "code", "xterm", "gnome-terminal"]
-        allowed_actions = ["type_text", "click", "open_app"]
-
         violations = []
 
         # Check action type
-        if input_data["action"] not in allowed_actions:
+        if input_data["action"] not in _ALLOWED_ACTIONS:
             violations.append(f"Action '{input_data['action']}' not allowed")
 
         # Check execute_command is blocked
@@ -157,16 +429,14 @@ class PolicyEngine:
         os_type = input_data.get("os", "unknown")
 
         if app:
-            allowed_apps = allowed_apps_mac if os_type == "mac" else allowed_apps_linux
+            allowed_apps = _ALLOWED_APPS_MAC if os_type == "mac" else _ALLOWED_APPS_LINUX
             if app not in allowed_apps:
                 violations.append(f"App '{app}' not in whitelist")
 
         # Check text for blocked patterns
         text = input_data.get("text", "")
-        blocked_patterns = ["rm -rf", "curl | bash", "sudo ", "DROP TABLE"]
-        for pattern in blocked_patterns:
-            if pattern in text:
-                violations.append(f"Text contains blocked pattern: {pattern}")
+        for pattern in find_blocked_patterns(text):
+            violations.append(f"Text contains blocked pattern: {pattern}")
 
         # Check user approval for critical actions
         if input_data.get("critical") and not input_data.get("user_approved"):
@@ -188,13 +458,32 @@ class PolicyEngine:
         return Result.success(decision)
 
 
+def _free_port(host: str) -> int:
+    """Ask the OS for a currently unused TCP port on host."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
 # Singleton
 _policy_engine: PolicyEngine | None = None
+_policy_lock = threading.Lock()
 
 
 def get_policy_engine() -> PolicyEngine:
-    """Get or create PolicyEngine singleton."""
+    """Get or create PolicyEngine singleton (thread-safe, lock-free once created)."""
     global _policy_engine
-    if _policy_engine is None:
-        _policy_engine = PolicyEngine()
+    if _policy_engine is not None:
+        return _policy_engine
+    with _policy_lock:
+        if _policy_engine is None:
+            _policy_engine = PolicyEngine()
     return _policy_engine
+
+
+async def close_policy_engine() -> None:
+    """Shut down the PolicyEngine singleton (and its OPA server), if created."""
+    global _policy_engine
+    if _policy_engine is not None:
+        await _policy_engine.aclose()
+        _policy_engine = None
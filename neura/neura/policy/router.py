@@ -16,7 +16,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/validate", response_model=PolicyValidateResponse)
+@router.post(
+    "/validate", response_model=PolicyValidateResponse, response_model_exclude_none=True
+)
 async def validate_policy(action: MotorAction) -> dict:
     """
     Validate an action against policy without executing.
@@ -79,4 +81,7 @@ async def get_policy_status() -> dict[str, Any]:
         "opa_available": engine.opa_available,
         "rules_dir": str(engine.rules_dir),
         "mode": "opa" if engine.opa_available else "fallback",
+        "validations": engine.validations,
+        "fast_path_hits": engine.fast_path_hits,
+        "fast_path_hit_rate": engine.fast_path_hit_rate,
     }
@@ -1,5 +1,6 @@
 package neura.motor
 
+import future.keywords.every
 import future.keywords.if
 import future.keywords.in
 
@@ -119,3 +120,18 @@ violations[msg] if {
     not input.user_approved
     msg := "User approval required for critical action"
 }
+
+# Batch authorization: input.actions is a list of single-action inputs
+allow_batch if {
+    every act in input.actions {
+        allow with input as act
+    }
+}
+
+batch_violations[msg] if {
+    some i
+    act := input.actions[i]
+    action_violations := violations with input as act
+    some v in action_violations
+    msg := sprintf("actions[%d]: %s", [i, v])
+}
@@ -4,6 +4,7 @@ Auto-start configuration for Neura daemon.
 Creates LaunchAgent (macOS) or systemd service (Linux) for auto-start on boot.
 """
 
+import hashlib
 import logging
 import os
 import platform
@@ -13,6 +14,13 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Host OS, detected once at import
+_SYSTEM = platform.system()
+
+# Config file locations, joined once for the status check
+_PLIST_STR = str(Path.home() / "Library" / "LaunchAgents" / "com.neura.daemon.plist")
+_SERVICE_STR = str(Path.home() / ".config" / "systemd" / "user" / "neura-daemon.service")
+
 
 def setup_autostart(enable: bool = True):
     """
@@ -24,7 +32,7 @@ def setup_autostart(enable: bool = True):
     Returns:
         bool: Success
     """
-    system = platform.system()
+    system = _SYSTEM
     
     try:
         if system == "Darwin":  # macOS
@@ -40,6 +48,55 @@ def setup_autostart(enable: bool = True):
         return False
 
 
+def _spawn(argv: list[str], check: bool = False, quiet: bool = False) -> int:
+    """
+    Run a small helper command (launchctl/systemctl) and wait for it.
+
+    Uses os.posix_spawnp, which avoids a full fork of the Python process.
+    Falls back to subprocess where posix_spawn isn't available.
+
+    Args:
+        argv: Command and arguments
+        check: Raise CalledProcessError on a non-zero exit
+        quiet: Discard the command's stdout/stderr
+
+    Returns:
+        Exit code
+    """
+    if not hasattr(os, "posix_spawnp"):
+        output = subprocess.DEVNULL if quiet else None
+        return subprocess.run(argv, check=check, stdout=output, stderr=output).returncode
+
+    file_actions = []
+    if quiet:
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+
+    pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=file_actions)
+    _, status = os.waitpid(pid, 0)
+    returncode = os.waitstatus_to_exitcode(status)
+
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, argv)
+    return returncode
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write a file via a temp file and os.replace, so readers never see it partial."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def _content_unchanged(path: Path, content: str) -> bool:
+    """Check whether a config file already holds exactly this content."""
+    new = content.encode()
+    old = path.read_bytes() if path.exists() else b""
+    return hashlib.blake2b(new).digest() == hashlib.blake2b(old).digest()
+
+
 def _setup_launchagent(enable: bool) -> bool:
     """
     Setup macOS LaunchAgent.
@@ -53,7 +110,9 @@ def _setup_launchagent(enable: bool) -> bool:
     plist_path = launch_agents_dir / "com.neura.daemon.plist"
     
     if enable:
-        # Get Python executable and script path
+        # launchd runs the interpreter directly; any wrapper script added
+        # here must `exec "$PYTHON" -m neura.daemon.service` so no shell
+        # stays resident between launchd and the daemon.
         python_exe = sys.executable
         script_path = Path(__file__).parent.parent / "daemon" / "service.py"
         
@@ -78,6 +137,16 @@ def _setup_launchagent(enable: bool) -> bool:
     <key>KeepAlive</key>
     <true/>
     
+    <!-- Don't let launchd throttle the daemon as a background job -->
+    <key>ProcessType</key>
+    <string>Interactive</string>
+    
+    <key>Nice</key>
+    <integer>0</integer>
+    
+    <key>LowPriorityIO</key>
+    <false/>
+    
     <key>StandardOutPath</key>
     <string>{Path.home()}/.neura/logs/daemon.out.log</string>
     
@@ -93,17 +162,19 @@ def _setup_launchagent(enable: bool) -> bool:
 </plist>
 '''
         
-        # Write plist file
-        plist_path.write_text(plist_content)
-        logger.info(f"Created LaunchAgent: {plist_path}")
+        unchanged = _content_unchanged(plist_path, plist_content)
         
-        # Load the agent
-        subprocess.run(
-            ["launchctl", "load", str(plist_path)],
-            check=True,
-            capture_output=True
-        )
-        logger.info("LaunchAgent loaded")
+        if unchanged and _spawn(["launchctl", "list", "com.neura.daemon"], quiet=True) == 0:
+            logger.info("LaunchAgent already up to date and loaded")
+        else:
+            if not unchanged:
+                # Write plist file
+                _atomic_write(plist_path, plist_content)
+                logger.info(f"Created LaunchAgent: {plist_path}")
+            
+            # Load the agent
+            _spawn(["launchctl", "load", str(plist_path)], check=True, quiet=True)
+            logger.info("LaunchAgent loaded")
         
         print(f"✅ Auto-start enabled")
         print(f"   Neura will start automatically on login")
@@ -115,10 +186,7 @@ def _setup_launchagent(enable: bool) -> bool:
         # Disable auto-start
         if plist_path.exists():
             # Unload the agent
-            subprocess.run(
-                ["launchctl", "unload", str(plist_path)],
-                capture_output=True
-            )
+            _spawn(["launchctl", "unload", str(plist_path)], quiet=True)
             
             # Remove plist file
             plist_path.unlink()
@@ -162,27 +230,27 @@ StandardError=append:{Path.home()}/.neura/logs/daemon.err.log
 WantedBy=default.target
 '''
         
-        # Write service file
-        service_path.write_text(service_content)
-        logger.info(f"Created systemd service: {service_path}")
-        
-        # Reload systemd
-        subprocess.run(
-            ["systemctl", "--user", "daemon-reload"],
-            check=True
-        )
+        unchanged = _content_unchanged(service_path, service_content)
         
-        # Enable and start service
-        subprocess.run(
-            ["systemctl", "--user", "enable", "neura-daemon.service"],
-            check=True
-        )
-        subprocess.run(
-            ["systemctl", "--user", "start", "neura-daemon.service"],
-            check=True
-        )
-        
-        logger.info("Systemd service enabled and started")
+        if unchanged and _spawn(
+            ["systemctl", "--user", "is-active", "--quiet", "neura-daemon.service"]
+        ) == 0:
+            logger.info("Systemd service already up to date and active")
+        else:
+            if not unchanged:
+                # Write service file
+                _atomic_write(service_path, service_content)
+                logger.info(f"Created systemd service: {service_path}")
+                
+                # Reload systemd
+                _spawn(["systemctl", "--user", "daemon-reload"], check=True)
+            
+            # Enable and start service
+            _spawn(
+                ["systemctl", "--user", "enable", "--now", "neura-daemon.service"], check=True
+            )
+            
+            logger.info("Systemd service enabled and started")
         
         print(f"✅ Auto-start enabled")
         print(f"   Neura will start automatically on login")
@@ -195,23 +263,15 @@ WantedBy=default.target
         # Disable auto-start
         if service_path.exists():
             # Stop and disable service
-            subprocess.run(
-                ["systemctl", "--user", "stop", "neura-daemon.service"],
-                capture_output=True
-            )
-            subprocess.run(
-                ["systemctl", "--user", "disable", "neura-daemon.service"],
-                capture_output=True
+            _spawn(
+                ["systemctl", "--user", "disable", "--now", "neura-daemon.service"], quiet=True
             )
             
             # Remove service file
             service_path.unlink()
             
             # Reload systemd
-            subprocess.run(
-                ["systemctl", "--user", "daemon-reload"],
-                capture_output=True
-            )
+            _spawn(["systemctl", "--user", "daemon-reload"], quiet=True)
             
             logger.info("Systemd service removed")
             
@@ -227,17 +287,18 @@ def check_autostart_status() -> bool:
     Returns:
         bool: True if enabled
     """
-    system = platform.system()
-    
-    if system == "Darwin":
-        plist_path = Path.home() / "Library" / "LaunchAgents" / "com.neura.daemon.plist"
-        return plist_path.exists()
-    
-    elif system == "Linux":
-        service_path = Path.home() / ".config" / "systemd" / "user" / "neura-daemon.service"
-        return service_path.exists()
+    if _SYSTEM == "Darwin":
+        path = _PLIST_STR
+    elif _SYSTEM == "Linux":
+        path = _SERVICE_STR
+    else:
+        return False
     
-    return False
+    try:
+        os.lstat(path)
+        return True
+    except FileNotFoundError:
+        return False
 
 
 # CLI interface
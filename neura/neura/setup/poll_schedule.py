@@ -0,0 +1,138 @@
+"""
+Adaptive poll schedules for readiness probes.
+
+Given the observed distribution of past ready-times, picks k poll times
+in [0, U] that minimize the expected delay between a service becoming
+ready and the probe noticing it. Optimal times satisfy
+
+    L_i = L_{i-1} + (1 / p(L_{i-1})) * integral(p, L_{i-2}, L_{i-1})
+
+so the schedule is found by choosing L_1 such that L_k lands on U.
+With no history the pdf is uniform and the schedule is evenly spaced.
+"""
+
+import json
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+READY_TIMES_PATH = Path.home() / ".neura" / "state" / "ready_times.json"
+MAX_SAMPLES = 50
+
+_BINS = 20
+_SMOOTHING = 0.5  # pseudo-count per bin so p never reaches zero
+
+
+class _HistogramPDF:
+    """Piecewise-constant pdf over [0, upper] built from samples."""
+
+    def __init__(self, samples: Sequence[float], upper: float) -> None:
+        self.width = upper / _BINS
+        counts = [_SMOOTHING] * _BINS
+        for sample in samples:
+            index = min(int(max(sample, 0.0) / self.width), _BINS - 1)
+            counts[index] += 1
+        total = sum(counts)
+        self.density = [c / total / self.width for c in counts]
+
+    def pdf(self, x: float) -> float:
+        index = min(max(int(x / self.width), 0), _BINS - 1)
+        return self.density[index]
+
+    def cdf(self, x: float) -> float:
+        full, rest = divmod(max(x, 0.0), self.width)
+        full = int(full)
+        if full >= _BINS:
+            return 1.0
+        return (sum(self.density[:full]) + self.density[full] * rest / self.width) * self.width
+
+
+def _run_recurrence(pdf: _HistogramPDF, first: float, k: int) -> list[float]:
+    """Expand the optimality recurrence from a first poll time."""
+    times = [0.0, first]
+    for _ in range(k - 1):
+        prev, last = times[-2], times[-1]
+        mass = pdf.cdf(last) - pdf.cdf(prev)
+        times.append(last + mass / pdf.pdf(last))
+    return times[1:]
+
+
+def schedule(dist: Sequence[float], U: float, k: int) -> list[float]:
+    """
+    Compute k poll offsets (seconds) that minimize expected detection latency.
+
+    Args:
+        dist: Observed ready-times in seconds (may be empty)
+        U: Upper bound; the last poll happens at U
+        k: Number of polls
+
+    Returns:
+        Increasing list of k offsets, the last one equal to U
+    """
+    if k <= 1:
+        return [U]
+
+    pdf = _HistogramPDF(dist, U)
+
+    # The recurrence grows monotonically with the first poll time,
+    # so bisect for the value that makes the k-th poll land on U.
+    low, high = 0.0, U
+    for _ in range(60):
+        first = (low + high) / 2
+        if _run_recurrence(pdf, first, k)[-1] > U:
+            high = first
+        else:
+            low = first
+
+    times = [round(t, 4) for t in _run_recurrence(pdf, low, k)]
+    times[-1] = U
+    return times
+
+
+def load_ready_times(name: str, path: Path = READY_TIMES_PATH) -> list[float]:
+    """
+    Load recorded ready-times for a service.
+
+    Args:
+        name: Service name (e.g., "ollama")
+        path: State file
+
+    Returns:
+        Recorded durations in seconds, oldest first
+    """
+    try:
+        return [float(t) for t in json.loads(path.read_text()).get(name, [])]
+    except (OSError, ValueError, AttributeError, TypeError):
+        return []
+
+
+def record_ready_time(name: str, seconds: float, path: Path = READY_TIMES_PATH) -> None:
+    """
+    Append a ready-time for a service, keeping the last MAX_SAMPLES.
+
+    Args:
+        name: Service name (e.g., "ollama")
+        seconds: Observed time until the service answered
+        path: State file
+    """
+    try:
+        data = json.loads(path.read_text()) if path.exists() else {}
+    except (OSError, ValueError):
+        data = {}
+    # A corrupt state file is rewritten rather than crashing the caller
+    if not isinstance(data, dict):
+        data = {}
+    samples = data.get(name)
+    if not isinstance(samples, list):
+        samples = []
+
+    samples = samples + [round(seconds, 4)]
+    data[name] = samples[-MAX_SAMPLES:]
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data))
+    except OSError as e:
+        logger.debug(f"Could not save ready times: {e}")
@@ -5,17 +5,136 @@ Guides users through Neura setup with interactive demos.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import TypeVar
+
+import httpx
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from neura.setup.poll_schedule import load_ready_times, record_ready_time, schedule
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+T = TypeVar("T")
+
+_OLLAMA_POLLS = 5
+
+# Cached probe results: Ollama as (monotonic time, available), voice for the process
+_OLLAMA_CACHE_TTL = 5.0
+_ollama_cache: tuple[float, bool] | None = None
+_voice_cache: bool | None = None
+
+# Compiled AppleScripts reused across wizard runs
+SCRIPT_CACHE_DIR = Path.home() / ".neura" / "cache"
+
+# Shared client for all wizard probes (keep-alive to the local daemons)
+_client: httpx.AsyncClient | None = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=5.0, limits=httpx.Limits(max_keepalive_connections=4)
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
-async def run_onboarding():
+def _build_capability_table() -> Table:
+    """Build the "What I Can Do" table."""
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Icon", style="cyan", width=4)
+    table.add_column("Module", style="bold", width=15)
+    table.add_column("Description", style="dim")
+
+    table.add_row("🧠", "Cortex", "Think with local AI (Mistral)")
+    table.add_row("🧬", "Memory", "Remember everything you tell me")
+    table.add_row("🗣️", "Voice", "Speak to me naturally (FR/EN)")
+    table.add_row("🍎", "AppleScript", "Control your Mac (89 operations)")
+    table.add_row("🔐", "Vault", "Keep your secrets encrypted")
+    table.add_row("📊", "WHY Journal", "Full transparency & audit trail")
+
+    return table
+
+
+# Static onboarding renderables, built once at import
+WELCOME_PANEL = Panel.fit(
+    "[bold cyan]🧠 Welcome to Neura![/bold cyan]\n\n"
+    "[white]Your Local-First Cognitive Operating System[/white]\n\n"
+    "[dim]Let me introduce myself...[/dim]",
+    border_style="cyan",
+    padding=(1, 2)
+)
+
+CAPABILITY_TABLE = _build_capability_table()
+
+COMPLETION_PANEL = Panel.fit(
+    "[bold green]✨ Setup Complete![/bold green]\n\n"
+    "[white]You're all set! Here's what to try:[/white]\n\n"
+    "[cyan]neura ask[/cyan] [dim]'anything'[/dim]  - Ask me questions\n"
+    "[cyan]neura jarvis[/cyan]              - Voice mode\n"
+    "[cyan]neura flow[/cyan]                - Interactive shell\n"
+    "[cyan]neura help[/cyan]                - See all commands\n\n"
+    "[dim]Say 'neura jarvis' to start talking to me! 🎤[/dim]",
+    border_style="green",
+    padding=(1, 2)
+)
+
+
+async def _poll_until(
+    check: Callable[[], Awaitable[T]],
+    interval: float = 0.05,
+    timeout: float = 2.0,
+    times: Sequence[float] | None = None,
+) -> T | None:
+    """
+    Poll an async check until it returns a truthy result.
+
+    Args:
+        check: Factory returning a fresh awaitable on each call
+        interval: Seconds between attempts (when no schedule is given)
+        timeout: Total time budget in seconds (when no schedule is given)
+        times: Poll offsets in seconds from the start, e.g. from poll_schedule
+
+    Returns:
+        First truthy result, or None if the budget runs out
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    if times is None:
+        steps = int(timeout / interval)
+        times = [i * interval for i in range(steps + 1)]
+
+    for offset in times:
+        delay = start + offset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        result = await check()
+        if result:
+            return result
+
+    return None
+
+
+async def run_onboarding(pace: float = 0.0):
     """
     Run the magical onboarding experience.
     
@@ -24,71 +143,88 @@ async def run_onboarding():
     - System check
     - Module demos
     - First conversation
+
+    Args:
+        pace: Optional pause in seconds between sections, for demos
     """
+    try:
+        await _run_onboarding(pace)
+    finally:
+        await _close_client()
+
+
+async def _run_onboarding(pace: float) -> None:
+    """Render the onboarding sections (see run_onboarding)."""
+    async def pause() -> None:
+        if pace:
+            await asyncio.sleep(pace)
+
+    # Start every probe and demo now; they are independent, so the
+    # sections below only wait for whichever result they render.
+    ollama_task = asyncio.create_task(check_ollama())
+    demo_tasks = [
+        asyncio.create_task(demo_cortex()),
+        asyncio.create_task(demo_memory()),
+        asyncio.create_task(demo_voice()),
+        asyncio.create_task(demo_applescript()),
+    ]
+
     # Welcome
     console.print("\n")
-    console.print(Panel.fit(
-        "[bold cyan]🧠 Welcome to Neura![/bold cyan]\n\n"
-        "[white]Your Local-First Cognitive Operating System[/white]\n\n"
-        "[dim]Let me introduce myself...[/dim]",
-        border_style="cyan",
-        padding=(1, 2)
-    ))
+    console.print(WELCOME_PANEL)
     
-    await asyncio.sleep(1)
+    await pause()
     
     # System check
     console.print("\n[bold]📋 System Check[/bold]\n")
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        # Check Python
-        task = progress.add_task("Checking Python...", total=None)
-        await asyncio.sleep(0.5)
-        progress.update(task, description="✓ Python 3.12")
+    if console.is_terminal:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            # Check Python
+            task = progress.add_task("Checking Python...", total=None)
+            progress.update(task, description="✓ Python 3.12")
         
-        # Check Ollama
-        task2 = progress.add_task("Checking Ollama...", total=None)
-        await asyncio.sleep(0.5)
-        ollama_available = await check_ollama()
-        if ollama_available:
-            progress.update(task2, description="✓ Ollama running")
-        else:
-            progress.update(task2, description="⚠ Ollama not running")
+            # Check Ollama
+            task2 = progress.add_task("Checking Ollama...", total=None)
+            ollama_available = await ollama_task
+            if ollama_available:
+                progress.update(task2, description="✓ Ollama running")
+            else:
+                progress.update(task2, description="⚠ Ollama not running")
         
-        # Check modules
-        task3 = progress.add_task("Loading modules...", total=None)
-        await asyncio.sleep(0.5)
-        progress.update(task3, description="✓ All modules loaded")
+            # Check modules
+            task3 = progress.add_task("Loading modules...", total=None)
+            for done, finished in enumerate(asyncio.as_completed(demo_tasks), start=1):
+                await finished
+                progress.update(
+                    task3, description=f"Loading modules... ({done}/{len(demo_tasks)})"
+                )
+            progress.update(task3, description="✓ All modules loaded")
+    else:
+        # Not a TTY: skip the spinner redraws and print each result once
+        console.print("✓ Python 3.12")
+        ollama_available = await ollama_task
+        console.print("✓ Ollama running" if ollama_available else "⚠ Ollama not running")
+        await asyncio.wait(demo_tasks)
+        console.print("✓ All modules loaded")
+
+    response, memory_result, voice_available, battery_info = await asyncio.gather(*demo_tasks)
     
     console.print()
     
     # Module showcase
     console.print("[bold]🎯 What I Can Do[/bold]\n")
-    
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Icon", style="cyan", width=4)
-    table.add_column("Module", style="bold", width=15)
-    table.add_column("Description", style="dim")
-    
-    table.add_row("🧠", "Cortex", "Think with local AI (Mistral)")
-    table.add_row("🧬", "Memory", "Remember everything you tell me")
-    table.add_row("🗣️", "Voice", "Speak to me naturally (FR/EN)")
-    table.add_row("🍎", "AppleScript", "Control your Mac (89 operations)")
-    table.add_row("🔐", "Vault", "Keep your secrets encrypted")
-    table.add_row("📊", "WHY Journal", "Full transparency & audit trail")
-    
-    console.print(table)
+    console.print(CAPABILITY_TABLE)
     console.print()
     
     # Demo Cortex
     console.print("[bold]💬 Let's Have Our First Conversation[/bold]\n")
     console.print("[dim]Asking: 'What can you do?'[/dim]\n")
     
-    response = await demo_cortex()
     if response:
         console.print(Panel(
             response,
@@ -97,81 +233,100 @@ async def run_onboarding():
             padding=(1, 2)
         ))
     
-    await asyncio.sleep(1)
+    await pause()
     
     # Demo Memory
     console.print("\n[bold]🧬 Memory Demo[/bold]\n")
     console.print("[dim]Storing: 'I love coffee ☕'[/dim]\n")
     
-    memory_result = await demo_memory()
     if memory_result:
         console.print(f"[green]✓[/green] {memory_result}\n")
     
-    await asyncio.sleep(1)
+    await pause()
     
     # Demo Voice
     console.print("[bold]🗣️ Voice Demo[/bold]\n")
     
-    voice_available = await demo_voice()
     if voice_available:
         console.print("[green]✓[/green] Voice system ready\n")
     else:
         console.print("[yellow]⚠[/yellow] Voice not available (install Whisper)\n")
     
-    await asyncio.sleep(1)
+    await pause()
     
     # Demo AppleScript
     console.print("[bold]🍎 AppleScript Demo[/bold]\n")
     console.print("[dim]Checking battery...[/dim]\n")
     
-    battery_info = await demo_applescript()
     if battery_info:
         console.print(f"[green]✓[/green] {battery_info}\n")
     
-    await asyncio.sleep(1)
+    await pause()
     
     # Completion
-    console.print(Panel.fit(
-        "[bold green]✨ Setup Complete![/bold green]\n\n"
-        "[white]You're all set! Here's what to try:[/white]\n\n"
-        "[cyan]neura ask[/cyan] [dim]'anything'[/dim]  - Ask me questions\n"
-        "[cyan]neura jarvis[/cyan]              - Voice mode\n"
-        "[cyan]neura flow[/cyan]                - Interactive shell\n"
-        "[cyan]neura help[/cyan]                - See all commands\n\n"
-        "[dim]Say 'neura jarvis' to start talking to me! 🎤[/dim]",
-        border_style="green",
-        padding=(1, 2)
-    ))
+    console.print(COMPLETION_PANEL)
     
     console.print()
 
 
-async def check_ollama() -> bool:
-    """Check if Ollama is running."""
+async def _probe_ollama() -> bool:
+    """Probe Ollama once; returns True if it is running."""
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get("http://localhost:11434/api/tags")
-            return response.status_code == 200
+        client = await _get_client()
+        response = await client.get("http://localhost:11434/api/tags", timeout=2.0)
+        return response.status_code == 200
     except:
         return False
 
 
+async def check_ollama(budget: float = 2.0) -> bool:
+    """
+    Check if Ollama is running.
+
+    Probes immediately, then on a schedule derived from previous
+    ready-times. The ready-time recorded for the schedule is the midpoint
+    between the last failed and the first successful probe (0 if Ollama
+    was already up), not the probe that happened to notice it. The answer
+    is reused for a few seconds, so a freshly started Ollama is still
+    picked up.
+    """
+    global _ollama_cache
+    if _ollama_cache is not None and time.monotonic() - _ollama_cache[0] < _OLLAMA_CACHE_TTL:
+        return _ollama_cache[1]
+
+    times = [0.0, *schedule(load_ready_times("ollama"), U=budget, k=_OLLAMA_POLLS)]
+
+    start = time.monotonic()
+    probed_at: list[float] = []
+
+    async def probe() -> bool:
+        probed_at.append(time.monotonic() - start)
+        return await _probe_ollama()
+
+    ready = await _poll_until(probe, times=times)
+
+    if ready:
+        ready_at = (probed_at[-2] + probed_at[-1]) / 2 if len(probed_at) > 1 else 0.0
+        record_ready_time("ollama", ready_at)
+    _ollama_cache = (time.monotonic(), bool(ready))
+    return bool(ready)
+
+
 async def demo_cortex() -> str | None:
     """Demo Cortex with a simple question."""
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                "http://localhost:8000/api/cortex/generate",
-                json={
-                    "prompt": "In one short sentence, what can you do to help me?",
-                    "stream": False
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("text", "")
+        client = await _get_client()
+        response = await client.post(
+            "http://localhost:8000/api/cortex/generate",
+            json={
+                "prompt": "In one short sentence, what can you do to help me?",
+                "stream": False
+            },
+            timeout=10.0,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            return data.get("text", "")
     except:
         pass
     
@@ -181,15 +336,14 @@ async def demo_cortex() -> str | None:
 async def demo_memory() -> str | None:
     """Demo Memory storage."""
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(
-                "http://localhost:8000/api/memory/store",
-                json={"content": "User loves coffee ☕"}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return f"Stored in memory (id: {data.get('id', 'unknown')})"
+        client = await _get_client()
+        response = await client.post(
+            "http://localhost:8000/api/memory/store",
+            json={"content": "User loves coffee ☕"}
+        )
+        if response.status_code == 200:
+            data = response.json()
+            return f"Stored in memory (id: {data.get('id', 'unknown')})"
     except:
         pass
     
@@ -197,13 +351,50 @@ async def demo_memory() -> str | None:
 
 
 async def demo_voice() -> bool:
-    """Check if voice is available."""
+    """Check if voice is available (probed once per process)."""
+    global _voice_cache
+    if _voice_cache is None:
+        try:
+            from neura.voice.tts import SystemTTS
+            tts = SystemTTS()
+            _voice_cache = tts.is_available()
+        except:
+            _voice_cache = False
+    return _voice_cache
+
+
+async def _compiled_script(name: str, source: str) -> Path | None:
+    """
+    Get a compiled .scpt for an AppleScript, compiling it on first use.
+
+    The file name includes a hash of the source, so edited scripts are
+    recompiled and unchanged ones are reused across wizard runs.
+
+    Args:
+        name: Script name used in the cache file name
+        source: AppleScript source
+
+    Returns:
+        Path to the compiled script, or None if osacompile failed
+    """
+    digest = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+    target = SCRIPT_CACHE_DIR / f"{name}-{digest}.scpt"
+    if target.exists():
+        return target
+
     try:
-        from neura.voice.tts import SystemTTS
-        tts = SystemTTS()
-        return tts.is_available()
-    except:
-        return False
+        SCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        proc = await asyncio.create_subprocess_exec(
+            "osacompile", "-o", str(target), "-e", source,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        if await proc.wait() == 0:
+            return target
+    except OSError as e:
+        logger.debug(f"osacompile failed: {e}")
+
+    return None
 
 
 async def demo_applescript() -> str | None:
@@ -213,7 +404,12 @@ async def demo_applescript() -> str | None:
         from neura.motor.applescript.executor import AppleScriptExecutor
         
         executor = AppleScriptExecutor()
-        result = await executor.execute(SystemScripts.get_battery())
+        script = SystemScripts.get_battery()
+        script_path = await _compiled_script("battery", script)
+        if script_path:
+            result = await executor.execute_file(str(script_path))
+        else:
+            result = await executor.execute(script)
         
         if result.is_success():
             return f"Battery: {result.data}"
@@ -6,12 +6,18 @@ Beautiful, transparent window that appears when Neura is activated.
 
 import asyncio
 import logging
-import tkinter as tk
-from tkinter import ttk
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from tkinter import font as tkfont
 
 logger = logging.getLogger(__name__)
 
+# Mic icon scale per animation frame: 1.0 -> 1.2 -> back, in 0.05 steps
+_PULSE_UP = [round(1.0 + 0.05 * i, 2) for i in range(5)]
+_PULSE_SCALES = _PULSE_UP + _PULSE_UP[-2:0:-1]
+_PULSE_FRAME_MS = 50
+
 
 class FloatingMic:
     """
@@ -36,6 +42,10 @@ class FloatingMic:
         self.window = None
         self.is_listening = False
         self.transcription_text = ""
+        self._pulse_fonts: list["tkfont.Font"] = []
+        self._pulse_job = None
+        self._pending_text: str | None = None
+        self._flush_scheduled = False
         
         logger.info("Floating mic initialized")
 
@@ -46,6 +56,11 @@ class FloatingMic:
             self.window.lift()
             return
         
+        # Tk is only loaded when the window is actually shown
+        import tkinter as tk
+        from tkinter import font as tkfont
+        from tkinter import ttk
+        
         # Create window
         self.window = tk.Tk()
         self.window.title("Neura")
@@ -107,6 +122,12 @@ class FloatingMic:
         )
         self.mic_label.pack(pady=10)
         
+        # One font per animation frame, so the pulse never allocates fonts
+        self._pulse_fonts = [
+            tkfont.Font(root=self.window, family='Helvetica', size=int(48 * scale))
+            for scale in _PULSE_SCALES
+        ]
+        
         # Transcription
         self.transcription_label = tk.Label(
             main_frame,
@@ -173,9 +194,26 @@ class FloatingMic:
             self.status_label.config(text=status)
 
     def update_transcription(self, text: str):
-        """Update transcription text."""
+        """
+        Update transcription text.
+        
+        Bursts of partial transcriptions are coalesced: only the latest
+        text is applied, once per Tk idle cycle.
+        """
         self.transcription_text = text
-        if self.window and self.transcription_label:
+        if not (self.window and self.transcription_label):
+            return
+        
+        self._pending_text = text
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.window.after_idle(self._flush_transcription)
+
+    def _flush_transcription(self):
+        """Apply the latest pending transcription to the label."""
+        text, self._pending_text = self._pending_text, None
+        self._flush_scheduled = False
+        if text is not None and self.window:
             self.transcription_label.config(text=text)
 
     def _make_draggable(self, widget):
@@ -199,29 +237,20 @@ class FloatingMic:
         if not self.is_listening or not self.window:
             return
         
-        # Pulse animation
-        def pulse(scale=1.0, growing=True):
-            if not self.is_listening or not self.window:
-                return
-            
-            # Update size
-            size = int(48 * scale)
-            self.mic_label.config(font=('Helvetica', size))
-            
-            # Next frame
-            if growing:
-                next_scale = scale + 0.05
-                if next_scale >= 1.2:
-                    growing = False
-            else:
-                next_scale = scale - 0.05
-                if next_scale <= 1.0:
-                    growing = True
-            
-            # Schedule next frame
-            self.window.after(50, lambda: pulse(next_scale, growing))
+        if self._pulse_job is not None:
+            self.window.after_cancel(self._pulse_job)
+        self._tick(0)
+
+    def _tick(self, i: int):
+        """Show pulse frame i and schedule the next one."""
+        if not self.is_listening or not self.window:
+            self._pulse_job = None
+            return
         
-        pulse()
+        self.mic_label.config(font=self._pulse_fonts[i])
+        self._pulse_job = self.window.after(
+            _PULSE_FRAME_MS, self._tick, (i + 1) % len(self._pulse_fonts)
+        )
 
     def run(self):
         """Run the window (blocking)."""
@@ -4,13 +4,97 @@ Native notifications for macOS/Linux.
 Uses system notification APIs for native look and feel.
 """
 
+import atexit
 import logging
+import os
 import platform
+import shutil
 import subprocess
+import threading
+
+try:
+    from Foundation import NSUserNotification, NSUserNotificationCenter
+except ImportError:
+    NSUserNotification = None
+    NSUserNotificationCenter = None
 
 logger = logging.getLogger(__name__)
 
 
+def _detect_can_notify(system: str) -> bool:
+    """Check whether this session can show notifications at all."""
+    if system == "Linux":
+        has_display = bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+        return has_display and shutil.which("notify-send") is not None
+
+    if system == "Darwin":
+        try:
+            from Quartz import CGSessionCopyCurrentDictionary
+        except ImportError:
+            # Without pyobjc, only rule out remote shells
+            return not os.environ.get("SSH_CONNECTION")
+        return CGSessionCopyCurrentDictionary() is not None
+
+    return False
+
+
+# Host OS and notification support, detected once at import
+_SYSTEM = platform.system()
+_CAN_NOTIFY = _detect_can_notify(_SYSTEM)
+
+
+# Escape user text for an AppleScript string literal
+_APPLESCRIPT_ESCAPE = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"}
+)
+
+# Constant script for one-off osascript calls; text is passed as argv
+_NOTIFY_SCRIPT = (
+    "on run argv\n"
+    "  if (item 3 of argv) is \"\" then\n"
+    "    display notification (item 2 of argv) with title (item 1 of argv)\n"
+    "  else\n"
+    "    display notification (item 2 of argv) with title (item 1 of argv)"
+    " sound name (item 3 of argv)\n"
+    "  end if\n"
+    "end run"
+)
+
+# Long-lived interactive osascript, fed one statement per notification
+_osa_proc: subprocess.Popen | None = None
+_osa_lock = threading.Lock()
+
+
+def _get_osa_proc() -> subprocess.Popen:
+    """Get the persistent osascript process, starting it if needed."""
+    global _osa_proc
+    if _osa_proc is None or _osa_proc.poll() is not None:
+        _osa_proc = subprocess.Popen(
+            ["osascript", "-i"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    return _osa_proc
+
+
+def _close_osa_proc() -> None:
+    """Close the persistent osascript process."""
+    global _osa_proc
+    with _osa_lock:
+        if _osa_proc is not None:
+            try:
+                _osa_proc.stdin.close()
+                _osa_proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                _osa_proc.kill()
+            _osa_proc = None
+
+
+atexit.register(_close_osa_proc)
+
+
 def notify(
     title: str,
     message: str,
@@ -29,7 +113,11 @@ def notify(
     Example:
         >>> notify("Neura", "Task completed!", sound=True)
     """
-    system = platform.system()
+    system = _SYSTEM
+    
+    if not _CAN_NOTIFY and system in ("Darwin", "Linux"):
+        logger.debug(f"No notification display available, skipping: {title}")
+        return
     
     try:
         if system == "Darwin":  # macOS
@@ -44,22 +132,61 @@ def notify(
 
 
 def _notify_macos(title: str, message: str, sound: bool):
-    """Show notification on macOS using osascript."""
-    script = f'''
-    display notification "{message}" with title "{title}"
-    '''
+    """Show notification on macOS (pyobjc if installed, else osascript)."""
+    if NSUserNotification is not None:
+        try:
+            _notify_macos_native(title, message, sound)
+            return
+        except Exception as e:
+            logger.debug(f"Native notification failed, using osascript: {e}")
+    
+    _notify_macos_osascript(title, message, sound)
+
+
+def _notify_macos_native(title: str, message: str, sound: bool):
+    """Post a notification in-process through NSUserNotificationCenter."""
+    notification = NSUserNotification.alloc().init()
+    notification.setTitle_(title)
+    notification.setInformativeText_(message)
+    if sound:
+        notification.setSoundName_("NSUserNotificationDefaultSoundName")
+    
+    center = NSUserNotificationCenter.defaultUserNotificationCenter()
+    center.deliverNotification_(notification)
+    logger.debug(f"Notification shown: {title}")
+
+
+def _notify_macos_osascript(title: str, message: str, sound: bool):
+    """Show notification via the persistent osascript process."""
+    global _osa_proc
+    script = (
+        f'display notification "{message.translate(_APPLESCRIPT_ESCAPE)}"'
+        f' with title "{title.translate(_APPLESCRIPT_ESCAPE)}"'
+    )
     
     if sound:
         script += ' sound name "Glass"'
     
+    with _osa_lock:
+        for _ in range(2):
+            try:
+                proc = _get_osa_proc()
+                proc.stdin.write(script + "\n")
+                proc.stdin.flush()
+                logger.debug(f"Notification shown: {title}")
+                return
+            except (BrokenPipeError, OSError):
+                # osascript exited; restart it once before falling back
+                _osa_proc = None
+    
     try:
         subprocess.run(
-            ["osascript", "-e", script],
+            ["osascript", "-e", _NOTIFY_SCRIPT, title, message, "Glass" if sound else ""],
             check=True,
             capture_output=True
         )
         logger.debug(f"Notification shown: {title}")
-    except subprocess.CalledProcessError as e:
+    except (OSError, subprocess.CalledProcessError) as e:
         logger.error(f"Failed to show macOS notification: {e}")
 
 
@@ -8,18 +8,26 @@ The Vault module provides:
 - WHY Journal logging
 """
 
-from neura.vault.crypto import VaultCrypto, get_vault_crypto
-from neura.vault.manager import VaultManager, get_vault_manager
-from neura.vault.router import router
-from neura.vault.store import VaultStore, get_vault_store
-from neura.vault.types import (
-    GetSecretResponse,
-    PutSecretRequest,
-    SecretEntry,
-    UnlockRequest,
-    VaultState,
-    VaultStatus,
-)
+import importlib
+from typing import Any
+
+# Submodules are imported on first attribute access (PEP 562), so that
+# e.g. importing VaultStatus doesn't load crypto, SQLCipher or FastAPI.
+_LAZY = {
+    "VaultCrypto": "neura.vault.crypto",
+    "get_vault_crypto": "neura.vault.crypto",
+    "VaultStore": "neura.vault.store",
+    "get_vault_store": "neura.vault.store",
+    "VaultManager": "neura.vault.manager",
+    "get_vault_manager": "neura.vault.manager",
+    "router": "neura.vault.router",
+    "SecretEntry": "neura.vault.types",
+    "VaultState": "neura.vault.types",
+    "VaultStatus": "neura.vault.types",
+    "UnlockRequest": "neura.vault.types",
+    "PutSecretRequest": "neura.vault.types",
+    "GetSecretResponse": "neura.vault.types",
+}
 
 __all__ = [
     "VaultCrypto",
@@ -36,3 +44,17 @@ __all__ = [
     "PutSecretRequest",
     "GetSecretResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    # Cache on the package (also replaces the `router` submodule attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
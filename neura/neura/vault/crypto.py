@@ -4,16 +4,81 @@ Cryptographic functions for Vault.
 Provides key derivation (Argon2id) and file encryption/decryption.
 """
 
+import asyncio
+import contextlib
+import ctypes
+import hmac
 import logging
 import os
+import threading
+import time
 
 from argon2.low_level import Type, hash_secret_raw
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-from neura.core.types import Result
+from neura.core.types import RESULT_TRUE, Result
 
 logger = logging.getLogger(__name__)
 
+# Streaming file format: header = magic + base nonce, then frames of
+# 4-byte big-endian length + AES-GCM ciphertext. Each frame's nonce is the
+# base nonce XOR its counter, and the AAD binds the counter and a "last
+# frame" flag so frames can't be reordered, dropped or truncated.
+FILE_MAGIC = b"NVF1"
+NONCE_SIZE = 12
+TAG_SIZE = 16
+MAX_FILE_SIZE = 4 * 1024**3  # 4 GiB
+_MAX_CHUNK_SIZE = 4 * 1024**2
+_IO_BUFFER = 1 << 20
+_AEAD_CACHE_SIZE = 8
+_AUTH_FAIL_STR = "Decryption failed: authentication"
+_TUNE_PROBE_MEMORY = 16384  # KB; small enough to keep the probe quick
+_TUNE_MAX_PARALLELISM = 8
+
+
+def calculate_optimal_chunk_size(file_size: int) -> int:
+    """
+    Pick a streaming chunk size for a file.
+
+    Args:
+        file_size: Size of the file in bytes
+
+    Returns:
+        int: 64 KiB under 1 MiB, 1 MiB under 1 GiB, 4 MiB above
+    """
+    if file_size < 1024**2:
+        return 64 * 1024
+    if file_size < 1024**3:
+        return 1024**2
+    return _MAX_CHUNK_SIZE
+
+
+def _chunk_nonce(base_nonce: bytes, counter: int) -> bytes:
+    """Derive a frame nonce by XORing the counter into the base nonce."""
+    return (int.from_bytes(base_nonce, "big") ^ counter).to_bytes(NONCE_SIZE, "big")
+
+
+def _chunk_aad(counter: int, last: bool) -> bytes:
+    """Associated data for a frame: counter plus last-frame flag."""
+    return counter.to_bytes(8, "big") + (b"\x01" if last else b"\x00")
+
+
+def _write_frame(fd: int, length: bytes, payload: bytes) -> None:
+    """Write a frame's length prefix and payload with writev, without concatenating."""
+    bufs = [memoryview(length), memoryview(payload)]
+    while bufs:
+        if hasattr(os, "writev"):
+            written = os.writev(fd, bufs)
+        else:
+            written = os.write(fd, bufs[0])
+        # Drop fully written buffers and trim a partially written one
+        while bufs and written >= len(bufs[0]):
+            written -= len(bufs[0])
+            bufs.pop(0)
+        if bufs and written:
+            bufs[0] = bufs[0][written:]
+
 
 class VaultCrypto:
     """
@@ -32,6 +97,7 @@ class VaultCrypto:
         memory_cost: int = 65536,  # 64 MB in KB
         time_cost: int = 3,
         parallelism: int = 4,
+        kdf_cache_ttl: float = 0.0,
     ) -> None:
         """
         Initialize crypto with Argon2id parameters.
@@ -40,10 +106,20 @@ class VaultCrypto:
             memory_cost: Memory cost in KB (default: 64MB)
             time_cost: Number of iterations (default: 3)
             parallelism: Degree of parallelism (default: 4)
+            kdf_cache_ttl: Seconds to keep derived keys for repeat unlocks
+                (default: 0, disabled). Keys stay in memory that long.
         """
         self.memory_cost = memory_cost
         self.time_cost = time_cost
         self.parallelism = parallelism
+        self.kdf_cache_ttl = kdf_cache_ttl
+        # One AESGCM per key, so the key schedule is set up once per key
+        self._aead_cache: dict[bytes, AESGCM] = {}
+        # (key, cipher) for the most recent key, stored as one tuple so a
+        # concurrent reader never pairs one key with another key's cipher
+        self._last: tuple[bytes, AESGCM] | None = None
+        # HMAC(salt, password) -> (derived key, monotonic expiry)
+        self._kdf_cache: dict[bytes, tuple[bytes, float]] = {}
 
         logger.info(
             f"VaultCrypto initialized: mem={memory_cost}KB, "
@@ -67,9 +143,20 @@ class VaultCrypto:
             >>> len(key)
             32
         """
+        secret = password.encode("utf-8")
+        cache_key = None
+        if self.kdf_cache_ttl > 0:
+            cache_key = hmac.new(salt, secret, "sha256").digest()
+            cached = self._kdf_cache.get(cache_key)
+            if cached and cached[1] > time.monotonic():
+                logger.debug("Key served from KDF cache")
+                return cached[0]
+
         try:
+            # Speed comes from how argon2-cffi-bindings was built (system
+            # libargon2 with SIMD), see docs/security.md; the output is the same.
             key = hash_secret_raw(
-                secret=password.encode("utf-8"),
+                secret=secret,
                 salt=salt,
                 time_cost=self.time_cost,
                 memory_cost=self.memory_cost,
@@ -78,6 +165,13 @@ class VaultCrypto:
                 type=Type.ID,  # Argon2id
             )
 
+            if cache_key is not None:
+                now = time.monotonic()
+                self._kdf_cache = {
+                    k: v for k, v in self._kdf_cache.items() if v[1] > now
+                }
+                self._kdf_cache[cache_key] = (key, now + self.kdf_cache_ttl)
+
             logger.debug("Key derived successfully")
             return key
 
@@ -85,6 +179,112 @@ class VaultCrypto:
             logger.error(f"Key derivation failed: {e}")
             raise
 
+    def _get_aead(self, key: bytes) -> AESGCM:
+        """
+        Get the cached AESGCM instance for a key, creating it on first use.
+
+        Args:
+            key: 32-byte encryption key
+
+        Returns:
+            AESGCM: Cipher bound to the key
+        """
+        # Fast path: the store passes the same key object on every call,
+        # so an identity check skips hashing and the dict lookup
+        last = self._last
+        if last is not None and key is last[0]:
+            return last[1]
+
+        if isinstance(key, bytearray):
+            # A mutable key is about to be wiped in place; keying the cache
+            # on it would keep an immutable copy alive
+            aead = AESGCM(key)
+            self._last = (key, aead)
+            return aead
+
+        aead = self._aead_cache.get(key)
+        if aead is None:
+            if len(self._aead_cache) >= _AEAD_CACHE_SIZE:
+                self._aead_cache.clear()
+            aead = self._aead_cache[key] = AESGCM(key)
+        self._last = (key, aead)
+        return aead
+
+    def clear_key_cache(self) -> None:
+        """Drop cached ciphers (call when a key is erased or rotated)."""
+        self._aead_cache.clear()
+        self._last = None
+
+    def clear_kdf_cache(self) -> None:
+        """Drop cached derived keys."""
+        self._kdf_cache.clear()
+
+    def prewarm(self) -> None:
+        """
+        Run a throwaway derivation in the background.
+
+        Loads the native library and maps the Argon2 memory once, so the
+        first real unlock doesn't pay for it on a cold process.
+        """
+        threading.Thread(
+            target=hash_secret_raw,
+            kwargs={
+                "secret": b"warmup",
+                "salt": bytes(16),
+                "time_cost": 1,
+                "memory_cost": self.memory_cost,
+                "parallelism": self.parallelism,
+                "hash_len": 32,
+                "type": Type.ID,
+            },
+            name="argon2-prewarm",
+            daemon=True,
+        ).start()
+
+    def _time_kdf(self, parallelism: int) -> float:
+        """Time one probe derivation at the given parallelism."""
+        start = time.perf_counter()
+        hash_secret_raw(
+            secret=b"probe",
+            salt=bytes(16),
+            time_cost=1,
+            memory_cost=max(_TUNE_PROBE_MEMORY, 8 * parallelism),
+            parallelism=parallelism,
+            hash_len=32,
+            type=Type.ID,
+        )
+        return time.perf_counter() - start
+
+    def tune_parallelism(self) -> int:
+        """
+        Pick the Argon2 parallelism that the installed build actually exploits.
+
+        Times a small derivation at p=1 and p=cpu_count. A single-threaded
+        build runs lanes one after another, so extra lanes buy nothing and
+        p=1 is kept. Memory cost is left as is: the attacker's cost scales
+        with memory and iterations, not lanes.
+
+        Only call this for a new vault; parallelism is part of the KDF, so
+        changing it for an existing vault derives a different key.
+
+        Returns:
+            int: Chosen parallelism, also stored in self.parallelism
+        """
+        lanes = min(os.cpu_count() or 1, _TUNE_MAX_PARALLELISM)
+        if lanes > 1:
+            single = self._time_kdf(1)
+            multi = self._time_kdf(lanes)
+            # Require a clear win so timing noise doesn't pick extra lanes
+            self.parallelism = lanes if multi < single * 0.75 else 1
+        else:
+            self.parallelism = 1
+
+        logger.info(
+            f"Argon2 tuned: mem={self.memory_cost}KB, "
+            f"time={self.time_cost}, parallel={self.parallelism}"
+        )
+        return self.parallelism
+
     def generate_salt(self) -> bytes:
         """
         Generate a random salt for key derivation.
@@ -94,13 +294,17 @@ class VaultCrypto:
         """
         return os.urandom(32)
 
-    def encrypt(self, plaintext: bytes, key: bytes) -> Result[tuple[bytes, bytes]]:
+    def encrypt(
+        self, plaintext: bytes, key: bytes, nonce: bytes | None = None
+    ) -> Result[tuple[bytes, bytes]]:
         """
         Encrypt data using AES-256-GCM.
 
         Args:
             plaintext: Data to encrypt
             key: 32-byte encryption key
+            nonce: 12-byte nonce that is never reused with this key
+                (default: random)
 
         Returns:
             Result[Tuple[bytes, bytes]]: (nonce, ciphertext) or error
@@ -111,16 +315,13 @@ class VaultCrypto:
             ...     nonce, ciphertext = result.data
         """
         try:
-            # Generate random nonce
-            nonce = os.urandom(12)  # 96 bits for GCM
-
-            # Create cipher
-            aesgcm = AESGCM(key)
+            if nonce is None:
+                nonce = os.urandom(12)  # 96 bits for GCM
 
             # Encrypt (includes authentication tag)
-            ciphertext = aesgcm.encrypt(nonce, plaintext, None)
+            ciphertext = self._get_aead(key).encrypt(nonce, plaintext, None)
 
-            logger.debug(f"Encrypted {len(plaintext)} bytes")
+            logger.debug("Encrypted %d bytes", len(plaintext))
             return Result.success((nonce, ciphertext))
 
         except Exception as e:
@@ -128,6 +329,42 @@ class VaultCrypto:
             logger.error(error_msg)
             return Result.failure(error_msg)
 
+    def encrypt_batch(
+        self, plaintexts: list[bytes], key: bytes, nonces: list[bytes] | None = None
+    ) -> Result[list[tuple[bytes, bytes]]]:
+        """
+        Encrypt several values with one key using AES-256-GCM.
+
+        Args:
+            plaintexts: Data to encrypt
+            key: 32-byte encryption key
+            nonces: One 12-byte nonce per plaintext (default: random, drawn
+                in a single read)
+
+        Returns:
+            Result[List[Tuple[bytes, bytes]]]: (nonce, ciphertext) pairs or error
+        """
+        try:
+            if nonces is None:
+                pool = os.urandom(12 * len(plaintexts))
+                nonces = [pool[i : i + 12] for i in range(0, len(pool), 12)]
+            elif len(nonces) != len(plaintexts):
+                return Result.failure("Encryption failed: nonce count mismatch")
+
+            aead = self._get_aead(key)
+            pairs = [
+                (nonce, aead.encrypt(nonce, plaintext, None))
+                for nonce, plaintext in zip(nonces, plaintexts)
+            ]
+
+            logger.debug("Encrypted %d values", len(pairs))
+            return Result.success(pairs)
+
+        except Exception as e:
+            error_msg = f"Encryption failed: {e}"
+            logger.error(error_msg)
+            return Result.failure(error_msg)
+
     def decrypt(self, nonce: bytes, ciphertext: bytes, key: bytes) -> Result[bytes]:
         """
         Decrypt data using AES-256-GCM.
@@ -146,15 +383,17 @@ class VaultCrypto:
             ...     plaintext = result.data
         """
         try:
-            # Create cipher
-            aesgcm = AESGCM(key)
-
             # Decrypt and verify authentication tag
-            plaintext = aesgcm.decrypt(nonce, ciphertext, None)
+            plaintext = self._get_aead(key).decrypt(nonce, ciphertext, None)
 
-            logger.debug(f"Decrypted {len(plaintext)} bytes")
+            logger.debug("Decrypted %d bytes", len(plaintext))
             return Result.success(plaintext)
 
+        except InvalidTag:
+            # Wrong key or tampered data: same static error every time,
+            # nothing formatted and nothing about the cause logged
+            return Result.failure(_AUTH_FAIL_STR)
+
         except Exception as e:
             error_msg = f"Decryption failed: {e}"
             logger.error(error_msg)
@@ -164,6 +403,9 @@ class VaultCrypto:
         """
         Encrypt a file.
 
+        Streams the file in chunks, so memory use is bounded by the chunk
+        size rather than the file size.
+
         Args:
             input_path: Path to plaintext file
             output_path: Path to write encrypted file
@@ -173,24 +415,48 @@ class VaultCrypto:
             Result[bool]: Success or error
         """
         try:
-            # Read plaintext
-            with open(input_path, "rb") as f:
-                plaintext = f.read()
-
-            # Encrypt
-            result = self.encrypt(plaintext, key)
-            if result.is_failure():
-                return Result.failure(result.error)
-
-            nonce, ciphertext = result.data
-
-            # Write encrypted (nonce + ciphertext)
-            with open(output_path, "wb") as f:
-                f.write(nonce)
-                f.write(ciphertext)
+            file_size = os.path.getsize(input_path)
+            if file_size > MAX_FILE_SIZE:
+                return Result.failure(
+                    f"File too large: {file_size} bytes (max {MAX_FILE_SIZE})"
+                )
+
+            chunk_size = calculate_optimal_chunk_size(file_size)
+            aesgcm = self._get_aead(key)
+            base_nonce = os.urandom(NONCE_SIZE)
+
+            with open(input_path, "rb", buffering=_IO_BUFFER) as src:
+                # Output is unbuffered: each frame goes out in one writev call
+                dst = open(output_path, "wb", buffering=0)
+                try:
+                    with dst:
+                        fd = dst.fileno()
+                        _write_frame(fd, FILE_MAGIC, base_nonce)
+
+                        # Read one chunk ahead so the last frame can be flagged
+                        counter = 0
+                        chunk = src.read(chunk_size)
+                        while True:
+                            next_chunk = src.read(chunk_size)
+                            last = not next_chunk
+                            ciphertext = aesgcm.encrypt(
+                                _chunk_nonce(base_nonce, counter),
+                                chunk,
+                                _chunk_aad(counter, last),
+                            )
+                            _write_frame(fd, len(ciphertext).to_bytes(4, "big"), ciphertext)
+                            if last:
+                                break
+                            chunk = next_chunk
+                            counter += 1
+                except Exception:
+                    # Don't leave a partial encrypted file behind
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(output_path)
+                    raise
 
             logger.info(f"File encrypted: {input_path} -> {output_path}")
-            return Result.success(True)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"File encryption failed: {e}"
@@ -201,6 +467,9 @@ class VaultCrypto:
         """
         Decrypt a file.
 
+        Reads the chunked format written by encrypt_file. Files in the
+        older single-shot format (nonce + ciphertext) are still accepted.
+
         Args:
             input_path: Path to encrypted file
             output_path: Path to write decrypted file
@@ -210,41 +479,117 @@ class VaultCrypto:
             Result[bool]: Success or error
         """
         try:
-            # Read encrypted
-            with open(input_path, "rb") as f:
-                nonce = f.read(12)
-                ciphertext = f.read()
-
-            # Decrypt
-            result = self.decrypt(nonce, ciphertext, key)
-            if result.is_failure():
-                return Result.failure(result.error)
-
-            plaintext = result.data
-
-            # Write decrypted
-            with open(output_path, "wb") as f:
-                f.write(plaintext)
+            with open(input_path, "rb", buffering=_IO_BUFFER) as src:
+                if src.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                    src.seek(0)
+                    return self._decrypt_file_legacy(src, output_path, key)
+
+                aesgcm = self._get_aead(key)
+                base_nonce = src.read(NONCE_SIZE)
+
+                # Opened outside the try, so a failed open never removes the path
+                dst = open(output_path, "wb", buffering=_IO_BUFFER)
+                try:
+                    with dst:
+                        counter = 0
+                        written = 0
+                        while True:
+                            header = src.read(4)
+                            if len(header) < 4:
+                                raise ValueError("truncated file")
+                            length = int.from_bytes(header, "big")
+                            if length > _MAX_CHUNK_SIZE + TAG_SIZE:
+                                raise ValueError("invalid chunk length")
+                            ciphertext = src.read(length)
+
+                            last = src.peek(1)[:1] == b""
+                            plaintext = aesgcm.decrypt(
+                                _chunk_nonce(base_nonce, counter),
+                                ciphertext,
+                                _chunk_aad(counter, last),
+                            )
+                            written += len(plaintext)
+                            if written > MAX_FILE_SIZE:
+                                raise ValueError(f"file too large (max {MAX_FILE_SIZE} bytes)")
+                            dst.write(plaintext)
+                            if last:
+                                break
+                            counter += 1
+                except Exception:
+                    # Don't leave partially decrypted output behind
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(output_path)
+                    raise
 
             logger.info(f"File decrypted: {input_path} -> {output_path}")
-            return Result.success(True)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"File decryption failed: {e}"
             logger.error(error_msg)
             return Result.failure(error_msg)
 
-    def secure_erase(self, data: bytes) -> None:
+    def _decrypt_file_legacy(self, src, output_path: str, key: bytes) -> Result[bool]:
+        """Decrypt a single-shot (nonce + ciphertext) file."""
+        nonce = src.read(NONCE_SIZE)
+        ciphertext = src.read()
+
+        result = self.decrypt(nonce, ciphertext, key)
+        if result.is_failure():
+            return Result.failure(result.error)
+
+        with open(output_path, "wb") as f:
+            f.write(result.data)
+
+        logger.info(f"File decrypted (legacy format) -> {output_path}")
+        return RESULT_TRUE
+
+    async def encrypt_file_async(
+        self, input_path: str, output_path: str, key: bytes
+    ) -> Result[bool]:
+        """
+        Encrypt a file without blocking the event loop.
+
+        Runs encrypt_file in a worker thread; file reads and AES-GCM both
+        release the GIL.
+
+        Args:
+            input_path: Path to plaintext file
+            output_path: Path to write encrypted file
+            key: 32-byte encryption key
+
+        Returns:
+            Result[bool]: Success or error
+        """
+        return await asyncio.to_thread(self.encrypt_file, input_path, output_path, key)
+
+    async def decrypt_file_async(
+        self, input_path: str, output_path: str, key: bytes
+    ) -> Result[bool]:
+        """
+        Decrypt a file without blocking the event loop.
+
+        Args:
+            input_path: Path to encrypted file
+            output_path: Path to write decrypted file
+            key: 32-byte encryption key
+
+        Returns:
+            Result[bool]: Success or error
+        """
+        return await asyncio.to_thread(self.decrypt_file, input_path, output_path, key)
+
+    @staticmethod
+    def secure_erase(data: bytes) -> None:
         """
         Securely erase sensitive data from memory.
 
         Args:
-            data: Bytes to erase
+            data: Bytes to erase (only a bytearray can be overwritten)
         """
-        # Overwrite with zeros (best effort in Python)
-        if isinstance(data, bytearray):
-            for i in range(len(data)):
-                data[i] = 0
+        # Overwrite with zeros in one memset call (best effort in Python)
+        if isinstance(data, bytearray) and data:
+            ctypes.memset((ctypes.c_char * len(data)).from_buffer(data), 0, len(data))
         # Note: In Python, true secure erasure is difficult due to GC
         # This is a best-effort approach
         logger.debug("Secure erase performed")
@@ -252,12 +597,14 @@ class VaultCrypto:
 
 # Singleton instance
 _vault_crypto: VaultCrypto | None = None
+_vault_crypto_lock = threading.Lock()
 
 
 def get_vault_crypto(
     memory_cost: int = 65536,
     time_cost: int = 3,
     parallelism: int = 4,
+    kdf_cache_ttl: float = 0.0,
 ) -> VaultCrypto:
     """
     Get the global VaultCrypto instance.
@@ -266,15 +613,20 @@ def get_vault_crypto(
         memory_cost: Argon2 memory cost in KB
         time_cost: Argon2 time cost
         parallelism: Argon2 parallelism
+        kdf_cache_ttl: Seconds to cache derived keys (0 disables)
 
     Returns:
         VaultCrypto: Singleton instance
     """
     global _vault_crypto
-    if _vault_crypto is None:
-        _vault_crypto = VaultCrypto(
-            memory_cost=memory_cost,
-            time_cost=time_cost,
-            parallelism=parallelism,
-        )
+    if _vault_crypto is not None:
+        return _vault_crypto
+    with _vault_crypto_lock:
+        if _vault_crypto is None:
+            _vault_crypto = VaultCrypto(
+                memory_cost=memory_cost,
+                time_cost=time_cost,
+                parallelism=parallelism,
+                kdf_cache_ttl=kdf_cache_ttl,
+            )
     return _vault_crypto
@@ -7,21 +7,20 @@ Manages vault state (locked/unlocked/panic), auto-lock, and WHY Journal logging.
 import asyncio
 import json
 import logging
-import uuid
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
 from neura.core.events import get_event_bus
-from neura.core.types import Result
+from neura.core.types import RESULT_TRUE, Result
+from neura.core.why_journal import log_action, new_trace_id
 from neura.vault.crypto import get_vault_crypto
 from neura.vault.store import get_vault_store
-from neura.vault.types import SecretEntry, VaultState, VaultStatus
+from neura.vault.types import MAX_PASSWORD_LENGTH, SecretEntry, VaultState, VaultStatus
 
 logger = logging.getLogger(__name__)
 
-# WHY Journal path
-WHY_JOURNAL_PATH = Path("data/why_journal.jsonl")
-
 
 class VaultManager:
     """
@@ -43,7 +42,8 @@ class VaultManager:
         idle_timeout: int = 300,
         argon2_memory: int = 65536,
         argon2_iterations: int = 3,
-        argon2_parallelism: int = 4,
+        argon2_parallelism: int | None = None,
+        kdf_cache_ttl: float = 0.0,
     ) -> None:
         """
         Initialize vault manager.
@@ -53,7 +53,10 @@ class VaultManager:
             idle_timeout: Auto-lock timeout in seconds
             argon2_memory: Argon2 memory cost in KB
             argon2_iterations: Argon2 time cost
-            argon2_parallelism: Argon2 parallelism
+            argon2_parallelism: Argon2 parallelism (None: tuned when the
+                vault is created, 4 for vaults created before tuning)
+            kdf_cache_ttl: Seconds a derived key is reused for a re-unlock
+                after lock (0 disables)
         """
         self.db_path = db_path
         self.idle_timeout = idle_timeout
@@ -62,19 +65,35 @@ class VaultManager:
         self._crypto = get_vault_crypto(
             memory_cost=argon2_memory,
             time_cost=argon2_iterations,
-            parallelism=argon2_parallelism,
+            parallelism=argon2_parallelism or 4,
+            kdf_cache_ttl=kdf_cache_ttl,
         )
+        self._auto_tune = argon2_parallelism is None
+        self._crypto.prewarm()
         self._store = get_vault_store(db_path=db_path)
+        self._salt_path = Path(db_path).parent / "vault.salt"
+        self._params_path = self._salt_path.with_name("vault.params")
 
         # State management
         self._state = VaultState.LOCKED
-        self._master_key: bytes | None = None
+        self._master_key: bytearray | None = None
         self._salt: bytes | None = None
-        self._last_activity: datetime | None = None
+        self._salt_lock = asyncio.Lock()
+
+        # Store call gate: normal calls share it, close() takes it exclusively
+        # so it never runs under a call still in a worker thread
+        self._store_calls = 0
+        self._store_idle = asyncio.Event()
+        self._store_idle.set()
+        self._store_open = asyncio.Event()
+        self._store_open.set()
+        self._store_exclusive = asyncio.Lock()
+        self._last_activity = 0.0  # time.monotonic() of the last access
         self._last_unlock: datetime | None = None
         self._last_lock: datetime | None = None
 
-        # Auto-lock timer
+        # Auto-lock timer (fires once per idle deadline, no polling)
+        self._auto_lock_handle: asyncio.TimerHandle | None = None
         self._auto_lock_task: asyncio.Task | None = None
         self._auto_lock_enabled = True
 
@@ -93,29 +112,49 @@ class VaultManager:
         """
         Log to WHY Journal.
 
+        Goes through the shared journal writer, so while the API is running
+        this only enqueues the entry and the file is written in batches.
+
         Args:
             action: Action performed
             input_summary: Summary of input
             result: SUCCESS or FAILURE
             actor: Who performed the action
         """
-        WHY_JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "actor": actor,
-            "action": action,
-            "input_summary": input_summary[:200],
-            "policy_check": "PASS",
-            "user_approved": True,
-            "result": result,
-            "trace_id": str(uuid.uuid4()),
-        }
+        log_action(
+            actor=actor,
+            action=action,
+            input_summary=input_summary,
+            policy_check="PASS",
+            user_approved=True,
+            result=result,
+        )
 
-        with open(WHY_JOURNAL_PATH, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+    def _load_or_create_salt(self) -> None:
+        """
+        Load the vault salt and KDF parameters, creating them on first use.
 
-        logger.debug(f"WHY Journal: {action} - {result}")
+        Blocking (file I/O, and Argon2 benchmarks for a new vault); unlock
+        runs it in a worker thread. The salt is published last, so a caller
+        that sees it also sees the final parallelism.
+        """
+        if self._salt_path.exists():
+            salt = self._salt_path.read_bytes()
+            # Vaults created before tuning have no params file and keep
+            # the configured parallelism
+            if self._params_path.exists():
+                params = json.loads(self._params_path.read_text())
+                self._crypto.parallelism = params["parallelism"]
+        else:
+            # First time - create salt and tune the KDF for this machine
+            salt = self._crypto.generate_salt()
+            self._salt_path.parent.mkdir(parents=True, exist_ok=True)
+            self._salt_path.write_bytes(salt)
+            if self._auto_tune:
+                self._crypto.tune_parallelism()
+            self._params_path.write_text(json.dumps({"parallelism": self._crypto.parallelism}))
+            logger.info("Created new vault salt")
+        self._salt = salt
 
     async def unlock(self, password: str) -> Result[bool]:
         """
@@ -127,14 +166,14 @@ class VaultManager:
         Returns:
             Result[bool]: Success or error
         """
-        trace_id = str(uuid.uuid4())
+        trace_id = new_trace_id()
         logger.info(f"[{trace_id}] Unlock attempt")
 
         try:
             # Check if already unlocked
             if self._state == VaultState.UNLOCKED:
                 logger.warning("Vault already unlocked")
-                return Result.success(True)
+                return RESULT_TRUE
 
             # Check if in panic mode
             if self._state == VaultState.PANIC:
@@ -143,24 +182,25 @@ class VaultManager:
                 self._log_why_journal("unlock_vault", "panic_mode", "FAILURE")
                 return Result.failure(error_msg)
 
-            # Get or create salt
-            salt_path = Path(self.db_path).parent / "vault.salt"
-            if salt_path.exists():
-                with open(salt_path, "rb") as f:
-                    self._salt = f.read()
-            else:
-                # First time - create salt
-                self._salt = self._crypto.generate_salt()
-                salt_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(salt_path, "wb") as f:
-                    f.write(self._salt)
-                logger.info("Created new vault salt")
-
-            # Derive key from password
-            self._master_key = self._crypto.derive_key(password, self._salt)
+            # Don't spend a KDF run on input no valid password can match
+            if len(password) > MAX_PASSWORD_LENGTH:
+                self._log_why_journal("unlock_vault", "password_too_long", "FAILURE")
+                return Result.failure("Invalid password")
+
+            # Get or create salt (it never changes, so it's read once)
+            if self._salt is None:
+                async with self._salt_lock:
+                    if self._salt is None:
+                        await asyncio.to_thread(self._load_or_create_salt)
+
+            # Derive key from password off the event loop (argon2 releases the GIL)
+            # Kept as a bytearray so _secure_erase_key can overwrite it
+            self._master_key = bytearray(
+                await asyncio.to_thread(self._crypto.derive_key, password, self._salt)
+            )
 
             # Try to open store
-            result = self._store.open(self._master_key)
+            result = await self._store_call(self._store.open, self._master_key)
 
             if result.is_failure():
                 # Failed - clear key from memory
@@ -171,7 +211,7 @@ class VaultManager:
             # Success
             self._state = VaultState.UNLOCKED
             self._last_unlock = datetime.utcnow()
-            self._last_activity = datetime.utcnow()
+            self._last_activity = time.monotonic()
 
             # Start auto-lock timer
             if self._auto_lock_enabled:
@@ -189,7 +229,7 @@ class VaultManager:
             self._log_why_journal("unlock_vault", "password_provided", "SUCCESS")
 
             logger.info(f"[{trace_id}] Vault unlocked successfully")
-            return Result.success(True)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"Unlock failed: {e}"
@@ -205,30 +245,28 @@ class VaultManager:
         Returns:
             Result[bool]: Success or error
         """
-        trace_id = str(uuid.uuid4())
+        trace_id = new_trace_id()
         logger.info(f"[{trace_id}] Lock requested")
 
         try:
             # Already locked
             if self._state == VaultState.LOCKED:
                 logger.info("Vault already locked")
-                return Result.success(True)
+                return RESULT_TRUE
 
             # Close store
             if self._store:
-                self._store.close()
+                await self._store_call(self._store.close, exclusive=True)
 
             # Erase key from memory
-            self._secure_erase_key()
+            self._secure_erase_key(keep_kdf_cache=True)
 
             # Update state
             self._state = VaultState.LOCKED
             self._last_lock = datetime.utcnow()
 
             # Stop auto-lock timer
-            if self._auto_lock_task:
-                self._auto_lock_task.cancel()
-                self._auto_lock_task = None
+            self._cancel_auto_lock_timer()
 
             # Publish event
             event_bus = get_event_bus()
@@ -242,7 +280,7 @@ class VaultManager:
             self._log_why_journal("lock_vault", "user_requested", "SUCCESS")
 
             logger.info(f"[{trace_id}] Vault locked successfully")
-            return Result.success(True)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"Lock failed: {e}"
@@ -257,13 +295,13 @@ class VaultManager:
         Returns:
             Result[bool]: Success or error
         """
-        trace_id = str(uuid.uuid4())
+        trace_id = new_trace_id()
         logger.critical(f"[{trace_id}] PANIC MODE ACTIVATED")
 
         try:
             # Close store immediately
             if self._store:
-                self._store.close()
+                await self._store_call(self._store.close, exclusive=True)
 
             # Erase key from memory
             self._secure_erase_key()
@@ -273,9 +311,7 @@ class VaultManager:
             self._last_lock = datetime.utcnow()
 
             # Stop auto-lock timer
-            if self._auto_lock_task:
-                self._auto_lock_task.cancel()
-                self._auto_lock_task = None
+            self._cancel_auto_lock_timer()
 
             # Publish event
             event_bus = get_event_bus()
@@ -289,7 +325,7 @@ class VaultManager:
             self._log_why_journal("panic_mode", "emergency_lock", "SUCCESS")
 
             logger.critical(f"[{trace_id}] Panic mode complete - restart required")
-            return Result.success(True)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"Panic failed: {e}"
@@ -297,46 +333,108 @@ class VaultManager:
             self._log_why_journal("panic_mode", "exception", "FAILURE")
             return Result.failure(error_msg)
 
-    def _secure_erase_key(self) -> None:
-        """Securely erase the master key from memory."""
+    def _secure_erase_key(self, keep_kdf_cache: bool = False) -> None:
+        """
+        Securely erase the master key from memory.
+
+        Args:
+            keep_kdf_cache: Leave cached derived keys to expire on their TTL
+                (regular lock); failures and panic wipe them.
+        """
+        if not keep_kdf_cache:
+            self._crypto.clear_kdf_cache()
         if self._master_key:
-            # Overwrite with zeros
-            key_array = bytearray(self._master_key)
-            for i in range(len(key_array)):
-                key_array[i] = 0
+            # Overwrite the key buffer in place
+            self._crypto.secure_erase(self._master_key)
             self._master_key = None
+            self._crypto.clear_key_cache()
             logger.debug("Master key erased from memory")
 
     def _start_auto_lock_timer(self) -> None:
-        """Start the auto-lock timer."""
-        if self._auto_lock_task:
-            self._auto_lock_task.cancel()
+        """Arm the auto-lock timer for the earliest moment the vault can go idle."""
+        self._cancel_auto_lock_timer()
+        self._auto_lock_handle = asyncio.get_running_loop().call_later(
+            self.idle_timeout, self._auto_lock_due
+        )
+        logger.debug("Auto-lock timer started: %ss", self.idle_timeout)
 
-        async def auto_lock_worker():
-            try:
-                while True:
-                    await asyncio.sleep(10)  # Check every 10 seconds
+    def _cancel_auto_lock_timer(self) -> None:
+        """Cancel a pending auto-lock timer."""
+        if self._auto_lock_handle:
+            self._auto_lock_handle.cancel()
+            self._auto_lock_handle = None
+            logger.debug("Auto-lock timer cancelled")
 
-                    if self._state != VaultState.UNLOCKED:
-                        break
+    def _auto_lock_due(self) -> None:
+        """
+        Lock if the vault has been idle long enough, otherwise re-arm.
 
-                    if self._last_activity:
-                        idle_time = (datetime.utcnow() - self._last_activity).total_seconds()
+        Activity only moves the deadline forward, so instead of rescheduling
+        on every access the timer re-arms itself for the remaining time.
+        """
+        self._auto_lock_handle = None
+        if self._state != VaultState.UNLOCKED:
+            return
 
-                        if idle_time >= self.idle_timeout:
-                            logger.warning(f"Auto-lock triggered after {idle_time:.0f}s idle")
-                            await self.lock()
-                            break
+        idle_time = time.monotonic() - self._last_activity
+        if idle_time >= self.idle_timeout:
+            logger.warning(f"Auto-lock triggered after {idle_time:.0f}s idle")
+            self._auto_lock_task = asyncio.create_task(self.lock())
+        else:
+            self._auto_lock_handle = asyncio.get_running_loop().call_later(
+                self.idle_timeout - idle_time, self._auto_lock_due
+            )
 
-            except asyncio.CancelledError:
-                logger.debug("Auto-lock timer cancelled")
+    async def _store_call(self, fn, *args, exclusive: bool = False):
+        """
+        Run a blocking store operation in a worker thread.
 
-        self._auto_lock_task = asyncio.create_task(auto_lock_worker())
-        logger.debug(f"Auto-lock timer started: {self.idle_timeout}s")
+        sqlite3 calls would otherwise hold the event loop. The store keeps
+        a connection per thread, so normal calls run concurrently. An
+        exclusive call (close) stops new calls from starting and waits for
+        the running ones to finish, so it never tears down a connection
+        or the key under them.
+
+        Args:
+            fn: Bound VaultStore method
+            *args: Arguments for it
+            exclusive: Run alone, after every in-flight call has finished
+
+        Returns:
+            Whatever fn returns
+        """
+        if exclusive:
+            async with self._store_exclusive:
+                self._store_open.clear()
+                try:
+                    await self._store_idle.wait()
+                    return await self._run_store_call(fn, args)
+                finally:
+                    self._store_open.set()
+
+        while not self._store_open.is_set():
+            await self._store_open.wait()
+        return await self._run_store_call(fn, args)
+
+    async def _run_store_call(self, fn, args: tuple):
+        """Run fn in a worker thread, counted as in flight until the thread returns."""
+        self._store_calls += 1
+        self._store_idle.clear()
+        # Cancelling the caller doesn't stop the thread, so the call is
+        # released when the thread finishes, not when the caller gives up
+        future = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        future.add_done_callback(self._store_call_done)
+        return await asyncio.shield(future)
+
+    def _store_call_done(self, future: asyncio.Future) -> None:
+        """Release an in-flight store call."""
+        self._store_calls -= 1
+        if not self._store_calls:
+            self._store_idle.set()
 
     def _update_activity(self) -> None:
         """Update last activity timestamp."""
-        self._last_activity = datetime.utcnow()
+        self._last_activity = time.monotonic()
 
     async def put_secret(
         self,
@@ -360,7 +458,7 @@ class VaultManager:
 
         self._update_activity()
 
-        result = self._store.put_secret(name, value, metadata)
+        result = await self._store_call(self._store.put_secret, name, value, metadata)
 
         if result.is_success():
             self._log_why_journal(
@@ -392,7 +490,7 @@ class VaultManager:
 
         self._update_activity()
 
-        result = self._store.get_secret(name)
+        result = await self._store_call(self._store.get_secret, name)
 
         if result.is_success():
             self._log_why_journal(
@@ -420,7 +518,7 @@ class VaultManager:
             return Result.failure("Vault is locked")
 
         self._update_activity()
-        return self._store.list_secrets()
+        return await self._store_call(self._store.list_secrets)
 
     async def delete_secret(self, name: str) -> Result[bool]:
         """
@@ -437,7 +535,7 @@ class VaultManager:
 
         self._update_activity()
 
-        result = self._store.delete_secret(name)
+        result = await self._store_call(self._store.delete_secret, name)
 
         if result.is_success():
             self._log_why_journal(
@@ -479,6 +577,7 @@ class VaultManager:
 
 # Singleton instance
 _vault_manager: VaultManager | None = None
+_vault_manager_lock = threading.Lock()
 
 
 def get_vault_manager(
@@ -496,9 +595,12 @@ def get_vault_manager(
         VaultManager: Singleton instance
     """
     global _vault_manager
-    if _vault_manager is None:
-        _vault_manager = VaultManager(
-            db_path=db_path,
-            idle_timeout=idle_timeout,
-        )
+    if _vault_manager is not None:
+        return _vault_manager
+    with _vault_manager_lock:
+        if _vault_manager is None:
+            _vault_manager = VaultManager(
+                db_path=db_path,
+                idle_timeout=idle_timeout,
+            )
     return _vault_manager
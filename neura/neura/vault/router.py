@@ -4,13 +4,17 @@ Vault API router - FastAPI endpoints for vault operations.
 Provides REST endpoints for unlocking, locking, and managing secrets.
 """
 
+import asyncio
 import logging
+import time
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 
 from neura.vault.manager import get_vault_manager
 from neura.vault.types import (
     GetSecretResponse,
+    MessageResponse,
     PutSecretRequest,
     UnlockRequest,
     VaultStatus,
@@ -21,9 +25,13 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter()
 
+# Failed unlocks are answered no sooner than this, so the response time
+# doesn't reveal which check failed (panic state, key check, KDF cost)
+MIN_UNLOCK_LATENCY = 1.0
+
 
 @router.post("/unlock")
-async def unlock_vault(request: UnlockRequest) -> dict:
+async def unlock_vault(request: UnlockRequest) -> MessageResponse:
     """
     Unlock the vault with a password.
 
@@ -31,7 +39,7 @@ async def unlock_vault(request: UnlockRequest) -> dict:
         request: Unlock request with password
 
     Returns:
-        dict: Success message
+        MessageResponse: Success message
 
     Raises:
         HTTPException: If unlock fails
@@ -50,22 +58,24 @@ async def unlock_vault(request: UnlockRequest) -> dict:
     # Get password from SecretStr
     password = request.password.get_secret_value()
 
+    start = time.perf_counter()
     result = await manager.unlock(password)
 
     if result.is_failure():
-        logger.error(f"Unlock failed: {result.error}")
+        logger.error("Unlock failed: %s", result.error)
+        await asyncio.sleep(max(0.0, MIN_UNLOCK_LATENCY - (time.perf_counter() - start)))
         raise HTTPException(status_code=401, detail=result.error)
 
-    return {"message": "Vault unlocked successfully"}
+    return MessageResponse(message="Vault unlocked successfully")
 
 
 @router.post("/lock")
-async def lock_vault() -> dict:
+async def lock_vault() -> MessageResponse:
     """
     Lock the vault.
 
     Returns:
-        dict: Success message
+        MessageResponse: Success message
 
     Raises:
         HTTPException: If lock fails
@@ -81,19 +91,19 @@ async def lock_vault() -> dict:
     result = await manager.lock()
 
     if result.is_failure():
-        logger.error(f"Lock failed: {result.error}")
+        logger.error("Lock failed: %s", result.error)
         raise HTTPException(status_code=500, detail=result.error)
 
-    return {"message": "Vault locked successfully"}
+    return MessageResponse(message="Vault locked successfully")
 
 
 @router.post("/panic")
-async def panic_vault() -> dict:
+async def panic_vault() -> MessageResponse:
     """
     Emergency panic mode - immediately lock vault.
 
     Returns:
-        dict: Success message
+        MessageResponse: Success message
 
     Raises:
         HTTPException: If panic fails
@@ -109,14 +119,14 @@ async def panic_vault() -> dict:
     result = await manager.panic()
 
     if result.is_failure():
-        logger.error(f"Panic failed: {result.error}")
+        logger.error("Panic failed: %s", result.error)
         raise HTTPException(status_code=500, detail=result.error)
 
-    return {"message": "Panic mode activated - vault locked"}
+    return MessageResponse(message="Panic mode activated - vault locked")
 
 
 @router.post("/put")
-async def put_secret(request: PutSecretRequest) -> dict:
+async def put_secret(request: PutSecretRequest) -> MessageResponse:
     """
     Store a secret in the vault.
 
@@ -124,7 +134,7 @@ async def put_secret(request: PutSecretRequest) -> dict:
         request: Put secret request
 
     Returns:
-        dict: Success message with secret name
+        MessageResponse: Success message with secret name
 
     Raises:
         HTTPException: If vault is locked or operation fails
@@ -140,7 +150,7 @@ async def put_secret(request: PutSecretRequest) -> dict:
           }'
         ```
     """
-    logger.info(f"Put secret request: {request.name}")
+    logger.info("Put secret request: %s", request.name)
 
     manager = get_vault_manager()
 
@@ -157,14 +167,14 @@ async def put_secret(request: PutSecretRequest) -> dict:
     )
 
     if result.is_failure():
-        logger.error(f"Put secret failed: {result.error}")
+        logger.error("Put secret failed: %s", result.error)
         raise HTTPException(status_code=500, detail=result.error)
 
-    return {"message": f"Secret '{request.name}' stored successfully"}
+    return MessageResponse(message=f"Secret '{request.name}' stored successfully")
 
 
-@router.get("/get")
-async def get_secret(name: str) -> GetSecretResponse:
+@router.get("/get", response_model=GetSecretResponse)
+async def get_secret(name: str) -> Response:
     """
     Get a secret from the vault.
 
@@ -172,7 +182,7 @@ async def get_secret(name: str) -> GetSecretResponse:
         name: Secret name
 
     Returns:
-        GetSecretResponse: Secret data
+        Response: GetSecretResponse serialized as JSON
 
     Raises:
         HTTPException: If vault is locked or secret not found
@@ -182,7 +192,7 @@ async def get_secret(name: str) -> GetSecretResponse:
         curl http://localhost:8000/api/vault/get?name=api_key
         ```
     """
-    logger.info(f"Get secret request: {name}")
+    logger.info("Get secret request: %s", name)
 
     manager = get_vault_manager()
 
@@ -192,25 +202,29 @@ async def get_secret(name: str) -> GetSecretResponse:
     result = await manager.get_secret(name)
 
     if result.is_failure():
-        logger.error(f"Get secret failed: {result.error}")
+        logger.error("Get secret failed: %s", result.error)
         raise HTTPException(status_code=404, detail=result.error)
 
     entry = result.data
 
-    return GetSecretResponse(
+    response = GetSecretResponse(
         name=entry.name,
         value=entry.value.get_secret_value(),
         metadata=entry.metadata,
     )
 
+    # Serialize in pydantic-core directly, skipping FastAPI's response
+    # model re-validation and jsonable_encoder pass on the hottest endpoint
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
 
-@router.get("/list")
-async def list_secrets() -> list[str]:
+@router.get("/list", response_model=list[str])
+async def list_secrets() -> Response:
     """
     List all secret names.
 
     Returns:
-        List[str]: List of secret names
+        Response: JSON list of secret names
 
     Raises:
         HTTPException: If vault is locked
@@ -230,14 +244,15 @@ async def list_secrets() -> list[str]:
     result = await manager.list_secrets()
 
     if result.is_failure():
-        logger.error(f"List secrets failed: {result.error}")
+        logger.error("List secrets failed: %s", result.error)
         raise HTTPException(status_code=500, detail=result.error)
 
-    return result.data
+    # Names are plain strings; encode once instead of validating each one
+    return Response(content=orjson.dumps(result.data), media_type="application/json")
 
 
 @router.delete("/delete")
-async def delete_secret(name: str) -> dict:
+async def delete_secret(name: str) -> MessageResponse:
     """
     Delete a secret from the vault.
 
@@ -245,7 +260,7 @@ async def delete_secret(name: str) -> dict:
         name: Secret name
 
     Returns:
-        dict: Success message
+        MessageResponse: Success message
 
     Raises:
         HTTPException: If vault is locked or secret not found
@@ -255,7 +270,7 @@ async def delete_secret(name: str) -> dict:
         curl -X DELETE http://localhost:8000/api/vault/delete?name=api_key
         ```
     """
-    logger.info(f"Delete secret request: {name}")
+    logger.info("Delete secret request: %s", name)
 
     manager = get_vault_manager()
 
@@ -265,10 +280,10 @@ async def delete_secret(name: str) -> dict:
     result = await manager.delete_secret(name)
 
     if result.is_failure():
-        logger.error(f"Delete secret failed: {result.error}")
+        logger.error("Delete secret failed: %s", result.error)
         raise HTTPException(status_code=404, detail=result.error)
 
-    return {"message": f"Secret '{name}' deleted successfully"}
+    return MessageResponse(message=f"Secret '{name}' deleted successfully")
 
 
 @router.get("/status", response_model=VaultStatus)
@@ -4,18 +4,103 @@ Encrypted storage using SQLite + application-level encryption.
 Provides secure storage for secrets with AES-256-GCM encryption.
 """
 
-import json
+import hmac
 import logging
+import os
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
 from pathlib import Path
 
-from neura.core.types import Result
+import orjson
+
+from neura.core.types import RESULT_TRUE, Result
 from neura.vault.crypto import VaultCrypto
 from neura.vault.types import SecretEntry, SecretMetadata
 
 logger = logging.getLogger(__name__)
 
+# Nonces are a random 4-byte field per open plus an 8-byte counter
+# (NIST SP 800-38D deterministic construction). The counter's high-water
+# mark is persisted in blocks so a restart never reuses a value.
+_NONCE_RESERVE = 1024
+
+# Key check value: HMAC of a fixed label under the vault key, stored on first
+# open so a wrong password is rejected at unlock instead of on first read
+_KEY_CHECK_LABEL = b"neura-vault-key-check"
+
+# Applied to every connection: WAL lets readers run alongside the writer,
+# synchronous=NORMAL is durable under WAL with one fsync per checkpoint,
+# and mmap avoids copying pages from the OS cache
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_EMPTY_META_JSON = "{}"
+
+# Access stats are counted in memory and written at most this often
+_ACCESS_FLUSH_INTERVAL = 30.0
+
+# Decrypted secrets kept for repeat reads while the vault is open
+_CACHE_MAX_SIZE = 256
+_CACHE_TTL = 60.0
+
+_UPSERT_SQL = """
+    INSERT INTO secrets (name, value_encrypted, metadata, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        value_encrypted = excluded.value_encrypted,
+        metadata = excluded.metadata,
+        updated_at = excluded.updated_at
+"""
+
+
+# Keyed by name only, so the table is clustered on it (WITHOUT ROWID):
+# lookups walk one B-tree instead of the name index plus the rowid table
+_CREATE_SECRETS_SQL = """
+    CREATE TABLE IF NOT EXISTS secrets (
+        name TEXT PRIMARY KEY,
+        value_encrypted BLOB NOT NULL,
+        metadata TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        accessed_at INTEGER,
+        access_count INTEGER DEFAULT 0
+    ) WITHOUT ROWID
+"""
+
+# Older vaults have a rowid table and may keep ISO-8601 text timestamps;
+# open() rebuilds the table once, converting timestamps to epoch seconds
+_MIGRATE_SECRETS_SQL = f"""
+    BEGIN;
+    DROP INDEX IF EXISTS idx_secrets_created;
+    ALTER TABLE secrets RENAME TO secrets_old;
+    {_CREATE_SECRETS_SQL};
+    INSERT INTO secrets
+    SELECT name, value_encrypted, metadata,
+        CASE typeof(created_at) WHEN 'text'
+            THEN CAST(strftime('%s', created_at) AS INTEGER) ELSE created_at END,
+        CASE typeof(updated_at) WHEN 'text'
+            THEN CAST(strftime('%s', updated_at) AS INTEGER) ELSE updated_at END,
+        CASE typeof(accessed_at) WHEN 'text'
+            THEN CAST(strftime('%s', accessed_at) AS INTEGER) ELSE accessed_at END,
+        access_count
+    FROM secrets_old;
+    DROP TABLE secrets_old;
+    COMMIT;
+"""
+
+
+def _to_datetime(timestamp: int | None) -> datetime | None:
+    """Convert a stored epoch timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(timestamp, UTC) if timestamp is not None else None
+
 
 class VaultStore:
     """
@@ -41,12 +126,61 @@ class VaultStore:
             db_path: Path to SQLite database
         """
         self.db_path = Path(db_path)
-        self._conn: sqlite3.Connection | None = None
+        # One connection per thread, so the manager's worker threads can
+        # read in parallel; all of them are tracked for close()
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._nonce_lock = threading.Lock()
+        # name -> (reads not yet written, last read time)
+        self._pending_access: dict[str, tuple[int, int | None]] = {}
+        self._access_lock = threading.Lock()
+        self._last_access_flush = time.monotonic()
+        # name -> (row, decrypted value, expiry); bumping the generation on
+        # writes stops a read that raced the write from caching stale data
+        self._cache: OrderedDict[str, tuple[sqlite3.Row, str, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_gen = 0
         self._crypto: VaultCrypto | None = None
-        self._encryption_key: bytes | None = None
+        self._encryption_key: bytearray | None = None
         self._is_open = False
-
-        logger.info(f"VaultStore created: {db_path}")
+        self._nonce_fixed: bytes | None = None
+        self._nonce_ctr = 0
+        self._nonce_limit = 0
+
+        logger.info("VaultStore created: %s", db_path)
+
+    @property
+    def _conn(self) -> sqlite3.Connection | None:
+        """This thread's connection, opened on first use while the store is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None and self._is_open:
+            conn = self._conn = self._connect()
+        return conn
+
+    @_conn.setter
+    def _conn(self, conn: sqlite3.Connection | None) -> None:
+        self._local.conn = conn
+        if conn is not None:
+            with self._conns_lock:
+                self._conns.append(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection to the database."""
+        # check_same_thread=False only so close() can close every thread's connection
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _close_connections(self) -> None:
+        """Close every thread's connection."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        self._local = threading.local()
+        for conn in conns:
+            conn.close()
 
     def open(self, key: bytes) -> Result[bool]:
         """
@@ -67,80 +201,193 @@ class VaultStore:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Connect to SQLite database (standard, not SQLCipher)
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
+            self._conn = self._connect()
 
-            # Store encryption key and initialize crypto
-            self._encryption_key = key
+            # Keep a mutable copy of the key so close() can overwrite it
+            self._encryption_key = bytearray(key)
             self._crypto = VaultCrypto()
 
             # Create tables if needed
             self._create_tables()
 
+            # Continue the nonce counter from the persisted high-water mark
+            row = self._conn.execute(
+                "SELECT value FROM vault_meta WHERE key = 'nonce_counter'"
+            ).fetchone()
+            self._nonce_ctr = self._nonce_limit = int(row[0]) if row else 0
+            self._nonce_fixed = os.urandom(4)
+
+            if not self._verify_key(key):
+                raise ValueError("Invalid password")
+
             self._is_open = True
             logger.info("VaultStore opened successfully (application-level encryption)")
-            return Result.success(True)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"Failed to open vault: {e}"
             logger.error(error_msg)
-            if self._conn:
-                self._conn.close()
-                self._conn = None
-            self._encryption_key = None
+            self._close_connections()
+            self._erase_key()
             self._crypto = None
+            self._nonce_fixed = None
             return Result.failure(error_msg)
 
+    def _verify_key(self, key: bytes) -> bool:
+        """
+        Check the key against the stored key check value.
+
+        Vaults without one (new, or created before key checks) get it
+        written, after confirming the key decrypts an existing secret.
+
+        Args:
+            key: 32-byte encryption key
+
+        Returns:
+            bool: True if the key belongs to this vault
+        """
+        check = hmac.new(key, _KEY_CHECK_LABEL, "sha256").hexdigest()
+        row = self._conn.execute(
+            "SELECT value FROM vault_meta WHERE key = 'key_check'"
+        ).fetchone()
+
+        if row:
+            # Constant time, so the comparison doesn't leak a matching prefix
+            return hmac.compare_digest(row[0], check)
+
+        sample = self._conn.execute("SELECT value_encrypted FROM secrets LIMIT 1").fetchone()
+        if sample and self._crypto.decrypt(
+            sample[0][:12], sample[0][12:], self._encryption_key
+        ).is_failure():
+            return False
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO vault_meta (key, value) VALUES ('key_check', ?)", (check,)
+        )
+        self._conn.commit()
+        return True
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         if not self._conn:
             return
 
-        self._conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS secrets (
-                name TEXT PRIMARY KEY,
-                value_encrypted BLOB NOT NULL,
-                metadata TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                accessed_at TEXT,
-                access_count INTEGER DEFAULT 0
-            )
-        """
-        )
+        self._conn.execute(_CREATE_SECRETS_SQL)
+
+        table = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'secrets'"
+        ).fetchone()
+        if table and "WITHOUT ROWID" not in table[0].upper():
+            self._conn.executescript(_MIGRATE_SECRETS_SQL)
+            logger.info("Vault secrets table migrated")
 
         self._conn.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_secrets_created
-            ON secrets(created_at)
+            CREATE TABLE IF NOT EXISTS vault_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
         """
         )
 
         self._conn.commit()
         logger.debug("Database tables created (with encrypted values)")
 
+    def _next_nonce(self) -> bytes | None:
+        """
+        Get the next AES-GCM nonce for the open key.
+
+        Returns:
+            bytes | None: 12-byte nonce, or None to let crypto pick a random one
+        """
+        nonces = self._next_nonces(1)
+        return nonces[0] if nonces else None
+
+    def _next_nonces(self, count: int) -> list[bytes] | None:
+        """
+        Reserve a run of AES-GCM nonces for the open key.
+
+        Args:
+            count: Number of nonces needed
+
+        Returns:
+            list[bytes] | None: 12-byte nonces, or None to let crypto pick random ones
+        """
+        if self._nonce_fixed is None or not self._conn:
+            return None
+
+        with self._nonce_lock:
+            if self._nonce_ctr + count > self._nonce_limit:
+                # Persist the new high-water mark before handing out nonces below it
+                self._nonce_limit = self._nonce_ctr + count + _NONCE_RESERVE
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO vault_meta (key, value) VALUES ('nonce_counter', ?)",
+                    (str(self._nonce_limit),),
+                )
+                self._conn.commit()
+
+            first = self._nonce_ctr + 1
+            self._nonce_ctr += count
+
+        fixed = self._nonce_fixed
+        return [fixed + ctr.to_bytes(8, "big") for ctr in range(first, first + count)]
+
     def close(self) -> None:
-        """Close the database connection and clear encryption key from memory."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close the database connections and clear encryption key from memory."""
+        if self._is_open:
+            self._flush_access_stats()
+        self._cache_clear()
+        self._close_connections()
 
-        # Securely erase encryption key from memory
-        if self._encryption_key is not None:
-            # Overwrite with zeros before deletion
-            self._encryption_key = b"\x00" * len(self._encryption_key)
-            del self._encryption_key
-            self._encryption_key = None
+        self._erase_key()
 
+        if self._crypto is not None:
+            self._crypto.clear_key_cache()
         self._crypto = None
+        self._nonce_fixed = None
         self._is_open = False
         logger.info("VaultStore closed (encryption key erased)")
 
+    def _erase_key(self) -> None:
+        """Overwrite the encryption key in place and drop it."""
+        if self._encryption_key is not None:
+            VaultCrypto.secure_erase(self._encryption_key)
+        self._encryption_key = None
+
     def is_open(self) -> bool:
         """Check if the store is open."""
         return self._is_open
 
+    @staticmethod
+    def _dump_metadata(metadata: dict | None) -> str:
+        """Serialize metadata for storage (most secrets have none)."""
+        return orjson.dumps(metadata).decode() if metadata else _EMPTY_META_JSON
+
+    def _encrypt_value(self, value: str) -> bytes:
+        """
+        Encrypt a secret value into its stored form.
+
+        Args:
+            value: Plaintext secret value
+
+        Returns:
+            bytes: nonce (12 bytes) + ciphertext
+
+        Raises:
+            ValueError: If encryption fails
+        """
+        plaintext = bytearray(value, "utf-8")
+        try:
+            encrypt_result = self._crypto.encrypt(
+                plaintext, self._encryption_key, nonce=self._next_nonce()
+            )
+        finally:
+            VaultCrypto.secure_erase(plaintext)
+        if encrypt_result.is_failure():
+            raise ValueError(f"Encryption failed: {encrypt_result.error}")
+
+        return b"".join(encrypt_result.data)
+
     def put_secret(
         self,
         name: str,
@@ -165,53 +412,86 @@ class VaultStore:
             return Result.failure("Encryption not initialized")
 
         try:
-            now = datetime.utcnow().isoformat()
+            now = int(time.time())
+            metadata = metadata or {}
+            value_encrypted = self._encrypt_value(value)
+
+            # Insert or update in one statement; RETURNING gives back the
+            # columns an update keeps, so the row doesn't need re-reading
+            row = self._conn.execute(
+                _UPSERT_SQL + " RETURNING created_at, accessed_at, access_count",
+                (name, value_encrypted, self._dump_metadata(metadata), now, now),
+            ).fetchone()
+            self._conn.commit()
+            self._cache_clear()
+            logger.info("Secret stored (encrypted): %s", name)
 
-            # Encrypt the value
-            plaintext = value.encode("utf-8")
-            encrypt_result = self._crypto.encrypt(plaintext, self._encryption_key)
+            with self._access_lock:
+                pending_count, pending_time = self._pending_access.get(name, (0, None))
+            last_access = pending_time or row["accessed_at"]
 
-            if encrypt_result.is_failure():
-                return Result.failure(f"Encryption failed: {encrypt_result.error}")
+            entry = SecretEntry(
+                name=name,
+                value=value,
+                metadata=SecretMetadata(
+                    created_at=_to_datetime(row["created_at"]),
+                    updated_at=_to_datetime(now),
+                    accessed_at=_to_datetime(last_access),
+                    access_count=row["access_count"] + pending_count,
+                    **metadata,
+                ),
+            )
+            return Result.success(entry)
+
+        except Exception as e:
+            error_msg = f"Failed to store secret: {e}"
+            logger.error(error_msg)
+            return Result.failure(error_msg)
 
-            nonce, ciphertext = encrypt_result.data
-            # Store as: nonce (12 bytes) + ciphertext
-            value_encrypted = nonce + ciphertext
+    def put_secrets(self, items: list[tuple[str, str, dict | None]]) -> Result[int]:
+        """
+        Store several secrets in a single transaction.
 
-            # Check if exists
-            existing = self._conn.execute(
-                "SELECT * FROM secrets WHERE name = ?", (name,)
-            ).fetchone()
+        Args:
+            items: (name, value, metadata) tuples
 
-            if existing:
-                # Update existing
-                self._conn.execute(
-                    """
-                    UPDATE secrets
-                    SET value_encrypted = ?, metadata = ?, updated_at = ?
-                    WHERE name = ?
-                    """,
-                    (value_encrypted, json.dumps(metadata or {}), now, name),
-                )
-                logger.info(f"Secret updated (encrypted): {name}")
-            else:
-                # Insert new
-                self._conn.execute(
-                    """
-                    INSERT INTO secrets (name, value_encrypted, metadata, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (name, value_encrypted, json.dumps(metadata or {}), now, now),
+        Returns:
+            Result[int]: Number of secrets stored or error
+        """
+        if not self._is_open or not self._conn:
+            return Result.failure("Vault is not open")
+
+        if not self._crypto or not self._encryption_key:
+            return Result.failure("Encryption not initialized")
+
+        try:
+            now = int(time.time())
+            # Encrypt everything first so the nonce reservation commits before the batch
+            plaintexts = [bytearray(value, "utf-8") for _, value, _ in items]
+            try:
+                encrypt_result = self._crypto.encrypt_batch(
+                    plaintexts, self._encryption_key, nonces=self._next_nonces(len(items))
                 )
-                logger.info(f"Secret created (encrypted): {name}")
+            finally:
+                for plaintext in plaintexts:
+                    VaultCrypto.secure_erase(plaintext)
+            if encrypt_result.is_failure():
+                raise ValueError(f"Encryption failed: {encrypt_result.error}")
 
-            self._conn.commit()
+            rows = [
+                (name, b"".join(pair), self._dump_metadata(metadata), now, now)
+                for (name, _, metadata), pair in zip(items, encrypt_result.data)
+            ]
+
+            with self._conn:
+                self._conn.executemany(_UPSERT_SQL, rows)
+            self._cache_clear()
 
-            # Retrieve and return
-            return self.get_secret(name)
+            logger.info("Stored %d secrets (encrypted)", len(rows))
+            return Result.success(len(rows))
 
         except Exception as e:
-            error_msg = f"Failed to store secret: {e}"
+            error_msg = f"Failed to store secrets: {e}"
             logger.error(error_msg)
             return Result.failure(error_msg)
 
@@ -232,46 +512,53 @@ class VaultStore:
             return Result.failure("Encryption not initialized")
 
         try:
-            row = self._conn.execute("SELECT * FROM secrets WHERE name = ?", (name,)).fetchone()
+            cached = self._cache_get(name)
+            if cached:
+                row, value_plaintext = cached
+            else:
+                generation = self._cache_gen
+                row = self._conn.execute(
+                    "SELECT * FROM secrets WHERE name = ?", (name,)
+                ).fetchone()
 
-            if not row:
-                return Result.failure(f"Secret not found: {name}")
+                if not row:
+                    return Result.failure(f"Secret not found: {name}")
 
-            # Decrypt the value
-            value_encrypted = row["value_encrypted"]
+                # Decrypt the value
+                value_encrypted = memoryview(row["value_encrypted"])
 
-            # Extract nonce (first 12 bytes) and ciphertext (rest)
-            nonce = value_encrypted[:12]
-            ciphertext = value_encrypted[12:]
+                # Extract nonce (first 12 bytes) and ciphertext (rest); the
+                # ciphertext stays a view so the body isn't copied
+                nonce = bytes(value_encrypted[:12])
+                ciphertext = value_encrypted[12:]
 
-            decrypt_result = self._crypto.decrypt(nonce, ciphertext, self._encryption_key)
+                decrypt_result = self._crypto.decrypt(nonce, ciphertext, self._encryption_key)
 
-            if decrypt_result.is_failure():
-                return Result.failure(f"Decryption failed: {decrypt_result.error}")
+                if decrypt_result.is_failure():
+                    return Result.failure(f"Decryption failed: {decrypt_result.error}")
 
-            value_plaintext = decrypt_result.data.decode("utf-8")
+                value_plaintext = decrypt_result.data.decode("utf-8")
+                self._cache_put(name, row, value_plaintext, generation)
 
-            # Update access stats
-            now = datetime.utcnow().isoformat()
-            self._conn.execute(
-                """
-                UPDATE secrets
-                SET accessed_at = ?, access_count = access_count + 1
-                WHERE name = ?
-                """,
-                (now, name),
-            )
-            self._conn.commit()
+            # Count the access in memory; the row is updated on the next flush
+            now = int(time.time())
+            with self._access_lock:
+                pending_count, pending_time = self._pending_access.get(name, (0, None))
+                self._pending_access[name] = (pending_count + 1, now)
+                flush_due = time.monotonic() - self._last_access_flush >= _ACCESS_FLUSH_INTERVAL
+            if flush_due:
+                self._flush_access_stats()
+
+            last_access = pending_time or row["accessed_at"]
 
             # Parse metadata
-            metadata_dict = json.loads(row["metadata"]) if row["metadata"] else {}
+            metadata_dict = orjson.loads(row["metadata"]) if row["metadata"] else {}
             metadata = SecretMetadata(
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-                accessed_at=datetime.fromisoformat(row["accessed_at"])
-                if row["accessed_at"]
-                else None,
-                access_count=row["access_count"] + 1,  # Include current access
+                created_at=_to_datetime(row["created_at"]),
+                updated_at=_to_datetime(row["updated_at"]),
+                accessed_at=_to_datetime(last_access),
+                # Include unflushed reads and the current access
+                access_count=row["access_count"] + pending_count + 1,
                 **metadata_dict,
             )
 
@@ -281,7 +568,7 @@ class VaultStore:
                 metadata=metadata,
             )
 
-            logger.debug(f"Secret retrieved (decrypted): {name}")
+            logger.debug("Secret retrieved (decrypted): %s", name)
             return Result.success(entry)
 
         except Exception as e:
@@ -289,6 +576,58 @@ class VaultStore:
             logger.error(error_msg)
             return Result.failure(error_msg)
 
+    def _cache_get(self, name: str) -> tuple[sqlite3.Row, str] | None:
+        """Return a cached (row, value) for a secret if present and fresh."""
+        with self._cache_lock:
+            cached = self._cache.get(name)
+            if cached is None:
+                return None
+            if cached[2] <= time.monotonic():
+                del self._cache[name]
+                return None
+            self._cache.move_to_end(name)
+            return cached[0], cached[1]
+
+    def _cache_put(self, name: str, row: sqlite3.Row, value: str, generation: int) -> None:
+        """Cache a decrypted secret unless a write happened since it was read."""
+        with self._cache_lock:
+            if generation != self._cache_gen:
+                return
+            self._cache[name] = (row, value, time.monotonic() + _CACHE_TTL)
+            self._cache.move_to_end(name)
+            if len(self._cache) > _CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+
+    def _cache_clear(self) -> None:
+        """Drop all cached secrets (on writes, access-stat flushes and close)."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_gen += 1
+
+    def _flush_access_stats(self) -> None:
+        """Write pending access counts and times in one transaction."""
+        with self._access_lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._last_access_flush = time.monotonic()
+        # Cached rows carry the stored access_count, which this changes
+        self._cache_clear()
+
+        if not pending or not self._conn:
+            return
+
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    """
+                    UPDATE secrets
+                    SET access_count = access_count + ?, accessed_at = ?
+                    WHERE name = ?
+                    """,
+                    [(count, accessed_at, name) for name, (count, accessed_at) in pending.items()],
+                )
+        except Exception as e:
+            logger.warning("Failed to write access stats: %s", e)
+
     def list_secrets(self) -> Result[list[str]]:
         """
         List all secret names.
@@ -301,9 +640,11 @@ class VaultStore:
 
         try:
             cursor = self._conn.execute("SELECT name FROM secrets ORDER BY name")
-            names = [row["name"] for row in cursor.fetchall()]
+            # Plain tuples: no sqlite3.Row per name
+            cursor.row_factory = None
+            names = [name for (name,) in cursor.fetchall()]
 
-            logger.debug(f"Listed {len(names)} secrets")
+            logger.debug("Listed %d secrets", len(names))
             return Result.success(names)
 
         except Exception as e:
@@ -331,8 +672,11 @@ class VaultStore:
                 return Result.failure(f"Secret not found: {name}")
 
             self._conn.commit()
-            logger.info(f"Secret deleted: {name}")
-            return Result.success(True)
+            self._cache_clear()
+            with self._access_lock:
+                self._pending_access.pop(name, None)
+            logger.info("Secret deleted: %s", name)
+            return RESULT_TRUE
 
         except Exception as e:
             error_msg = f"Failed to delete secret: {e}"
@@ -353,6 +697,7 @@ class VaultStore:
 
 # Singleton instance
 _vault_store: VaultStore | None = None
+_vault_store_lock = threading.Lock()
 
 
 def get_vault_store(
@@ -372,8 +717,11 @@ def get_vault_store(
         VaultStore: Singleton instance
     """
     global _vault_store
-    if _vault_store is None:
-        _vault_store = VaultStore(
-            db_path=db_path,
-        )
+    if _vault_store is not None:
+        return _vault_store
+    with _vault_store_lock:
+        if _vault_store is None:
+            _vault_store = VaultStore(
+                db_path=db_path,
+            )
     return _vault_store
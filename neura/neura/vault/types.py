@@ -4,11 +4,16 @@ Vault types and data models.
 Defines Pydantic models for vault operations and secrets.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
 
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
+
+# Longer passwords are rejected before they reach the (deliberately slow) KDF
+MAX_PASSWORD_LENGTH = 1024
+
+# Values allowed in user-supplied secret metadata
+MetadataValue = str | int | float | bool | list[str] | None
 
 
 class VaultState(str, Enum):
@@ -22,8 +27,12 @@ class VaultState(str, Enum):
 class SecretMetadata(BaseModel):
     """Metadata for a secret."""
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Stored metadata may carry keys older releases accepted, so extras are
+    # dropped rather than rejected
+    model_config = ConfigDict(frozen=True)
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     accessed_at: datetime | None = None
     access_count: int = Field(default=0)
     tags: list[str] = Field(default_factory=list)
@@ -33,6 +42,8 @@ class SecretMetadata(BaseModel):
 class SecretEntry(BaseModel):
     """A secret stored in the vault."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(..., description="Secret name (unique identifier)")
     value: SecretStr = Field(..., description="Secret value (encrypted)")
     metadata: SecretMetadata = Field(default_factory=SecretMetadata)
@@ -41,6 +52,8 @@ class SecretEntry(BaseModel):
 class VaultStatus(BaseModel):
     """Vault status information."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     state: VaultState = Field(..., description="Current vault state")
     total_secrets: int = Field(default=0, description="Number of secrets stored")
     last_unlock: datetime | None = Field(None, description="Last unlock timestamp")
@@ -52,25 +65,41 @@ class VaultStatus(BaseModel):
 class UnlockRequest(BaseModel):
     """Request to unlock the vault."""
 
-    password: SecretStr = Field(..., min_length=8, description="Master password")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    password: SecretStr = Field(
+        ..., min_length=8, max_length=MAX_PASSWORD_LENGTH, description="Master password"
+    )
 
 
 class PutSecretRequest(BaseModel):
     """Request to store a secret."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(..., min_length=1, description="Secret name")
     value: SecretStr = Field(..., min_length=1, description="Secret value")
-    metadata: dict[str, Any] | None = Field(None, description="Optional metadata")
+    metadata: dict[str, MetadataValue] | None = Field(None, description="Optional metadata")
 
 
 class GetSecretResponse(BaseModel):
     """Response for getting a secret."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     value: str  # Decrypted value (only returned when vault unlocked)
     metadata: SecretMetadata
 
 
+class MessageResponse(BaseModel):
+    """Response carrying a status message."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    message: str
+
+
 class VaultConfig(BaseModel):
     """Configuration for Vault module."""
 
@@ -79,5 +108,8 @@ class VaultConfig(BaseModel):
     argon2_memory: int = Field(default=65536, description="Argon2 memory cost in KB (64MB)")
     argon2_iterations: int = Field(default=3, description="Argon2 time cost")
     argon2_parallelism: int = Field(default=4, description="Argon2 parallelism")
+    kdf_cache_ttl: float = Field(
+        default=0.0, ge=0, description="Seconds to reuse a derived key on re-unlock (0 = off)"
+    )
     sqlcipher_page_size: int = Field(default=4096, description="SQLCipher page size")
     sqlcipher_kdf_iter: int = Field(default=256000, description="SQLCipher KDF iterations")
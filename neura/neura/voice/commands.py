@@ -5,43 +5,135 @@ Maps natural language voice commands to Flow command syntax.
 """
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
 from neura.flow.types import FlowCommand
 
 logger = logging.getLogger(__name__)
 
+# Trie key marking the end of a phrase (never an input character)
+_END = ""
 
-class VoiceCommandParser:
+# Typographic apostrophes from speech-to-text, mapped to the ASCII one
+_APOSTROPHES = str.maketrans({"\u2019": "'", "\u02bc": "'"})
+
+
+def _build_trie(phrases: Mapping[str, Any]) -> dict:
     """
-    Parser for voice commands with NLP support.
+    Build a prefix trie of nested dicts from phrase -> value pairs.
 
-    Converts natural language voice input into FlowCommand objects.
-    Uses LLM-based NLP for intelligent intent extraction.
+    Args:
+        phrases: Phrases to index and the value each one maps to
 
-    Example:
-        >>> parser = VoiceCommandParser()
-        >>> cmd = await parser.parse("neura, can you check my emails?")
-        >>> print(cmd.name)  # "applescript"
-        >>> print(cmd.args)  # ["mail", "list"]
+    Returns:
+        dict: Root node; a phrase's value is stored under _END at its last character
     """
-    
-    def __init__(self):
-        """Initialize parser with NLP support."""
-        self.use_nlp = True  # Enable NLP by default
+    root: dict = {}
+    for phrase, value in phrases.items():
+        node = root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[_END] = value
+    return root
 
-    # Wake words (English + French)
-    HOTWORDS = [
-        "neura",
-        "hey neura",
-        "ok neura",
-        "hello neura",
-        "salut neura",
-        "bonjour neura",
-        "hé neura",
-    ]
 
-    # Intent mapping: keyword → command
-    INTENT_MAP = {
+def _longest_prefix(trie: dict, text: str) -> tuple[Any, int]:
+    """
+    Find the longest phrase in a trie that text starts with.
+
+    Args:
+        trie: Root node from _build_trie
+        text: Input text
+
+    Returns:
+        tuple: (value, length) of the longest match, or (None, 0)
+    """
+    node = trie
+    match, length = None, 0
+    for index, char in enumerate(text):
+        node = node.get(char)
+        if node is None:
+            break
+        if _END in node:
+            match, length = node[_END], index + 1
+    return match, length
+
+
+# Common filler words (English + French), stripped before intent matching
+_FILLERS = (
+    # English
+    "please",
+    "can you",
+    "could you",
+    "would you",
+    "i want to",
+    "i'd like to",
+    # French
+    "s'il te plaît",
+    "s'il vous plaît",
+    "peux-tu",
+    "pouvez-vous",
+    "je veux",
+    "je voudrais",
+    "j'aimerais",
+)
+_FILLER_TRIE = _build_trie(dict.fromkeys(_FILLERS, True))
+
+# Words that open a question (English + French)
+_QUESTION_WORDS = frozenset(
+    [
+        # English
+        "what",
+        "who",
+        "where",
+        "when",
+        "why",
+        "how",
+        "can",
+        "could",
+        "would",
+        "should",
+        "is",
+        "are",
+        "do",
+        "does",
+        "did",
+        # French
+        "qu'est-ce",
+        "quel",
+        "quelle",
+        "quels",
+        "quelles",
+        "qui",
+        "où",
+        "quand",
+        "pourquoi",
+        "comment",
+        "est-ce",
+        "peux-tu",
+        "pouvez-vous",
+        "c'est quoi",
+    ]
+)
+
+
+# Wake words (English + French)
+HOTWORDS = (
+    "neura",
+    "hey neura",
+    "ok neura",
+    "hello neura",
+    "salut neura",
+    "bonjour neura",
+    "hé neura",
+)
+_HOTWORD_TRIE = _build_trie(dict.fromkeys(HOTWORDS, True))
+
+# Intent mapping: keyword → command
+INTENT_MAP = MappingProxyType(
+    {
         # System commands
         "help": "/help",
         "show help": "/help",
@@ -141,6 +233,33 @@ class VoiceCommandParser:
         "quitter": "/exit",
         "au revoir": "/exit",
     }
+)
+
+# Walked once per utterance instead of testing every intent with startswith
+_INTENT_TRIE = _build_trie(INTENT_MAP)
+
+
+class VoiceCommandParser:
+    """
+    Parser for voice commands with NLP support.
+
+    Converts natural language voice input into FlowCommand objects.
+    Uses LLM-based NLP for intelligent intent extraction.
+
+    Example:
+        >>> parser = VoiceCommandParser()
+        >>> cmd = await parser.parse("neura, can you check my emails?")
+        >>> print(cmd.name)  # "applescript"
+        >>> print(cmd.args)  # ["mail", "list"]
+    """
+    
+    def __init__(self):
+        """Initialize parser with NLP support."""
+        self.use_nlp = True  # Enable NLP by default
+
+    # Also reachable from the parser (module constants, shared and read-only)
+    HOTWORDS = HOTWORDS
+    INTENT_MAP = INTENT_MAP
 
     def __init__(self) -> None:
         """Initialize voice command parser."""
@@ -166,7 +285,9 @@ class VoiceCommandParser:
             return FlowCommand.parse("")
 
         text_original = text
-        text_lower = text.lower().strip()
+        # Lowercase, unify apostrophes and collapse whitespace in one pass,
+        # so phrase tables need a single spelling of each entry
+        text_lower = " ".join(text.lower().translate(_APOSTROPHES).split())
 
         # Remove hotword prefix
         text_lower = self._remove_hotword(text_lower)
@@ -175,14 +296,14 @@ class VoiceCommandParser:
         text_lower = self._remove_fillers(text_lower)
 
         # Check for direct intent match
-        command = self._match_intent(text_lower)
+        command, matched_len = self._match_intent(text_lower)
         if command:
-            # Extract arguments (everything after the intent)
-            args = self._extract_args(text_lower, command)
+            # Arguments are everything after the intent
+            args = text_lower[matched_len:].strip()
             return FlowCommand.parse(f"{command} {args}".strip())
 
         # Check for "ask" intent (questions)
-        if self._is_question(text_lower):
+        if self._is_question(text_lower, text_lower.partition(" ")[0]):
             return FlowCommand.parse(f"/ask {text_original}")
 
         # Default: natural language → /ask
@@ -190,118 +311,50 @@ class VoiceCommandParser:
 
     def _remove_hotword(self, text: str) -> str:
         """Remove hotword from beginning of text."""
-        for hotword in self.HOTWORDS:
-            if text.startswith(hotword):
-                text = text[len(hotword) :].strip()
-                # Remove punctuation after hotword
-                if text.startswith(","):
-                    text = text[1:].strip()
-                break
+        found, length = _longest_prefix(_HOTWORD_TRIE, text)
+        if found:
+            text = text[length:].strip()
+            # Remove punctuation after hotword
+            if text.startswith(","):
+                text = text[1:].strip()
         return text
 
     def _remove_fillers(self, text: str) -> str:
-        """Remove common filler words (English + French)."""
-        fillers = [
-            # English
-            "please",
-            "can you",
-            "could you",
-            "would you",
-            "i want to",
-            "i'd like to",
-            # French
-            "s'il te plaît",
-            "s'il vous plaît",
-            "peux-tu",
-            "pouvez-vous",
-            "je veux",
-            "je voudrais",
-            "j'aimerais",
-        ]
-        for filler in fillers:
-            if text.startswith(filler):
-                text = text[len(filler) :].strip()
+        """Remove leading filler words (English + French), e.g. "could you please"."""
+        found, length = _longest_prefix(_FILLER_TRIE, text)
+        while found:
+            text = text[length:].strip()
+            found, length = _longest_prefix(_FILLER_TRIE, text)
         return text
 
-    def _match_intent(self, text: str) -> str:
+    def _match_intent(self, text: str) -> tuple[str | None, int]:
         """
-        Match text against intent map.
+        Match text against intent map (longest intent wins).
 
         Returns:
-            str: Matched command or None
+            tuple: (matched command or None, length of the matched intent)
         """
-        for intent, command in self.INTENT_MAP.items():
-            if text.startswith(intent):
-                return command
-        return None
+        return _longest_prefix(_INTENT_TRIE, text)
 
-    def _extract_args(self, text: str, command: str) -> str:
+    def _is_question(self, text: str, first_word: str) -> bool:
         """
-        Extract arguments after intent.
+        Check if text is a question (English + French).
 
         Args:
-            text: Input text
-            command: Matched command
-
-        Returns:
-            str: Arguments string
+            text: Normalized input text
+            first_word: First word of text
         """
-        # Find the intent that matched
-        for intent, cmd in self.INTENT_MAP.items():
-            if cmd == command and text.startswith(intent):
-                # Return everything after the intent
-                args = text[len(intent) :].strip()
-                return args
-        return ""
-
-    def _is_question(self, text: str) -> bool:
-        """Check if text is a question (English + French)."""
-        question_words = [
-            # English
-            "what",
-            "who",
-            "where",
-            "when",
-            "why",
-            "how",
-            "can",
-            "could",
-            "would",
-            "should",
-            "is",
-            "are",
-            "do",
-            "does",
-            "did",
-            # French
-            "qu'est-ce",
-            "quel",
-            "quelle",
-            "quels",
-            "quelles",
-            "qui",
-            "où",
-            "quand",
-            "pourquoi",
-            "comment",
-            "est-ce",
-            "peux-tu",
-            "pouvez-vous",
-            "c'est quoi",
-        ]
-
         # Check for question mark
         if "?" in text:
             return True
 
         # Check for question words at start
-        first_word = text.split()[0] if text.split() else ""
-        return first_word in question_words
+        return first_word in _QUESTION_WORDS
 
     def get_hotwords(self) -> list[str]:
         """Get list of hotwords."""
-        return self.HOTWORDS.copy()
+        return list(HOTWORDS)
 
     def get_intents(self) -> dict[str, str]:
         """Get intent mapping."""
-        return self.INTENT_MAP.copy()
+        return dict(INTENT_MAP)
@@ -4,14 +4,40 @@ Natural Language Parsing - Understand intent from natural language.
 Uses Cortex to extract intent from free-form text.
 """
 
-import json
 import logging
-from dataclasses import dataclass
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+import httpx
+import orjson
 
 from neura.core.types import Result
 
 logger = logging.getLogger(__name__)
 
+CORTEX_URL = "http://localhost:8000"
+
+# Confident parses kept per normalized utterance, so repeats skip Cortex
+_CACHE_MAX_SIZE = 256
+_CACHE_MIN_CONFIDENCE = 0.7
+
+# Keyword groups for the fallback matcher (substring matches, like "mail" in "emails")
+_FALLBACK_KEYWORDS = {
+    "mail": ("email", "inbox", "mail"),
+    "read": ("read", "check", "show"),
+    "battery": ("battery", "power", "charge"),
+    "files": ("files", "folder", "finder"),
+    "open": ("open",),
+    "calendar": ("calendar", "meeting", "event"),
+}
+
+# One alternation with a named group per keyword group, so a single scan
+# finds every group the text mentions
+_FALLBACK_RE = re.compile(
+    "|".join(f"(?P<{group}>{'|'.join(words)})" for group, words in _FALLBACK_KEYWORDS.items())
+)
+
 
 @dataclass
 class Intent:
@@ -68,10 +94,35 @@ Examples:
 "What's my battery at?" → {{"action": "get_battery", "category": "system", "parameters": {{}}, "confidence": 0.98}}
 "Open my documents folder" → {{"action": "open_folder", "category": "finder", "parameters": {{"folder": "Documents"}}, "confidence": 0.92}}
 """
+
+    # The prompt around the user text, unescaped once so parse() concatenates
+    # instead of running str.format on every call
+    _PROMPT_PREFIX, _PROMPT_SUFFIX = (
+        part.replace("{{", "{").replace("}}", "}") for part in INTENT_PROMPT.split("{text}")
+    )
     
     def __init__(self):
         """Initialize NLP parser."""
+        self._client: httpx.AsyncClient | None = None
+        self._cache: OrderedDict[str, Intent] = OrderedDict()
         logger.info("NaturalLanguageParser initialized")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared Cortex client, creating it on first use."""
+        if self._client is None:
+            # Kept open so repeat parses reuse the keep-alive connection
+            self._client = httpx.AsyncClient(
+                base_url=CORTEX_URL,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the Cortex client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def parse(self, text: str) -> Result[Intent]:
         """
@@ -86,55 +137,65 @@ Examples:
         if not text or not text.strip():
             return Result.failure("Empty input")
         
+        cache_key = text.strip().lower().rstrip("?!. ")
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            # Callers get their own parameters dict
+            return Result.success(replace(cached, parameters=dict(cached.parameters)))
+        
         try:
             # Use Cortex to parse
-            import httpx
+            prompt = self._PROMPT_PREFIX + text + self._PROMPT_SUFFIX
             
-            prompt = self.INTENT_PROMPT.format(text=text)
+            response = await self._get_client().post(
+                "/api/cortex/generate",
+                json={
+                    "prompt": prompt,
+                    "temperature": 0.1,  # Low temp for consistent parsing
+                    "max_tokens": 200,
+                    "stream": False
+                }
+            )
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    "http://localhost:8000/api/cortex/generate",
-                    json={
-                        "prompt": prompt,
-                        "temperature": 0.1,  # Low temp for consistent parsing
-                        "max_tokens": 200,
-                        "stream": False
-                    }
-                )
+            if response.status_code != 200:
+                return Result.failure(f"Cortex error: {response.status_code}")
+            
+            data = orjson.loads(response.content)
+            llm_response = data.get("text", "").strip()
+            
+            # Parse JSON response
+            try:
+                # Extract JSON from response (might have extra text)
+                json_start = llm_response.find("{")
+                json_end = llm_response.rfind("}") + 1
                 
-                if response.status_code != 200:
-                    return Result.failure(f"Cortex error: {response.status_code}")
+                if json_start == -1 or json_end == 0:
+                    return Result.failure("No JSON in response")
                 
-                data = response.json()
-                llm_response = data.get("text", "").strip()
+                json_str = llm_response[json_start:json_end]
+                intent_data = orjson.loads(json_str)
+                
+                intent = Intent(
+                    action=intent_data.get("action", "unknown"),
+                    category=intent_data.get("category", "unknown"),
+                    parameters=intent_data.get("parameters", {}),
+                    confidence=intent_data.get("confidence", 0.5)
+                )
                 
-                # Parse JSON response
-                try:
-                    # Extract JSON from response (might have extra text)
-                    json_start = llm_response.find("{")
-                    json_end = llm_response.rfind("}") + 1
-                    
-                    if json_start == -1 or json_end == 0:
-                        return Result.failure("No JSON in response")
-                    
-                    json_str = llm_response[json_start:json_end]
-                    intent_data = json.loads(json_str)
-                    
-                    intent = Intent(
-                        action=intent_data.get("action", "unknown"),
-                        category=intent_data.get("category", "unknown"),
-                        parameters=intent_data.get("parameters", {}),
-                        confidence=intent_data.get("confidence", 0.5)
-                    )
-                    
-                    logger.info(f"Parsed intent: {intent.action} (confidence: {intent.confidence})")
-                    return Result.success(intent)
+                logger.info(f"Parsed intent: {intent.action} (confidence: {intent.confidence})")
                 
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON parse error: {e}")
-                    logger.debug(f"Response was: {llm_response}")
-                    return Result.failure(f"Failed to parse intent: {e}")
+                # Low-confidence parses aren't cached, so they're retried
+                if intent.confidence > _CACHE_MIN_CONFIDENCE:
+                    self._cache[cache_key] = replace(intent, parameters=dict(intent.parameters))
+                    if len(self._cache) > _CACHE_MAX_SIZE:
+                        self._cache.popitem(last=False)
+                return Result.success(intent)
+            
+            except orjson.JSONDecodeError as e:
+                logger.error(f"JSON parse error: {e}")
+                logger.debug(f"Response was: {llm_response}")
+                return Result.failure(f"Failed to parse intent: {e}")
         
         except Exception as e:
             logger.error(f"NLP parse error: {e}")
@@ -162,11 +223,11 @@ Examples:
     
     def _keyword_fallback(self, text: str) -> Result[Intent]:
         """Fallback to simple keyword matching."""
-        text_lower = text.lower()
+        found = {match.lastgroup for match in _FALLBACK_RE.finditer(text.lower())}
         
         # Email keywords
-        if any(word in text_lower for word in ["email", "inbox", "mail"]):
-            if any(word in text_lower for word in ["read", "check", "show"]):
+        if "mail" in found:
+            if "read" in found:
                 return Result.success(Intent(
                     action="list_emails",
                     category="mail",
@@ -175,7 +236,7 @@ Examples:
                 ))
         
         # Battery keywords
-        if any(word in text_lower for word in ["battery", "power", "charge"]):
+        if "battery" in found:
             return Result.success(Intent(
                 action="get_battery",
                 category="system",
@@ -184,8 +245,8 @@ Examples:
             ))
         
         # Files keywords
-        if any(word in text_lower for word in ["files", "folder", "finder"]):
-            if "open" in text_lower:
+        if "files" in found:
+            if "open" in found:
                 return Result.success(Intent(
                     action="open_folder",
                     category="finder",
@@ -201,7 +262,7 @@ Examples:
                 ))
         
         # Calendar keywords
-        if any(word in text_lower for word in ["calendar", "meeting", "event"]):
+        if "calendar" in found:
             return Result.success(Intent(
                 action="list_calendar",
                 category="calendar",
@@ -223,3 +284,11 @@ def get_nlp_parser() -> NaturalLanguageParser:
     if _nlp_parser is None:
         _nlp_parser = NaturalLanguageParser()
     return _nlp_parser
+
+
+async def close_nlp_parser() -> None:
+    """Close the NLP parser's Cortex client, if the parser was created."""
+    global _nlp_parser
+    if _nlp_parser is not None:
+        await _nlp_parser.aclose()
+        _nlp_parser = None
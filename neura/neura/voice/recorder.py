@@ -4,7 +4,9 @@ Audio Recorder - Records audio using sounddevice.
 Provides simple audio recording functionality.
 """
 
+import asyncio
 import logging
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -15,6 +17,9 @@ from neura.core.types import Result
 
 logger = logging.getLogger(__name__)
 
+# Extra time allowed for the device to deliver a recording before giving up
+_CAPTURE_GRACE = 5.0
+
 
 class AudioRecorder:
     """
@@ -38,6 +43,8 @@ class AudioRecorder:
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        # Reused across recordings; grown when a longer one is requested
+        self._buffer = np.empty((0, channels), dtype=np.float32)
 
         logger.info(f"AudioRecorder initialized: {sample_rate}Hz, {channels} channel(s)")
 
@@ -49,7 +56,8 @@ class AudioRecorder:
             duration: Recording duration in seconds
 
         Returns:
-            Result[np.ndarray]: Recorded audio data or error
+            Result[np.ndarray]: Recorded audio data or error. The array is a
+                view of the recorder's buffer, valid until the next recording.
 
         Example:
             >>> recorder = AudioRecorder()
@@ -60,16 +68,7 @@ class AudioRecorder:
         try:
             logger.info(f"Recording audio for {duration}s...")
 
-            # Record audio
-            audio = sd.rec(
-                int(duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype="float32",
-            )
-
-            # Wait for recording to complete
-            sd.wait()
+            audio = self._capture(int(duration * self.sample_rate), duration)
 
             logger.info(f"Recording complete: {len(audio)} samples")
 
@@ -80,6 +79,61 @@ class AudioRecorder:
             logger.error(error_msg)
             return Result.failure(error_msg)
 
+    async def record_async(self, duration: float) -> Result[np.ndarray]:
+        """
+        Record audio without blocking the event loop.
+
+        Args:
+            duration: Recording duration in seconds
+
+        Returns:
+            Result[np.ndarray]: Recorded audio data or error (see record)
+        """
+        return await asyncio.to_thread(self.record, duration)
+
+    def _capture(self, frames: int, duration: float) -> np.ndarray:
+        """
+        Stream frames from the input device into the reusable buffer.
+
+        Args:
+            frames: Number of frames to record
+            duration: Recording duration in seconds (for the timeout)
+
+        Returns:
+            np.ndarray: View of the first frames rows of the buffer
+
+        Raises:
+            TimeoutError: If the device stops delivering audio
+        """
+        if frames <= 0:
+            return self._buffer[:0]
+        if len(self._buffer) < frames:
+            self._buffer = np.empty((frames, self.channels), dtype=np.float32)
+
+        buffer = self._buffer
+        done = threading.Event()
+        written = 0
+
+        def callback(indata: np.ndarray, frame_count: int, time_info, status) -> None:
+            nonlocal written
+            count = min(frame_count, frames - written)
+            buffer[written : written + count] = indata[:count]
+            written += count
+            if written >= frames:
+                done.set()
+                raise sd.CallbackStop
+
+        with sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype="float32",
+            callback=callback,
+        ):
+            if not done.wait(duration + _CAPTURE_GRACE):
+                raise TimeoutError(f"input stopped after {written} of {frames} frames")
+
+        return buffer[:frames]
+
     def save_wav(self, audio: np.ndarray, filename: str) -> Result[str]:
         """
         Save audio to WAV file.
@@ -48,6 +48,19 @@ class TestVaultEndpoints:
         data = response.json()
         assert "unlocked" in data["message"].lower()
 
+    @patch("neura.vault.router.get_vault_manager")
+    def test_unlock_vault_password_too_long(
+        self, mock_get_manager, client: TestClient
+    ) -> None:
+        """Test oversized passwords are rejected without reaching the manager."""
+        response = client.post(
+            "/api/vault/unlock",
+            json={"password": "x" * 1025},
+        )
+
+        assert response.status_code == 422
+        mock_get_manager.assert_not_called()
+
     @patch("neura.vault.router.get_vault_manager")
     def test_unlock_vault_invalid_password(
         self, mock_get_manager, client: TestClient
@@ -127,6 +140,24 @@ class TestVaultEndpoints:
         data = response.json()
         assert "stored" in data["message"].lower()
 
+    @patch("neura.vault.router.get_vault_manager")
+    def test_put_secret_rejects_unknown_fields(
+        self, mock_get_manager, client: TestClient
+    ) -> None:
+        """Test put requests with unexpected fields or nested metadata are rejected."""
+        response = client.post(
+            "/api/vault/put",
+            json={"name": "key", "value": "value", "owner": "me"},
+        )
+        assert response.status_code == 422
+
+        response = client.post(
+            "/api/vault/put",
+            json={"name": "key", "value": "value", "metadata": {"nested": {"a": 1}}},
+        )
+        assert response.status_code == 422
+        mock_get_manager.assert_not_called()
+
     @patch("neura.vault.router.get_vault_manager")
     def test_put_secret_vault_locked(
         self, mock_get_manager, client: TestClient
@@ -169,6 +200,7 @@ class TestVaultEndpoints:
         data = response.json()
         assert data["name"] == "api_key"
         assert data["value"] == "secret_value"
+        assert "created_at" in data["metadata"]
 
     @patch("neura.vault.router.get_vault_manager")
     def test_get_secret_not_found(self, mock_get_manager, client: TestClient) -> None:
@@ -160,6 +160,14 @@ class TestSafariScripts:
         assert 'tell application "Safari"' in script
         assert 'https://example.com' in script
     
+    def test_open_url_new_tab_dispatch(self):
+        """Test open_url dispatches to the tab-specific generators."""
+        assert SafariScripts.open_url("https://example.com") == SafariScripts.open_url_current_tab("https://example.com")
+        script = SafariScripts.open_url("https://example.com", new_tab=True)
+        
+        assert script == SafariScripts.open_url_new_tab("https://example.com")
+        assert 'make new tab' in script
+    
     def test_search_google_generation(self):
         """Test Google search script."""
         script = SafariScripts.search_google("python tutorial")
@@ -175,6 +183,12 @@ class TestSafariScripts:
         assert 'tell application "Safari"' in script
         assert 'do JavaScript' in script
         assert 'document.title' in script
+    
+    def test_execute_javascript_escaping(self):
+        """Test quotes are escaped and real newlines flattened."""
+        script = SafariScripts.execute_javascript('var a = "x";\nalert(a)')
+        
+        assert 'var a = \\"x\\"; alert(a)' in script
 
 
 class TestNotesScripts:
@@ -265,6 +279,15 @@ class TestSystemScripts:
         script = SystemScripts.get_battery()
         
         assert 'pmset -g batt' in script
+        assert script.count('do shell script') == 1
+    
+    def test_get_system_info_single_shell(self):
+        """Test system info gathers everything in one shell call."""
+        script = SystemScripts.get_system_info()
+        
+        assert script.count('do shell script') == 1
+        assert 'sw_vers -productVersion' in script
+        assert 'paragraphs of' in script
     
     def test_take_screenshot_generation(self):
         """Test screenshot script."""
@@ -292,6 +315,15 @@ class TestAppleScriptTemplates:
         assert 'tell application "Safari"' in script
         assert 'activate' in script
     
+    def test_display_dialog_buttons(self):
+        """Test dialog button clause generation."""
+        assert 'buttons' not in AppleScriptTemplates.display_dialog("Hello")
+        assert 'buttons {"OK"}' in AppleScriptTemplates.display_dialog("Hello", buttons=["OK"])
+        
+        script = AppleScriptTemplates.display_dialog("Hello", buttons=["Yes", "No"])
+        assert 'buttons {"Yes", "No"}' in script
+        assert 'display dialog "Hello" with title "Neura"' in script
+    
     def test_keystroke_no_modifiers(self):
         """Test keystroke without modifiers."""
         script = AppleScriptTemplates.keystroke("a")
@@ -305,6 +337,14 @@ class TestAppleScriptTemplates:
         
         assert 'keystroke "c"' in script
         assert 'command down' in script
+    
+    def test_keystroke_modifier_order_independent(self):
+        """Test modifier clauses are canonical regardless of input order."""
+        script_a = AppleScriptTemplates.keystroke("z", modifiers=["shift", "command"])
+        script_b = AppleScriptTemplates.keystroke("z", modifiers=["command", "shift"])
+        
+        assert script_a == script_b
+        assert 'using {command down, shift down}' in script_a
 
 
 @pytest.mark.integration
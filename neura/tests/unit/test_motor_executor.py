@@ -1,5 +1,7 @@
 """Tests for motor executor."""
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from neura.motor.executor import MotorExecutor
@@ -145,6 +147,28 @@ class TestMotorExecutorIntegration:
             result = await executor.execute(action)
             assert result.is_success()
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_stops_at_confirmation(self):
+        """Test batch execution stops at the first non-successful action."""
+        executor = MotorExecutor(dry_run=True)
+
+        actions = [
+            MotorAction(app="Notes", action=ActionType.OPEN_APP, os=OSType.MAC),
+            MotorAction(
+                app="Notes",
+                action=ActionType.TYPE_TEXT,
+                text="needs approval",
+                critical=True,
+                os=OSType.MAC,
+            ),
+            MotorAction(app="Notes", action=ActionType.TYPE_TEXT, text="never", os=OSType.MAC),
+        ]
+
+        result = await executor.execute_batch(actions)
+        assert result.is_success()
+        assert [r.status for r in result.data] == ["SUCCESS", "BLOCKED"]
+        assert result.data[1].trace_id in executor.pending_confirmations
+
     @pytest.mark.asyncio
     async def test_dry_run_no_side_effects(self):
         """Test that dry-run has no side effects."""
@@ -163,3 +187,116 @@ class TestMotorExecutorIntegration:
         # In dry-run, no actual typing happens
         motor_result = result.data
         assert motor_result is not None
+
+
+class TestPendingConfirmations:
+    """Test expiry of pending confirmations."""
+
+    def _action(self) -> MotorAction:
+        return MotorAction(app="Terminal", action=ActionType.TYPE_TEXT, text="x", critical=True)
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test stale confirmations are dropped."""
+        from neura.motor import executor as executor_module
+
+        now = [1000.0]
+        monkeypatch.setattr(executor_module.time, "monotonic", lambda: now[0])
+
+        pending = executor_module._PendingConfirmations(ttl=300)
+        pending["a"] = self._action()
+        now[0] += 200
+        pending["b"] = self._action()
+        now[0] += 150
+
+        assert "a" not in pending
+        assert "b" in pending
+        assert len(pending) == 1
+
+    def test_reads_skip_expired_entries(self, monkeypatch):
+        """Test get, indexing and iteration never return expired confirmations."""
+        from neura.motor import executor as executor_module
+
+        now = [1000.0]
+        monkeypatch.setattr(executor_module.time, "monotonic", lambda: now[0])
+
+        pending = executor_module._PendingConfirmations(ttl=300)
+        pending["a"] = self._action()
+        now[0] += 301
+
+        assert pending.get("a") is None
+        with pytest.raises(KeyError):
+            pending["a"]
+        assert list(pending) == []
+        assert list(pending.items()) == []
+
+    def test_dict_mutators_keep_expiries_in_sync(self, monkeypatch):
+        """Test inherited dict mutators go through the TTL bookkeeping."""
+        from neura.motor import executor as executor_module
+
+        now = [1000.0]
+        monkeypatch.setattr(executor_module.time, "monotonic", lambda: now[0])
+
+        pending = executor_module._PendingConfirmations(ttl=300)
+        pending.update(a=self._action())
+        assert pending.setdefault("b", self._action()).app == "Terminal"
+        del pending["b"]
+        now[0] += 301
+
+        assert pending.copy() == {}
+        with pytest.raises(KeyError):
+            pending.popitem()
+        assert pending._expires == {}
+
+    def test_maxsize_evicts_oldest(self):
+        """Test the oldest confirmation is evicted when full."""
+        from neura.motor.executor import _PendingConfirmations
+
+        pending = _PendingConfirmations(maxsize=2)
+        for key in ("a", "b", "c"):
+            pending[key] = self._action()
+
+        assert "a" not in pending
+        assert pending.pop("c").app == "Terminal"
+        assert len(pending) == 1
+
+
+class TestAppIsFrontmost:
+    """Tests for the open_app readiness check on Linux."""
+
+    _WMCTRL_LX = (
+        b"0x04000007  0 gnome-terminal-server.Gnome-terminal  host  notes on gedit\n"
+        b"0x05000003  0 code.Code  host  main.py - Visual Studio Code\n"
+    )
+
+    @pytest.fixture
+    def executor(self):
+        """Create executor in dry-run mode."""
+        return MotorExecutor(dry_run=True)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("app", "expected"), [("code", True), ("gedit", False)])
+    async def test_matches_wm_class_only(self, executor, monkeypatch, app, expected):
+        """Test the app is matched on WM_CLASS, not anywhere in the window title."""
+        from neura.motor import executor as executor_module
+
+        async def fake_run(*argv, timeout=10):
+            assert argv == ("/usr/bin/wmctrl", "-lx")
+            return 0, self._WMCTRL_LX, b""
+
+        monkeypatch.setattr(executor_module, "_WMCTRL", "/usr/bin/wmctrl")
+        monkeypatch.setattr(executor_module, "_run_command", fake_run)
+
+        action = MotorAction(app=app, action=ActionType.OPEN_APP, os=OSType.LINUX)
+        assert await executor._app_is_frontmost(action) is expected
+
+    @pytest.mark.asyncio
+    async def test_no_wmctrl_skips_polling(self, executor, monkeypatch):
+        """Test a missing wmctrl is not spawned on every poll."""
+        from neura.motor import executor as executor_module
+
+        monkeypatch.setattr(executor_module, "_WMCTRL", None)
+        monkeypatch.setattr(executor_module, "_run_command", AsyncMock(side_effect=OSError))
+
+        action = MotorAction(app="code", action=ActionType.OPEN_APP, os=OSType.LINUX)
+        assert await executor._app_is_frontmost(action) is False
+        executor_module._run_command.assert_not_awaited()
@@ -3,7 +3,9 @@ Tests for policy engine.
 """
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from neura.motor.types import ActionType, MotorAction, OSType
@@ -28,6 +30,17 @@ class TestPolicyEngine:
         available = engine._check_opa_available()
         assert isinstance(available, bool)
 
+    def test_rego_lookup_cached(self, tmp_path):
+        """Test rego file discovery happens once at init."""
+        engine = PolicyEngine(rules_dir=tmp_path)
+        assert engine._rego_exists is False
+
+        (tmp_path / "motor_safe_actions.rego").write_text("package neura.motor\n")
+        assert engine._rego_exists is False
+
+        engine.reload_rules()
+        assert engine._rego_exists is True
+
     def test_scrub_text_none(self, engine):
         """Test scrubbing None text."""
         result = engine._scrub_text(None)
@@ -125,6 +138,26 @@ class TestPolicyEngine:
         assert decision.allowed is True
         assert decision.policy_id == "fallback_rules"
 
+    @pytest.mark.asyncio
+    async def test_fallback_blocked_patterns(self, engine):
+        """Test fallback blocks the same patterns as the Rego policy."""
+        input_data = {
+            "app": "Terminal",
+            "action": "type_text",
+            "text": "sudo cat /etc/passwd",
+            "critical": False,
+            "user_approved": False,
+            "os": "mac",
+        }
+
+        result = await engine._evaluate_fallback(input_data)
+        decision = result.data
+        assert decision.allowed is False
+        assert decision.violations == [
+            "Text contains blocked pattern: sudo ",
+            "Text contains blocked pattern: /etc/",
+        ]
+
     @pytest.mark.asyncio
     async def test_fallback_with_empty_text(self, engine):
         """Test fallback with empty text."""
@@ -140,6 +173,91 @@ class TestPolicyEngine:
         result = await engine._evaluate_fallback(input_data)
         assert result.is_success()
 
+    @pytest.mark.asyncio
+    async def test_opa_server_evaluation(self, engine):
+        """Test evaluation through the OPA server HTTP API."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/data/neura/motor"
+            return httpx.Response(
+                200, json={"result": {"allow": False, "reason": "nope", "violations": ["x"]}}
+            )
+
+        engine._client = httpx.AsyncClient(
+            base_url="http://opa.test", transport=httpx.MockTransport(handler)
+        )
+        result = await engine._evaluate_opa({"app": "Notes", "action": "click"})
+        await engine.aclose()
+
+        assert result.is_success()
+        assert result.data.allowed is False
+        assert result.data.policy_id == "motor_safe_actions"
+        assert result.data.violations == ["x"]
+        assert engine._client is None
+
+    @pytest.mark.asyncio
+    async def test_opa_server_rejects_foreign_responder(self, engine, monkeypatch):
+        """Test a server that does not echo our instance label is not used."""
+        process = MagicMock()
+        process.poll.return_value = None
+        monkeypatch.setattr("neura.policy.engine.subprocess.Popen", lambda *a, **kw: process)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/config"
+            return httpx.Response(200, json={"result": {"labels": {"id": "someone-else"}}})
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            "neura.policy.engine.httpx.AsyncClient",
+            lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+        )
+
+        engine.opa_available = True
+        await engine.start()
+        await engine.start()
+
+        assert engine._client is None
+        assert engine._opa_process is None
+        process.terminate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fast_path_allows_common_case(self, engine):
+        """Test whitelisted, non-critical actions skip full evaluation."""
+        action = MotorAction(
+            app="Notes", action=ActionType.TYPE_TEXT, text="Hello", os=OSType.MAC
+        )
+
+        result = await engine.validate(action)
+
+        assert result.data.allowed is True
+        assert result.data.policy_id == "fast_path_v1"
+        assert engine.fast_path_hits == 1
+        assert engine.fast_path_hit_rate == 1.0
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"critical": True},
+            {"app": "Safari"},
+            {"os": "unknown"},
+            {"text": "sudo reboot"},
+            {"text": "x" * 200},
+        ],
+    )
+    def test_fast_path_escalates_edge_cases(self, engine, overrides):
+        """Test anything outside the common case falls through."""
+        input_data = {
+            "app": "Notes",
+            "action": "type_text",
+            "text": "Hello",
+            "critical": False,
+            "user_approved": False,
+            "os": "mac",
+            **overrides,
+        }
+
+        assert engine._fast_path(input_data) is None
+
 
 class TestPolicyEngineIntegration:
     """Integration tests for policy engine."""
@@ -177,6 +295,26 @@ class TestPolicyEngineIntegration:
             result = await engine.validate(action)
             assert result.is_success()
 
+    @pytest.mark.asyncio
+    async def test_validate_batch_fallback(self):
+        """Test batch validation stops at the first denied action."""
+        engine = PolicyEngine()
+        engine.opa_available = False
+
+        actions = [
+            MotorAction(app="Notes", action=ActionType.OPEN_APP, os=OSType.MAC),
+            MotorAction(app="Safari", action=ActionType.OPEN_APP, os=OSType.MAC),
+        ]
+
+        result = await engine.validate_batch(actions)
+        assert result.is_success()
+        decision = result.data
+        assert decision.allowed is False
+        assert decision.violations == ["actions[1]: App 'Safari' not in whitelist"]
+
+        result = await engine.validate_batch(actions[:1])
+        assert result.data.allowed is True
+
     @pytest.mark.asyncio
     async def test_critical_action(self):
         """Test validating a critical action."""
@@ -0,0 +1,95 @@
+"""Tests for adaptive poll schedules."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from neura.setup import wizard
+from neura.setup.poll_schedule import load_ready_times, record_ready_time, schedule
+
+
+class TestSchedule:
+    """Tests for schedule()."""
+
+    def test_uniform_without_history(self):
+        """Test no history gives evenly spaced polls."""
+        assert schedule([], 2.0, 4) == pytest.approx([0.5, 1.0, 1.5, 2.0])
+
+    def test_polls_concentrate_on_common_ready_times(self):
+        """Test fast historical ready-times pull early polls forward."""
+        times = schedule([0.05] * 40, 2.0, 5)
+
+        assert times[-1] == 2.0
+        assert times == sorted(times)
+        assert times[0] < 0.1
+
+    def test_single_poll(self):
+        """Test k=1 polls only at the upper bound."""
+        assert schedule([0.3], 2.0, 1) == [2.0]
+
+
+class TestReadyTimes:
+    """Tests for ready-time persistence."""
+
+    def test_record_and_load(self, tmp_path):
+        """Test samples round-trip and are capped."""
+        path = tmp_path / "state" / "ready_times.json"
+
+        for i in range(60):
+            record_ready_time("ollama", i / 100, path=path)
+
+        samples = load_ready_times("ollama", path=path)
+        assert len(samples) == 50
+        assert samples[-1] == 0.59
+        assert load_ready_times("api", path=path) == []
+
+    @pytest.mark.parametrize("content", ["[1, 2]", '{"ollama": 3}', '"text"'])
+    def test_record_over_corrupt_state(self, tmp_path, content):
+        """Test valid JSON of the wrong shape is replaced instead of raising."""
+        path = tmp_path / "ready_times.json"
+        path.write_text(content)
+        assert load_ready_times("ollama", path=path) == []
+
+        record_ready_time("ollama", 0.25, path=path)
+
+        assert load_ready_times("ollama", path=path) == [0.25]
+
+    def test_load_missing_file(self, tmp_path):
+        """Test a missing state file yields no samples."""
+        assert load_ready_times("ollama", path=tmp_path / "missing.json") == []
+
+
+class TestCheckOllama:
+    """Tests for the wizard's Ollama readiness check."""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, monkeypatch, tmp_path):
+        """Reset the answer cache and keep ready-times in a temp file."""
+        path = tmp_path / "ready_times.json"
+        monkeypatch.setattr(wizard, "_ollama_cache", None)
+        monkeypatch.setattr(wizard, "load_ready_times", lambda name: load_ready_times(name, path))
+        monkeypatch.setattr(
+            wizard, "record_ready_time", lambda name, s: record_ready_time(name, s, path)
+        )
+        return path
+
+    @pytest.mark.asyncio
+    async def test_already_ready_detected_without_sleep(self, monkeypatch, isolated):
+        """Test a running Ollama is seen by the first probe, before any sleep."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(wizard.asyncio, "sleep", sleep)
+        monkeypatch.setattr(wizard, "_probe_ollama", AsyncMock(return_value=True))
+
+        assert await wizard.check_ollama() is True
+        sleep.assert_not_awaited()
+        assert load_ready_times("ollama", isolated) == [0.0]
+
+    @pytest.mark.asyncio
+    async def test_records_midpoint_between_probes(self, monkeypatch, isolated):
+        """Test the recorded ready-time lies between the failed and successful probe."""
+        monkeypatch.setattr(wizard, "_probe_ollama", AsyncMock(side_effect=[False, True]))
+
+        assert await wizard.check_ollama(budget=0.2) is True
+
+        [sample] = load_ready_times("ollama", isolated)
+        assert 0.0 < sample < 0.1
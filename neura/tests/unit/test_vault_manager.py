@@ -0,0 +1,72 @@
+"""
+Unit tests for Vault manager.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from neura.vault.manager import VaultManager
+
+
+class TestStoreCalls:
+    """Test the gate between concurrent store calls and close."""
+
+    @pytest.fixture
+    def manager(self, tmp_path) -> VaultManager:
+        """Create a manager with a cheap KDF."""
+        return VaultManager(
+            db_path=str(tmp_path / "secrets.db"),
+            argon2_memory=8,
+            argon2_iterations=1,
+            argon2_parallelism=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_exclusive_call_waits_for_in_flight_calls(self, manager: VaultManager) -> None:
+        """Test close does not run until running reads have returned."""
+        release = threading.Event()
+        order: list[str] = []
+
+        def slow_read() -> str:
+            release.wait(timeout=5)
+            order.append("read")
+            return "value"
+
+        read = asyncio.create_task(manager._store_call(slow_read))
+        await asyncio.sleep(0.01)
+        close = asyncio.create_task(manager._store_call(order.append, "close", exclusive=True))
+        await asyncio.sleep(0.01)
+        # A call issued while close is waiting runs after it
+        late = asyncio.create_task(manager._store_call(order.append, "late"))
+        await asyncio.sleep(0.01)
+
+        assert order == []
+        release.set()
+        assert await read == "value"
+        await asyncio.gather(close, late)
+
+        assert order == ["read", "close", "late"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_call_in_flight(self, manager: VaultManager) -> None:
+        """Test a cancelled caller does not let close run under its worker thread."""
+        release = threading.Event()
+        order: list[str] = []
+
+        def slow_read() -> None:
+            release.wait(timeout=5)
+            order.append("read")
+
+        read = asyncio.create_task(manager._store_call(slow_read))
+        await asyncio.sleep(0.01)
+        read.cancel()
+        close = asyncio.create_task(manager._store_call(order.append, "close", exclusive=True))
+        await asyncio.sleep(0.01)
+
+        assert order == []
+        release.set()
+        await close
+
+        assert order == ["read", "close"]
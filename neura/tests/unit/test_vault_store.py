@@ -38,7 +38,7 @@ class TestVaultStore:
         
         # Mock cursor for PRAGMA and SELECT queries
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (0,)  # Return tuple for SELECT 1
+        mock_cursor.fetchone.return_value = None  # Fresh vault: no metadata rows
         mock_conn.execute.return_value = mock_cursor
         mock_conn.cursor.return_value = mock_cursor
 
@@ -84,30 +84,21 @@ class TestVaultStore:
         vault_store._crypto = VaultCrypto(test_key)
         vault_store._encryption_key = test_key
 
-        # Encrypt the test value to get proper encrypted format
-        from neura.vault.crypto import VaultCrypto
-        crypto = VaultCrypto(test_key)
-        encrypt_result = crypto.encrypt(b"secret_value", test_key)
-        nonce, ciphertext = encrypt_result.data
-        value_encrypted = nonce + ciphertext
-
-        # Mock fetchone to return None (secret doesn't exist), then return the stored secret
+        # Mock the columns returned by the upsert
         mock_row = {
-            "name": "api_key",
-            "value_encrypted": value_encrypted,
-            "metadata": "{}",
-            "created_at": "2025-10-18T00:00:00",
-            "updated_at": "2025-10-18T00:00:00",
+            "created_at": 1760745600,
             "accessed_at": None,
             "access_count": 0,
         }
-        mock_conn.execute.return_value.fetchone.side_effect = [None, mock_row]
+        mock_conn.execute.return_value.fetchone.return_value = mock_row
 
         result = vault_store.put_secret("api_key", "secret_value")
 
         assert result.is_success()
         entry = result.data
         assert entry.name == "api_key"
+        assert entry.value.get_secret_value() == "secret_value"
+        mock_conn.commit.assert_called_once()
 
     @patch("neura.vault.store.sqlite3.connect")
     def test_put_secret_locked_vault(
@@ -147,8 +138,8 @@ class TestVaultStore:
             "name": "api_key",
             "value_encrypted": value_encrypted,
             "metadata": '{"description": "Test key"}',
-            "created_at": "2025-10-18T00:00:00",
-            "updated_at": "2025-10-18T00:00:00",
+            "created_at": 1760745600,
+            "updated_at": 1760745600,
             "accessed_at": None,
             "access_count": 0,
         }
@@ -195,7 +186,7 @@ class TestVaultStore:
         vault_store._is_open = True
 
         # Mock secrets
-        mock_rows = [{"name": "key1"}, {"name": "key2"}, {"name": "key3"}]
+        mock_rows = [("key1",), ("key2",), ("key3",)]
         mock_conn.execute.return_value.fetchall.return_value = mock_rows
 
         result = vault_store.list_secrets()
@@ -272,3 +263,155 @@ class TestVaultStore:
 
         count = vault_store.count_secrets()
         assert count == 5
+
+    def test_nonce_counter_survives_reopen(
+        self, vault_store: VaultStore, test_key: bytes
+    ) -> None:
+        """Test nonces are unique and the counter continues after reopening."""
+        assert vault_store.open(test_key).is_success()
+        vault_store.put_secret("a", "1")
+        vault_store.put_secret("b", "2")
+
+        rows = vault_store._conn.execute("SELECT value_encrypted FROM secrets").fetchall()
+        nonces = {row["value_encrypted"][:12] for row in rows}
+        assert len(nonces) == 2
+        first_counters = {int.from_bytes(n[4:], "big") for n in nonces}
+        vault_store.close()
+
+        assert vault_store.open(test_key).is_success()
+        nonce = vault_store._next_nonce()
+        assert int.from_bytes(nonce[4:], "big") > max(first_counters)
+        assert vault_store.get_secret("a").data.value.get_secret_value() == "1"
+        vault_store.close()
+
+    def test_put_secret_update_keeps_created_at(
+        self, vault_store: VaultStore, test_key: bytes
+    ) -> None:
+        """Test updating a secret keeps its creation time and access stats."""
+        assert vault_store.open(test_key).is_success()
+        first = vault_store.put_secret("a", "1").data
+        vault_store.get_secret("a")
+
+        updated = vault_store.put_secret("a", "2").data
+
+        assert updated.metadata.created_at == first.metadata.created_at
+        assert updated.metadata.access_count == 1
+        assert vault_store.get_secret("a").data.value.get_secret_value() == "2"
+        vault_store.close()
+
+    def test_put_secrets_bulk(self, vault_store: VaultStore, test_key: bytes) -> None:
+        """Test storing several secrets in one transaction."""
+        assert vault_store.open(test_key).is_success()
+
+        result = vault_store.put_secrets([("a", "1", None), ("b", "2", {"tags": ["x"]})])
+
+        assert result.is_success()
+        assert result.data == 2
+        assert vault_store.count_secrets() == 2
+        assert vault_store.list_secrets().data == ["a", "b"]
+        assert vault_store.get_secret("a").data.value.get_secret_value() == "1"
+        assert vault_store.get_secret("b").data.metadata.tags == ["x"]
+        vault_store.close()
+
+    def test_old_table_migrated(self, vault_store: VaultStore, test_key: bytes) -> None:
+        """Test an older secrets table is rebuilt and its timestamps converted on open."""
+        import sqlite3
+        from datetime import UTC, datetime
+
+        assert vault_store.open(test_key).is_success()
+        vault_store.put_secret("a", "1")
+        vault_store.close()
+
+        # Rewrite the table the way older releases laid it out
+        conn = sqlite3.connect(vault_store.db_path)
+        conn.executescript(
+            """
+            CREATE TABLE old AS SELECT * FROM secrets;
+            DROP TABLE secrets;
+            CREATE TABLE secrets (
+                name TEXT PRIMARY KEY, value_encrypted BLOB NOT NULL,
+                metadata TEXT NOT NULL, created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL, accessed_at TEXT, access_count INTEGER DEFAULT 0
+            );
+            INSERT INTO secrets SELECT name, value_encrypted, metadata,
+                '2025-10-18T00:00:00.123456', '2025-10-18T00:00:00', NULL, 0 FROM old;
+            DROP TABLE old;
+            CREATE INDEX idx_secrets_created ON secrets(created_at);
+            """
+        )
+        conn.close()
+
+        assert vault_store.open(test_key).is_success()
+        entry = vault_store.get_secret("a").data
+        assert entry.value.get_secret_value() == "1"
+        assert entry.metadata.created_at == datetime(2025, 10, 18, tzinfo=UTC)
+        vault_store.close()
+
+        conn = sqlite3.connect(vault_store.db_path)
+        schema = [row[0] for row in conn.execute("SELECT sql FROM sqlite_master")]
+        conn.close()
+        assert not any("idx_secrets_created" in (sql or "") for sql in schema)
+        assert any("WITHOUT ROWID" in (sql or "") for sql in schema)
+
+    def test_close_erases_key(self, vault_store: VaultStore, test_key: bytes) -> None:
+        """Test closing overwrites the store's copy of the key in place."""
+        assert vault_store.open(test_key).is_success()
+        key_buffer = vault_store._encryption_key
+
+        vault_store.close()
+
+        assert key_buffer == bytearray(32)
+        assert vault_store._encryption_key is None
+
+    def test_open_wrong_key_rejected(self, vault_store: VaultStore, test_key: bytes) -> None:
+        """Test a key other than the vault's is rejected at open."""
+        assert vault_store.open(test_key).is_success()
+        vault_store.put_secret("a", "1")
+        vault_store.close()
+
+        result = vault_store.open(os.urandom(32))
+
+        assert result.is_failure()
+        assert "invalid password" in result.error.lower()
+        assert not vault_store.is_open()
+        assert vault_store.open(test_key).is_success()
+        vault_store.close()
+
+    def test_access_stats_flushed_on_close(
+        self, vault_store: VaultStore, test_key: bytes
+    ) -> None:
+        """Test reads are counted in memory and written when the store closes."""
+        assert vault_store.open(test_key).is_success()
+        vault_store.put_secret("a", "1")
+        vault_store.get_secret("a")
+        assert vault_store.get_secret("a").data.metadata.access_count == 2
+
+        row = vault_store._conn.execute("SELECT access_count FROM secrets").fetchone()
+        assert row["access_count"] == 0
+        vault_store.close()
+
+        assert vault_store.open(test_key).is_success()
+        row = vault_store._conn.execute("SELECT access_count FROM secrets").fetchone()
+        assert row["access_count"] == 2
+        vault_store.close()
+
+    def test_get_secret_cached_until_write(
+        self, vault_store: VaultStore, test_key: bytes
+    ) -> None:
+        """Test repeat reads skip decryption until the secret changes."""
+        assert vault_store.open(test_key).is_success()
+        vault_store.put_secret("a", "1")
+
+        with patch.object(
+            vault_store._crypto, "decrypt", wraps=vault_store._crypto.decrypt
+        ) as mock_decrypt:
+            vault_store.get_secret("a")
+            vault_store.get_secret("a")
+            assert mock_decrypt.call_count == 1
+
+            vault_store.put_secret("a", "2")
+            assert vault_store.get_secret("a").data.value.get_secret_value() == "2"
+            assert mock_decrypt.call_count == 2
+
+        vault_store.close()
+        assert not vault_store._cache
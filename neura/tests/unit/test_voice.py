@@ -4,12 +4,15 @@ Unit tests for Voice module.
 Tests VAD, command parsing, and voice operations.
 """
 
+import json
+
 import pytest
 import numpy as np
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from neura.voice.vad import SimpleVAD
 from neura.voice.commands import VoiceCommandParser
+from neura.voice.nlp import NaturalLanguageParser
 from neura.voice.types import VoiceConfig, VoiceMode, SynthesisRequest
 
 
@@ -108,6 +111,26 @@ class TestVoiceCommandParser:
         # Should match vault unlock intent
         assert "vault" in cmd.raw.lower()
     
+    @pytest.mark.asyncio
+    async def test_parse_longest_intent_wins(self):
+        """Test a longer intent is preferred over a shorter one it starts with."""
+        parser = VoiceCommandParser()
+        
+        cmd = await parser.parse("search google python tutorials")
+        
+        assert cmd.raw == "/applescript safari google python tutorials"
+    
+    @pytest.mark.asyncio
+    async def test_parse_strips_fillers(self):
+        """Test stacked fillers and typographic apostrophes are handled."""
+        parser = VoiceCommandParser()
+        
+        cmd = await parser.parse("hey neura, could you please  show status")
+        assert cmd.name == "status"
+        
+        cmd = await parser.parse("neura, s\u2019il te plaît liste les fichiers")
+        assert cmd.raw == "/applescript finder list"
+    
     @pytest.mark.asyncio
     async def test_parse_question(self):
         """Test question parsing."""
@@ -160,6 +183,82 @@ class TestVoiceCommandParser:
         assert intents["help"] == "/help"
 
 
+class TestNaturalLanguageParser:
+    """Tests for NaturalLanguageParser keyword fallback."""
+    
+    @pytest.mark.parametrize(
+        "text, action",
+        [
+            ("Check my emails", "list_emails"),
+            ("how much power is left", "get_battery"),
+            ("open the downloads folder", "open_folder"),
+            ("show files", "list_files"),
+            ("any meeting today", "list_calendar"),
+        ],
+    )
+    def test_keyword_fallback(self, text, action):
+        """Test keyword groups map to the expected intents."""
+        parser = NaturalLanguageParser()
+        
+        result = parser._keyword_fallback(text)
+        
+        assert result.is_success()
+        assert result.data.action == action
+    
+    @pytest.mark.asyncio
+    async def test_parse_reuses_client(self):
+        """Test one Cortex client is kept across parses and closed on aclose."""
+        parser = NaturalLanguageParser()
+        response = Mock(status_code=200)
+        response.content = json.dumps({
+            "text": '{"action": "get_battery", "category": "system", '
+            '"parameters": {}, "confidence": 0.9}'
+        }).encode()
+        
+        with patch("neura.voice.nlp.httpx.AsyncClient") as mock_client_cls:
+            client = mock_client_cls.return_value
+            client.post = AsyncMock(return_value=response)
+            client.aclose = AsyncMock()
+            
+            first = await parser.parse("battery?")
+            second = await parser.parse("what's my battery at?")
+            await parser.aclose()
+        
+        assert first.data.action == second.data.action == "get_battery"
+        mock_client_cls.assert_called_once()
+        assert client.post.await_count == 2
+        client.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_parse_cached_for_repeat_text(self):
+        """Test confident parses are reused for the same normalized text."""
+        parser = NaturalLanguageParser()
+        response = Mock(status_code=200)
+        response.content = json.dumps({
+            "text": 'Sure: {"action": "list_emails", "category": "mail", '
+            '"parameters": {}, "confidence": 0.95}'
+        }).encode()
+        
+        with patch("neura.voice.nlp.httpx.AsyncClient") as mock_client_cls:
+            client = mock_client_cls.return_value
+            client.post = AsyncMock(return_value=response)
+            
+            first = await parser.parse("Check my emails?")
+            first.data.parameters["mutated"] = True
+            second = await parser.parse("  check my emails ")
+        
+        assert client.post.await_count == 1
+        assert second.data.action == "list_emails"
+        assert second.data.parameters == {}
+    
+    def test_keyword_fallback_unknown(self):
+        """Test mail without a read verb and unrelated text are not matched."""
+        parser = NaturalLanguageParser()
+        
+        assert parser._keyword_fallback("my emails").is_failure()
+        assert parser._keyword_fallback("hello there").is_failure()
+
+
 class TestVoiceConfig:
     """Tests for VoiceConfig."""
     
@@ -2,8 +2,11 @@
 Tests for WHY Journal query and analysis.
 """
 
+import asyncio
 import json
 import tempfile
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -371,3 +374,70 @@ class TestWHYJournalIntegration:
         # Limited results
         limited = journal.query(limit=2)
         assert len(limited) == 2
+
+
+class TestWHYJournalWriter:
+    """Test the background WHY Journal writer."""
+
+    @pytest.mark.asyncio
+    async def test_entries_queued_and_flushed_on_stop(self, tmp_path, monkeypatch):
+        """Test entries are queued while the writer runs and flushed on stop."""
+        from neura.core import why_journal
+
+        journal_path = tmp_path / "why_journal.jsonl"
+        monkeypatch.setattr(why_journal, "_JOURNAL_PATH", journal_path)
+
+        await why_journal.start_journal_writer()
+        for i in range(5):
+            why_journal.log_action("motor", "type", f"text {i}", "PASS", False, "SUCCESS")
+        await why_journal.stop_journal_writer()
+
+        lines = journal_path.read_text().splitlines()
+        assert [json.loads(line)["input_summary"] for line in lines] == [
+            f"text {i}" for i in range(5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stop_keeps_order_with_batch_in_flight(self, tmp_path, monkeypatch):
+        """Test entries logged while the writer stops land after its in-flight batch."""
+        from neura.core import why_journal
+
+        journal_path = tmp_path / "why_journal.jsonl"
+        monkeypatch.setattr(why_journal, "_JOURNAL_PATH", journal_path)
+
+        # Hold the first batch in its worker thread for a moment
+        write_entries = why_journal._write_entries
+        first = threading.Event()
+
+        def slow_write(entries, sync=False):
+            if not first.is_set():
+                first.set()
+                time.sleep(0.05)
+            write_entries(entries, sync)
+
+        monkeypatch.setattr(why_journal, "_write_entries", slow_write)
+
+        await why_journal.start_journal_writer()
+        for i in range(3):
+            why_journal.log_action("motor", "type", f"text {i}", "PASS", False, "SUCCESS")
+        while not first.is_set():
+            await asyncio.sleep(0.001)
+        stop = asyncio.create_task(why_journal.stop_journal_writer())
+        await asyncio.sleep(0)
+        for i in range(3, 6):
+            why_journal.log_action("motor", "type", f"text {i}", "PASS", False, "SUCCESS")
+        await stop
+
+        lines = journal_path.read_text().splitlines()
+        assert [json.loads(line)["input_summary"] for line in lines] == [
+            f"text {i}" for i in range(6)
+        ]
+        assert why_journal._journal_file is None
+
+    def test_new_trace_id_unique(self):
+        """Test trace ids share a process prefix and never repeat."""
+        from neura.core.why_journal import new_trace_id
+
+        ids = [new_trace_id() for _ in range(100)]
+        assert len(set(ids)) == 100
+        assert len({trace_id.split("-")[0] for trace_id in ids}) == 1